@@ -0,0 +1,77 @@
+"""Cold-start guard for ``import distfxn.specs``.
+
+Each repeat runs a fresh interpreter, so nothing is cached in ``sys.modules``. The
+script fails when the median import time exceeds ``--max-ms``, or when a module
+listed in ``--forbid`` gets imported eagerly.
+
+    python benchmarks/import_time.py --repeats 20 --max-ms 50
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+DEFAULT_FORBIDDEN_MODULES = ("numpy", "pydantic", "marimo")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_import(module: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def run(
+    module: str,
+    repeats: int,
+    forbidden: tuple[str, ...] = DEFAULT_FORBIDDEN_MODULES,
+) -> dict:
+    samples = [measure_import(module) for _ in range(repeats)]
+    seconds = [sample["seconds"] for sample in samples]
+    loaded = set(samples[-1]["modules"])
+    return {
+        "module": module,
+        "repeats": repeats,
+        "min_ms": min(seconds) * 1e3,
+        "median_ms": statistics.median(seconds) * 1e3,
+        "max_ms": max(seconds) * 1e3,
+        "forbidden_loaded": sorted(name for name in forbidden if name in loaded),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="distfxn.specs")
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    parser.add_argument("--forbid", nargs="*", default=list(DEFAULT_FORBIDDEN_MODULES))
+    args = parser.parse_args(argv)
+
+    result = run(args.module, args.repeats, tuple(args.forbid))
+    print(json.dumps(result, indent=2))
+
+    failures = []
+    if result["forbidden_loaded"]:
+        failures.append(f"eagerly imported: {', '.join(result['forbidden_loaded'])}")
+    if args.max_ms is not None and result["median_ms"] > args.max_ms:
+        failures.append(f"median {result['median_ms']:.2f}ms exceeds {args.max_ms:.2f}ms")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
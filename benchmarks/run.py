@@ -0,0 +1,327 @@
+"""Benchmark suite for the hot paths in ``distfxn.specs``.
+
+    python benchmarks/run.py                          # quick profile, table to stdout
+    python benchmarks/run.py --profile full --json out.json
+    python benchmarks/run.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run.py --compare benchmarks/baseline.json --fail-on-regression
+
+Each benchmark is timed with ``timeit``: the loop count is scaled until one repeat takes
+at least ``--min-time`` seconds, and the per-call min and median over ``--repeats`` are
+reported. Benchmarks that sweep a size parameter (``sample_dist``,
+``sample_dist_parallel``, ``validate_output``, ``sample_specs``) also report ns per
+element, so the JSON doubles as scaling curves.
+Baselines are machine specific; record them on the machine you compare on.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from import_time import run as run_import_benchmark
+
+PROFILES = {
+    "quick": {
+        "sample_specs_counts": (1_000, 10_000, 100_000),
+        "sample_dist_counts": tuple(10**power for power in range(0, 7)),
+        "validate_counts": (10**3, 10**5, 10**6),
+        "parallel_count": 10**7,
+        "parallel_workers": (1, 2, 4),
+        "corpus_size": 200,
+    },
+    "full": {
+        "sample_specs_counts": (1_000, 10_000, 100_000, 1_000_000),
+        "sample_dist_counts": tuple(10**power for power in range(0, 9)),
+        "validate_counts": (10**3, 10**5, 10**6, 10**7, 10**8),
+        "parallel_count": 10**8,
+        "parallel_workers": (1, 2, 4, 8),
+        "corpus_size": 2_000,
+    },
+}
+
+
+@dataclass
+class Benchmark:
+    group: str
+    params: dict
+    # Returns the timed callable, or a context manager yielding it when the benchmark
+    # holds resources that must be released after timing.
+    setup: Callable[[], Callable[[], object] | AbstractContextManager[Callable[[], object]]]
+    elements: int | None = None
+    key: str = field(init=False)
+
+    def __post_init__(self):
+        rendered = ",".join(f"{name}={value}" for name, value in self.params.items())
+        self.key = f"{self.group}[{rendered}]"
+
+
+def _spec_classes():
+    from distfxn.specs import FAMILY_REGISTRY
+
+    return {family: FAMILY_REGISTRY.get(family) for family in FAMILY_REGISTRY.list_families()}
+
+
+def _default_spec(spec_cls):
+    return spec_cls.edge_specs()[-1]
+
+
+def iter_benchmarks(profile: dict) -> Iterator[Benchmark]:
+    from distfxn.specs import (
+        FAMILY_REGISTRY,
+        RenderCache,
+        render_to_callable,
+        run_render_equivalence_cases,
+        spec_payload,
+    )
+
+    spec_classes = _spec_classes()
+
+    for family, spec_cls in spec_classes.items():
+        for count in profile["sample_specs_counts"]:
+            yield Benchmark(
+                "sample_specs",
+                {"family": family, "count": count},
+                lambda spec_cls=spec_cls, count=count: (
+                    lambda rng=np.random.default_rng(0): spec_cls.sample_specs(rng, count=count)
+                ),
+                elements=count,
+            )
+
+    for family, spec_cls in spec_classes.items():
+        spec = _default_spec(spec_cls)
+        for count in profile["sample_dist_counts"]:
+            yield Benchmark(
+                "sample_dist",
+                {"family": family, "count": count},
+                lambda spec=spec, count=count: (
+                    lambda rng=np.random.default_rng(0): spec.sample_dist(rng, count)
+                ),
+                elements=count,
+            )
+
+    for family, spec_cls in spec_classes.items():
+        spec = _default_spec(spec_cls)
+        count = profile["parallel_count"]
+        for workers in profile["parallel_workers"]:
+
+            @contextmanager
+            def parallel_setup(spec=spec, count=count, workers=workers):
+                rng = np.random.default_rng(0)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    yield lambda: spec.sample_dist_parallel(
+                        rng, count, workers=workers, executor=executor
+                    )
+
+            yield Benchmark(
+                "sample_dist_parallel",
+                {"family": family, "count": count, "workers": workers},
+                parallel_setup,
+                elements=count,
+            )
+
+    for family, spec_cls in spec_classes.items():
+        spec = _default_spec(spec_cls)
+        for count in profile["validate_counts"]:
+
+            def setup(spec=spec, count=count):
+                output = spec.sample_dist(np.random.default_rng(0), count)
+                return lambda: spec.validate_output(output, count=count)
+
+            yield Benchmark(
+                "validate_output",
+                {"family": family, "count": count},
+                setup,
+                elements=count,
+            )
+
+    for family, spec_cls in spec_classes.items():
+        spec = _default_spec(spec_cls)
+        yield Benchmark(
+            "render_to_callable",
+            {"family": family, "cache": "none"},
+            lambda spec=spec: lambda: render_to_callable(spec, cache=None),
+        )
+
+        def cached_setup(spec=spec):
+            cache = RenderCache()
+            render_to_callable(spec, cache=cache)
+            return lambda: render_to_callable(spec, cache=cache)
+
+        yield Benchmark("render_to_callable", {"family": family, "cache": "warm"}, cached_setup)
+
+    for family, spec_cls in spec_classes.items():
+        payload = spec_payload(_default_spec(spec_cls))
+        yield Benchmark(
+            "registry_parse",
+            {"family": family},
+            lambda payload=payload: lambda: FAMILY_REGISTRY.parse(payload),
+        )
+
+    def corpus_jsonl():
+        rng = np.random.default_rng(0)
+        size = profile["corpus_size"]
+        specs = [
+            spec
+            for spec_cls in spec_classes.values()
+            for spec in spec_cls.sample_specs(rng, count=size)
+        ]
+        return "\n".join(json.dumps(spec_payload(spec)) for spec in specs).encode()
+
+    corpus_size = profile["corpus_size"] * len(spec_classes)
+    yield Benchmark(
+        "registry_parse_json_lines",
+        {"specs": corpus_size},
+        lambda: (lambda data=corpus_jsonl(): FAMILY_REGISTRY.parse_json_lines(data)),
+        elements=corpus_size,
+    )
+
+    for family, spec_cls in spec_classes.items():
+        spec = _default_spec(spec_cls)
+        yield Benchmark(
+            "run_render_equivalence_cases",
+            {"family": family},
+            lambda spec=spec: lambda: run_render_equivalence_cases(spec),
+        )
+
+
+def time_benchmark(benchmark: Benchmark, *, repeats: int, min_time: float) -> dict:
+    prepared = benchmark.setup()
+    if not isinstance(prepared, AbstractContextManager):
+        prepared = nullcontext(prepared)
+    with prepared as function:
+        timer = timeit.Timer(function)
+        number = 1
+        while True:
+            elapsed = timer.timeit(number)
+            if elapsed >= min_time or number >= 1 << 20:
+                break
+            number *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+        per_call = [elapsed / number] + [
+            seconds / number for seconds in timer.repeat(repeat=repeats - 1, number=number)
+        ]
+    result = {
+        "key": benchmark.key,
+        "group": benchmark.group,
+        "params": benchmark.params,
+        "number": number,
+        "repeats": repeats,
+        "seconds_min": min(per_call),
+        "seconds_median": statistics.median(per_call),
+    }
+    if benchmark.elements:
+        result["ns_per_element"] = result["seconds_min"] / benchmark.elements * 1e9
+    return result
+
+
+def time_import(module: str, *, repeats: int) -> dict:
+    measured = run_import_benchmark(module, repeats, forbidden=())
+    return {
+        "key": f"import[module={module}]",
+        "group": "import",
+        "params": {"module": module},
+        "number": 1,
+        "repeats": repeats,
+        "seconds_min": measured["min_ms"] / 1e3,
+        "seconds_median": measured["median_ms"] / 1e3,
+    }
+
+
+def environment() -> dict:
+    import pydantic
+
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pydantic": pydantic.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[dict]:
+    baseline_by_key = {entry["key"]: entry for entry in baseline["results"]}
+    comparisons = []
+    for result in results:
+        reference = baseline_by_key.get(result["key"])
+        if reference is None:
+            continue
+        ratio = result["seconds_median"] / reference["seconds_median"]
+        comparisons.append(
+            {
+                "key": result["key"],
+                "baseline_median": reference["seconds_median"],
+                "current_median": result["seconds_median"],
+                "ratio": ratio,
+                "regression": ratio > threshold,
+            }
+        )
+    return comparisons
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f}{unit}"
+    return f"{seconds / 1e-9:8.1f}ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose key contains this")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--json", type=Path, default=None, help="write results as JSON")
+    parser.add_argument("--save-baseline", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2, help="regression ratio")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    def report(result: dict) -> None:
+        results.append(result)
+        per_element = (
+            f"  {result['ns_per_element']:10.2f} ns/elem" if "ns_per_element" in result else ""
+        )
+        print(f"{result['key']:<64} {_format_seconds(result['seconds_median'])}{per_element}")
+
+    results = []
+    import_key = "import[module=distfxn.specs]"
+    if not args.filter or args.filter in import_key:
+        report(time_import("distfxn.specs", repeats=max(args.repeats, 5)))
+    for benchmark in iter_benchmarks(PROFILES[args.profile]):
+        if args.filter and args.filter not in benchmark.key:
+            continue
+        report(time_benchmark(benchmark, repeats=args.repeats, min_time=args.min_time))
+
+    document = {"profile": args.profile, "environment": environment(), "results": results}
+
+    exit_code = 0
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        comparisons = compare(results, baseline, args.threshold)
+        document["comparison"] = {"baseline": str(args.compare), "entries": comparisons}
+        print()
+        for entry in comparisons:
+            marker = "REGRESSION" if entry["regression"] else ""
+            print(f"{entry['key']:<64} x{entry['ratio']:6.2f} {marker}")
+        if args.fail_on_regression and any(entry["regression"] for entry in comparisons):
+            exit_code = 1
+
+    for destination in (args.json, args.save_baseline):
+        if destination is not None:
+            destination.write_text(json.dumps(document, indent=2) + "\n")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,185 @@
-from typing import Annotated
+from importlib import import_module
+from typing import TYPE_CHECKING, Annotated, Any
 
-from pydantic import Field
+if TYPE_CHECKING:
+    from .accumulators import AnalyticMoments, HistogramAccumulator, MomentAccumulator
+    from .archive import SpecArchive
+    from .async_verification import async_run_equivalence_cases, async_verify_many
+    from .base import BaseFunctionSpec
+    from .batch import BaseSpecBatch
+    from .bernoulli import BernoulliSamplingSpec, BernoulliSpec, BernoulliSpecBatch
+    from .canonical_cache import CanonicalCacheStats, CanonicalOutputCache
+    from .chunked_verification import run_chunked_equivalence_cases, verify_chunk_invariance
+    from .corpus import append_jsonl, iter_jsonl_specs, iter_verify, spec_payload, verify_many
+    from .equivalence_cases import EquivalenceCase, default_equivalence_cases
+    from .normal import NormalSamplingSpec, NormalSpec, NormalSpecBatch
+    from .fingerprint import intern_specs, spec_fingerprint
+    from .golden_digests import GoldenDigestStore, OutputDigest, output_digest
+    from .instrumentation import CaseTiming, VerificationHooks
+    from .isolated_pool import (
+        IsolatedExecutionError,
+        IsolatedWorkerPool,
+        WorkerCrashedError,
+        WorkerTimeoutError,
+    )
+    from .memmap_output import outputs_equal, run_memmap_equivalence_cases, sample_dist_to_memmap
+    from .output_checks import (
+        BlockwiseValidator,
+        CheckResult,
+        FiniteValuesCheck,
+        HistogramCheck,
+        InRangeCheck,
+        InSetCheck,
+        LengthCheck,
+        MomentCheck,
+        NumericDtypeCheck,
+        OneDimensionalCheck,
+        OutputCheck,
+        OutputCheckBase,
+        OutputVerificationReport,
+        default_output_checks,
+    )
+    from .param_sampling import (
+        LogUniformPositiveFloatParamSampler,
+        SamplingSpecError,
+        UniformFloatParamSampler,
+    )
+    from .registry import FAMILY_REGISTRY, FamilyRegistry
+    from .render_cache import RENDER_CACHE, RenderCache, RenderCacheStats
+    from .results_store import VerificationResultStore, render_candidate_id
+    from .sampling_server import RemoteCandidateSampler
+    from .statistical_verification import run_statistical_equivalence_cases
+    from .stats import chi_square_2samp, ks_2samp
+    from .uniform import UniformSamplingSpec, UniformSpec, UniformSpecBatch
+    from .verification import (
+        CaseVerificationReport,
+        CaseEquivalenceResult,
+        SpecVerificationReport,
+        SpecEquivalenceReport,
+        StatisticalTestResult,
+        assert_valid_output,
+        check_spec_equivalence,
+        render_to_callable,
+        run_equivalence_cases,
+        run_render_equivalence_cases,
+        verify_output,
+    )
+    from .verification_table import VerificationTable
 
-from .base import BaseFunctionSpec
-from .bernoulli import BernoulliSamplingSpec, BernoulliSpec
-from .equivalence_cases import EquivalenceCase, default_equivalence_cases
-from .normal import NormalSamplingSpec, NormalSpec
-from .output_checks import (
-    CheckResult,
-    FiniteValuesCheck,
-    InRangeCheck,
-    InSetCheck,
-    LengthCheck,
-    NumericDtypeCheck,
-    OneDimensionalCheck,
-    OutputCheck,
-    OutputCheckBase,
-    OutputVerificationReport,
-    default_output_checks,
-)
-from .param_sampling import (
-    LogUniformPositiveFloatParamSampler,
-    SamplingSpecError,
-    UniformFloatParamSampler,
-)
-from .registry import FAMILY_REGISTRY, FamilyRegistry
-from .uniform import UniformSamplingSpec, UniformSpec
-from .verification import (
-    CaseVerificationReport,
-    CaseEquivalenceResult,
-    SpecVerificationReport,
-    SpecEquivalenceReport,
-    assert_valid_output,
-    check_spec_equivalence,
-    render_to_callable,
-    run_equivalence_cases,
-    run_render_equivalence_cases,
-    verify_output,
-)
+    from pydantic import Field
 
-FunctionSpec = Annotated[
-    BernoulliSpec | UniformSpec | NormalSpec,
-    Field(discriminator="family"),
-]
+    FunctionSpec = Annotated[
+        BernoulliSpec | UniformSpec | NormalSpec,
+        Field(discriminator="family"),
+    ]
+
+# Public names resolve to their submodule on first access (PEP 562) and the built-in
+# families register lazily in FAMILY_REGISTRY, so `import distfxn.specs` stays cheap for
+# short-lived worker processes that only touch part of the API.
+_LAZY_ATTRS: dict[str, str] = {
+    "AnalyticMoments": "accumulators",
+    "HistogramAccumulator": "accumulators",
+    "MomentAccumulator": "accumulators",
+    "SpecArchive": "archive",
+    "async_run_equivalence_cases": "async_verification",
+    "async_verify_many": "async_verification",
+    "BaseFunctionSpec": "base",
+    "BaseSpecBatch": "batch",
+    "BernoulliSamplingSpec": "bernoulli",
+    "BernoulliSpec": "bernoulli",
+    "BernoulliSpecBatch": "bernoulli",
+    "CanonicalCacheStats": "canonical_cache",
+    "CanonicalOutputCache": "canonical_cache",
+    "run_chunked_equivalence_cases": "chunked_verification",
+    "verify_chunk_invariance": "chunked_verification",
+    "append_jsonl": "corpus",
+    "iter_jsonl_specs": "corpus",
+    "iter_verify": "corpus",
+    "spec_payload": "corpus",
+    "verify_many": "corpus",
+    "EquivalenceCase": "equivalence_cases",
+    "default_equivalence_cases": "equivalence_cases",
+    "NormalSamplingSpec": "normal",
+    "NormalSpec": "normal",
+    "NormalSpecBatch": "normal",
+    "intern_specs": "fingerprint",
+    "spec_fingerprint": "fingerprint",
+    "GoldenDigestStore": "golden_digests",
+    "OutputDigest": "golden_digests",
+    "output_digest": "golden_digests",
+    "CaseTiming": "instrumentation",
+    "VerificationHooks": "instrumentation",
+    "IsolatedExecutionError": "isolated_pool",
+    "IsolatedWorkerPool": "isolated_pool",
+    "WorkerCrashedError": "isolated_pool",
+    "WorkerTimeoutError": "isolated_pool",
+    "outputs_equal": "memmap_output",
+    "run_memmap_equivalence_cases": "memmap_output",
+    "sample_dist_to_memmap": "memmap_output",
+    "BlockwiseValidator": "output_checks",
+    "CheckResult": "output_checks",
+    "FiniteValuesCheck": "output_checks",
+    "HistogramCheck": "output_checks",
+    "InRangeCheck": "output_checks",
+    "InSetCheck": "output_checks",
+    "LengthCheck": "output_checks",
+    "MomentCheck": "output_checks",
+    "NumericDtypeCheck": "output_checks",
+    "OneDimensionalCheck": "output_checks",
+    "OutputCheck": "output_checks",
+    "OutputCheckBase": "output_checks",
+    "OutputVerificationReport": "output_checks",
+    "default_output_checks": "output_checks",
+    "LogUniformPositiveFloatParamSampler": "param_sampling",
+    "SamplingSpecError": "param_sampling",
+    "UniformFloatParamSampler": "param_sampling",
+    "FAMILY_REGISTRY": "registry",
+    "FamilyRegistry": "registry",
+    "RENDER_CACHE": "render_cache",
+    "RenderCache": "render_cache",
+    "RenderCacheStats": "render_cache",
+    "VerificationResultStore": "results_store",
+    "render_candidate_id": "results_store",
+    "RemoteCandidateSampler": "sampling_server",
+    "run_statistical_equivalence_cases": "statistical_verification",
+    "chi_square_2samp": "stats",
+    "ks_2samp": "stats",
+    "UniformSamplingSpec": "uniform",
+    "UniformSpec": "uniform",
+    "UniformSpecBatch": "uniform",
+    "CaseVerificationReport": "verification",
+    "CaseEquivalenceResult": "verification",
+    "SpecVerificationReport": "verification",
+    "SpecEquivalenceReport": "verification",
+    "StatisticalTestResult": "verification",
+    "assert_valid_output": "verification",
+    "check_spec_equivalence": "verification",
+    "render_to_callable": "verification",
+    "run_equivalence_cases": "verification",
+    "run_render_equivalence_cases": "verification",
+    "verify_output": "verification",
+    "VerificationTable": "verification_table",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "FunctionSpec":
+        from .registry import FAMILY_REGISTRY
+
+        value = FAMILY_REGISTRY.spec_union()
+    else:
+        try:
+            module_name = _LAZY_ATTRS[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
-for _spec_cls in (BernoulliSpec, UniformSpec, NormalSpec):
-    FAMILY_REGISTRY.register(_spec_cls)
-del _spec_cls
 
 __all__ = [
     "BaseFunctionSpec",
@@ -56,6 +189,11 @@ __all__ = [
     "UniformSamplingSpec",
     "NormalSpec",
     "NormalSamplingSpec",
+    "BaseSpecBatch",
+    "BernoulliSpecBatch",
+    "UniformSpecBatch",
+    "NormalSpecBatch",
+    "SpecArchive",
     "FunctionSpec",
     "FamilyRegistry",
     "FAMILY_REGISTRY",
@@ -65,17 +203,26 @@ __all__ = [
     "OutputCheck",
     "CheckResult",
     "OutputVerificationReport",
+    "BlockwiseValidator",
     "OneDimensionalCheck",
     "LengthCheck",
     "NumericDtypeCheck",
     "FiniteValuesCheck",
     "InSetCheck",
     "InRangeCheck",
+    "MomentCheck",
+    "HistogramCheck",
     "default_output_checks",
+    "AnalyticMoments",
+    "MomentAccumulator",
+    "HistogramAccumulator",
     "UniformFloatParamSampler",
     "LogUniformPositiveFloatParamSampler",
     "SamplingSpecError",
     "render_to_callable",
+    "RenderCache",
+    "RenderCacheStats",
+    "RENDER_CACHE",
     "check_spec_equivalence",
     "CaseVerificationReport",
     "CaseEquivalenceResult",
@@ -83,6 +230,39 @@ __all__ = [
     "SpecEquivalenceReport",
     "run_equivalence_cases",
     "run_render_equivalence_cases",
+    "VerificationHooks",
+    "CaseTiming",
+    "run_statistical_equivalence_cases",
+    "StatisticalTestResult",
+    "ks_2samp",
+    "chi_square_2samp",
+    "sample_dist_to_memmap",
+    "run_memmap_equivalence_cases",
+    "outputs_equal",
+    "run_chunked_equivalence_cases",
+    "verify_chunk_invariance",
+    "CanonicalOutputCache",
+    "CanonicalCacheStats",
+    "spec_fingerprint",
+    "intern_specs",
+    "GoldenDigestStore",
+    "OutputDigest",
+    "output_digest",
+    "spec_payload",
+    "verify_many",
+    "iter_verify",
+    "VerificationResultStore",
+    "render_candidate_id",
+    "async_run_equivalence_cases",
+    "async_verify_many",
+    "RemoteCandidateSampler",
+    "IsolatedWorkerPool",
+    "IsolatedExecutionError",
+    "WorkerTimeoutError",
+    "WorkerCrashedError",
+    "iter_jsonl_specs",
+    "append_jsonl",
     "verify_output",
+    "VerificationTable",
     "assert_valid_output",
 ]
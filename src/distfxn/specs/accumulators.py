@@ -0,0 +1,97 @@
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+_UPDATE_BLOCK_SIZE = 1 << 16
+
+
+class AnalyticMoments(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    mean: float
+    variance: float
+    fourth_central_moment: float
+
+
+class MomentAccumulator:
+    """Streaming count, mean, and sum of squared deviations (Welford/Chan).
+
+    ``update`` folds in a 1D chunk of any size using bounded temporaries; ``merge``
+    combines accumulators built over disjoint parts of one output, in any order.
+    """
+
+    __slots__ = ("count", "mean", "m2", "dtype")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.dtype: np.dtype | None = None
+
+    def update(self, values) -> "MomentAccumulator":
+        values = np.asarray(values).reshape(-1)
+        if self.dtype is None and values.size:
+            self.dtype = values.dtype
+        for start in range(0, values.shape[0], _UPDATE_BLOCK_SIZE):
+            block = values[start : start + _UPDATE_BLOCK_SIZE]
+            block_mean = float(block.mean(dtype=np.float64))
+            deviations = np.subtract(block, block_mean, dtype=np.float64)
+            self._combine(block.shape[0], block_mean, float(np.dot(deviations, deviations)))
+        return self
+
+    def merge(self, other: "MomentAccumulator") -> "MomentAccumulator":
+        if self.dtype is None:
+            self.dtype = other.dtype
+        self._combine(other.count, other.mean, other.m2)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Population variance (``ddof=0``) of the values seen so far."""
+        if self.count == 0:
+            raise ValueError("variance requires at least one value")
+        return self.m2 / self.count
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+
+class HistogramAccumulator:
+    """Streaming counts over fixed bins, for merging histograms across chunks and workers.
+
+    ``edges`` are the sorted interior bin edges; bin ``i`` holds values in
+    ``[edges[i - 1], edges[i])``, with the first and last bins unbounded, so there are
+    ``len(edges) + 1`` bins. NaN values land in the last bin.
+    """
+
+    __slots__ = ("edges", "counts")
+
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if self.edges.ndim != 1:
+            raise ValueError("edges must be 1D")
+        if np.any(np.diff(self.edges) <= 0):
+            raise ValueError("edges must be strictly increasing")
+        self.counts = np.zeros(self.edges.shape[0] + 1, dtype=np.int64)
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, values) -> "HistogramAccumulator":
+        values = np.asarray(values).reshape(-1)
+        for start in range(0, values.shape[0], _UPDATE_BLOCK_SIZE):
+            bins = np.searchsorted(self.edges, values[start : start + _UPDATE_BLOCK_SIZE], "right")
+            self.counts += np.bincount(bins, minlength=self.counts.shape[0])
+        return self
+
+    def merge(self, other: "HistogramAccumulator") -> "HistogramAccumulator":
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("cannot merge histograms with different bin edges")
+        self.counts += other.counts
+        return self
@@ -0,0 +1,168 @@
+import json
+import numbers
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from .base import BaseFunctionSpec
+from .batch import BaseSpecBatch
+from .registry import FAMILY_REGISTRY
+
+MANIFEST_NAME = "manifest.json"
+OUTPUTS_NAME = "outputs.npy"
+_ARCHIVE_FORMAT_VERSION = 1
+_BLOCK_BYTES = 64 << 20
+
+
+class SpecArchive:
+    """Directory of ``.npy`` parameter columns, optional row-aligned outputs, and a manifest.
+
+    ``write`` stores one family's spec batch as ``<field>.npy`` columns and, with
+    ``count``, an (N, count) ``outputs.npy`` whose row ``i`` is spec ``i``'s
+    ``sample_dist`` output under the ``sample_dist_batch`` seeding contract. Outputs are
+    sampled in row blocks straight into a memory-mapped file, so archives larger than
+    memory can be written. Opening an archive memory-maps every array read-only, so
+    slicing rows does not load or parse the rest.
+
+    Only parameter columns are stored. Specs with non-default ``output_dtype``,
+    ``output_checks`` or ``equivalence_cases`` cannot be archived: ``from_specs`` rejects
+    them when the batch is built, so every archived spec reads back unchanged.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.manifest = json.loads((self.path / MANIFEST_NAME).read_text())
+        if self.manifest.get("version") != _ARCHIVE_FORMAT_VERSION:
+            raise ValueError(f"unsupported spec archive version {self.manifest.get('version')!r}")
+        self.columns: dict[str, np.ndarray] = {
+            name: np.load(self.path / f"{name}.npy", mmap_mode="r")
+            for name in self.manifest["columns"]
+        }
+        outputs = self.manifest["outputs"]
+        self.outputs: np.ndarray | None = (
+            np.load(self.path / outputs["file"], mmap_mode="r") if outputs is not None else None
+        )
+
+    @classmethod
+    def write(
+        cls,
+        path: str | Path,
+        batch: BaseSpecBatch,
+        *,
+        count: int | None = None,
+        rng: np.random.Generator | int | None = None,
+        block_rows: int | None = None,
+        overwrite: bool = False,
+    ) -> "SpecArchive":
+        """Write ``batch`` (and, with ``count``, its sampled outputs) to directory ``path``.
+
+        ``rng`` may be a generator or an integer seed; a seed is recorded in the
+        manifest. The archive is assembled in a temporary sibling directory and renamed
+        into place, so readers never see a partial archive. With ``overwrite``, the old
+        archive is first renamed aside and removed only once the new one is in place;
+        between the two renames ``path`` briefly does not exist.
+        """
+        if count is not None:
+            if count <= 0:
+                raise ValueError("count must be greater than 0")
+            if rng is None:
+                raise ValueError("rng is required when count is provided")
+        if block_rows is not None and block_rows <= 0:
+            raise ValueError("block_rows must be greater than 0")
+        path = Path(path)
+        if path.exists() and not overwrite:
+            raise FileExistsError(f"spec archive {path} already exists")
+
+        staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        replaced = path.with_name(f".{path.name}.{os.getpid()}.old")
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.rmtree(replaced, ignore_errors=True)
+        staging.mkdir(parents=True)
+        try:
+            for name, column in batch.columns().items():
+                np.save(staging / f"{name}.npy", column)
+            outputs = None
+            if count is not None:
+                outputs = cls._write_outputs(
+                    staging / OUTPUTS_NAME,
+                    batch,
+                    count=count,
+                    rng=np.random.default_rng(rng),
+                    block_rows=block_rows,
+                )
+            manifest = {
+                "version": _ARCHIVE_FORMAT_VERSION,
+                "family": batch.family(),
+                "rows": len(batch),
+                "columns": list(batch.param_fields),
+                "outputs": outputs,
+                "seed": int(rng) if isinstance(rng, numbers.Integral) else None,
+                "numpy_version": np.__version__,
+            }
+            (staging / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + "\n")
+            if path.exists():
+                os.replace(path, replaced)
+            try:
+                os.replace(staging, path)
+            except BaseException:
+                if replaced.exists():
+                    os.replace(replaced, path)
+                raise
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        shutil.rmtree(replaced, ignore_errors=True)
+        return cls(path)
+
+    @staticmethod
+    def _write_outputs(
+        path: Path,
+        batch: BaseSpecBatch,
+        *,
+        count: int,
+        rng: np.random.Generator,
+        block_rows: int | None,
+    ) -> dict:
+        rows = len(batch)
+        # sample_dist_batch output dtypes are at most 8 bytes wide.
+        resolved_block_rows = block_rows or max(1, _BLOCK_BYTES // (count * 8))
+        block = np.asarray(batch[0:resolved_block_rows].sample_dist(rng, count))
+        outputs = np.lib.format.open_memmap(path, mode="w+", dtype=block.dtype, shape=(rows, count))
+        outputs[: block.shape[0]] = block
+        for start in range(resolved_block_rows, rows, resolved_block_rows):
+            stop = min(start + resolved_block_rows, rows)
+            outputs[start:stop] = batch[start:stop].sample_dist(rng, count)
+        outputs.flush()
+        del outputs
+        return {"file": OUTPUTS_NAME, "count": count, "dtype": block.dtype.str}
+
+    @property
+    def family(self) -> str:
+        return self.manifest["family"]
+
+    @property
+    def count(self) -> int | None:
+        outputs = self.manifest["outputs"]
+        return outputs["count"] if outputs is not None else None
+
+    def __len__(self) -> int:
+        return self.manifest["rows"]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(path={str(self.path)!r}, family={self.family!r}, "
+            f"rows={len(self)}, count={self.count})"
+        )
+
+    def batch(self, rows: slice = slice(None)) -> BaseSpecBatch:
+        """Spec batch over ``rows``, backed by the memory-mapped columns."""
+        batch_cls = FAMILY_REGISTRY.get_batch(self.family)
+        return batch_cls(
+            validate=False,
+            **{name: column[rows] for name, column in self.columns.items()},
+        )
+
+    def spec(self, index: int) -> BaseFunctionSpec:
+        return self.batch()[index]
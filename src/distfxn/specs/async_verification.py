@@ -0,0 +1,188 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import Executor
+from typing import Any
+
+import numpy as np
+
+from .base import BaseFunctionSpec
+from .canonical_cache import CanonicalOutputCache
+from .equivalence_cases import EquivalenceCase
+from .output_checks import OutputVerificationReport
+from .verification import (
+    CaseVerificationReport,
+    SpecVerificationReport,
+    _failure_reasons,
+    _sampler_error_report,
+)
+
+AsyncCandidateSampler = Callable[[BaseFunctionSpec, int, int], Awaitable[Any]]
+
+DEFAULT_CONCURRENCY = 16
+
+
+async def async_run_equivalence_cases(
+    spec: BaseFunctionSpec,
+    candidate_sampler: AsyncCandidateSampler,
+    *,
+    cases: tuple[EquivalenceCase, ...] | None = None,
+    timeout: float | None = None,
+    concurrency: int | asyncio.Semaphore = DEFAULT_CONCURRENCY,
+    executor: Executor | None = None,
+    canonical_cache: CanonicalOutputCache | None = None,
+) -> SpecVerificationReport:
+    """Async ``run_equivalence_cases`` for candidates behind an I/O boundary.
+
+    ``candidate_sampler(spec, seed, count)`` is awaited for each case; it receives the
+    case seed rather than a generator and must return the output of
+    ``sample_dist(np.random.default_rng(seed), count)``. Calls that exceed ``timeout``
+    seconds fail the case. Canonical sampling and output checks run on ``executor``
+    (the loop's default thread pool if None), so they overlap with candidate latency.
+    At most ``concurrency`` cases are in flight; pass a shared ``asyncio.Semaphore`` to
+    apply one limit across several calls.
+    """
+    resolved_cases = cases if cases is not None else spec.all_equivalence_cases()
+    if len(resolved_cases) == 0:
+        raise ValueError("at least one equivalence case is required")
+    semaphore = _as_semaphore(concurrency)
+
+    case_reports = await asyncio.gather(
+        *(
+            _run_case(
+                spec,
+                candidate_sampler,
+                case=case,
+                timeout=timeout,
+                semaphore=semaphore,
+                executor=executor,
+                canonical_cache=canonical_cache,
+            )
+            for case in resolved_cases
+        )
+    )
+    return SpecVerificationReport(
+        family=spec.family,
+        passed=all(case_report.passed for case_report in case_reports),
+        case_reports=tuple(case_reports),
+    )
+
+
+async def async_verify_many(
+    specs: Iterable[BaseFunctionSpec],
+    candidate_sampler: AsyncCandidateSampler,
+    *,
+    cases: tuple[EquivalenceCase, ...] | None = None,
+    timeout: float | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    executor: Executor | None = None,
+    canonical_cache: CanonicalOutputCache | None = None,
+) -> tuple[SpecVerificationReport, ...]:
+    """Verify every spec concurrently; reports are returned in input order.
+
+    ``concurrency`` bounds the number of cases in flight across all specs. ``specs`` is
+    consumed on demand by that many workers, so at most ``concurrency`` specs are being
+    verified at once however long the input is.
+    """
+    semaphore = _as_semaphore(concurrency)
+    indexed_specs = enumerate(specs)
+    reports: dict[int, SpecVerificationReport] = {}
+
+    async def worker() -> None:
+        # The iterator is shared; each next() runs without yielding to the event loop.
+        for index, spec in indexed_specs:
+            reports[index] = await async_run_equivalence_cases(
+                spec,
+                candidate_sampler,
+                cases=cases,
+                timeout=timeout,
+                concurrency=semaphore,
+                executor=executor,
+                canonical_cache=canonical_cache,
+            )
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return tuple(reports[index] for index in range(len(reports)))
+
+
+def _as_semaphore(concurrency: int | asyncio.Semaphore) -> asyncio.Semaphore:
+    if isinstance(concurrency, asyncio.Semaphore):
+        return concurrency
+    if concurrency <= 0:
+        raise ValueError("concurrency must be greater than 0")
+    return asyncio.Semaphore(concurrency)
+
+
+async def _run_case(
+    spec: BaseFunctionSpec,
+    candidate_sampler: AsyncCandidateSampler,
+    *,
+    case: EquivalenceCase,
+    timeout: float | None,
+    semaphore: asyncio.Semaphore,
+    executor: Executor | None,
+    canonical_cache: CanonicalOutputCache | None,
+) -> CaseVerificationReport:
+    loop = asyncio.get_running_loop()
+    async with semaphore:
+        canonical = loop.run_in_executor(executor, _canonical_side, spec, case, canonical_cache)
+        # As in run_equivalence_cases, only the sampler call is guarded, so exceptions
+        # raised by output checks propagate instead of failing the case.
+        candidate_output = None
+        candidate_report = None
+        try:
+            candidate_output = np.asarray(
+                await asyncio.wait_for(candidate_sampler(spec, case.seed, case.count), timeout)
+            )
+        except TimeoutError:
+            candidate_report = _sampler_error_report(
+                spec, f"candidate sampler timed out after {timeout}s"
+            )
+        except Exception as exc:
+            candidate_report = _sampler_error_report(spec, f"candidate sampler failed: {exc!r}")
+        if candidate_report is None:
+            candidate_report = await loop.run_in_executor(
+                executor, _validate, spec, candidate_output, case.count
+            )
+        canonical_output, canonical_report = await canonical
+
+        exact_output_match = canonical_output is not None and candidate_output is not None
+        if exact_output_match:
+            exact_output_match = await loop.run_in_executor(
+                executor, _outputs_equal, canonical_output, candidate_output
+            )
+
+    return CaseVerificationReport(
+        case=case,
+        canonical_output_report=canonical_report,
+        candidate_output_report=candidate_report,
+        exact_output_match=exact_output_match,
+        passed=canonical_report.passed and candidate_report.passed and exact_output_match,
+        failure_reasons=_failure_reasons(
+            canonical_output_report=canonical_report,
+            candidate_output_report=candidate_report,
+            exact_output_match=exact_output_match,
+        ),
+    )
+
+
+def _canonical_side(
+    spec: BaseFunctionSpec,
+    case: EquivalenceCase,
+    canonical_cache: CanonicalOutputCache | None,
+) -> tuple[Any, OutputVerificationReport]:
+    try:
+        if canonical_cache is not None:
+            output = canonical_cache.get_or_sample(spec, case)
+        else:
+            output = spec.sample_dist(np.random.default_rng(case.seed), case.count)
+    except Exception as exc:
+        return None, _sampler_error_report(spec, f"canonical sampler failed: {exc!r}")
+    return output, spec.validate_output(output, count=case.count)
+
+
+def _validate(spec: BaseFunctionSpec, output, count: int) -> OutputVerificationReport:
+    return spec.validate_output(output, count=count)
+
+
+def _outputs_equal(canonical_output, candidate_output) -> bool:
+    return bool(np.array_equal(canonical_output, candidate_output))
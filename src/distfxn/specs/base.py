@@ -1,16 +1,36 @@
-from typing import Any
+import hashlib
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import cache, cached_property
+from typing import Any, ClassVar, Self
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
+from .accumulators import AnalyticMoments
 from .equivalence_cases import EquivalenceCase, default_equivalence_cases
-from .output_checks import OutputCheck, OutputVerificationReport, default_output_checks
+from .output_checks import (
+    BlockwiseValidator,
+    CheckResult,
+    OutputCheck,
+    OutputSummary,
+    OutputVerificationReport,
+    default_output_checks,
+)
+
+FINGERPRINT_DIGEST_SIZE = 16
 
 
 class BaseFunctionSpec(BaseModel):
     """Base schema for synthetic function-family specifications."""
 
     model_config = ConfigDict(extra="forbid", frozen=True)
+    # True when sampling `count` values in consecutive chunks from one generator yields
+    # the same values as a single sample_dist(rng, count) call.
+    chunk_invariant: ClassVar[bool] = False
+    # Two-sample test used by run_statistical_equivalence_cases: "ks" or "chi_square".
+    statistical_test: ClassVar[str] = "ks"
+
     family: str
     output_checks: tuple[OutputCheck, ...] = Field(default_factory=default_output_checks)
     equivalence_cases: tuple[EquivalenceCase, ...] = Field(
@@ -23,7 +43,152 @@ class BaseFunctionSpec(BaseModel):
     def render(self) -> str:
         raise NotImplementedError("spec families must implement render()")
 
-    def validate_output(self, output: Any, *, count: int) -> OutputVerificationReport:
+    def sample_dist_into(self, rng, out: np.ndarray) -> None:
+        """Fill the 1D array ``out`` in place with ``out.shape[0]`` samples drawn from ``rng``."""
+        out[...] = self.sample_dist(rng, out.shape[0])
+
+    def sample_dist_parallel(
+        self,
+        rng,
+        count: int,
+        *,
+        workers: int,
+        executor: Executor | None = None,
+    ) -> np.ndarray:
+        """Opt-in multi-threaded sampling for large ``count``.
+
+        Seeding contract: ``rng.spawn(workers)`` derives one child generator per worker
+        (``SeedSequence.spawn`` on ``rng``'s seed sequence), the output is split into
+        ``workers`` contiguous slices at ``i * count // workers``, and child ``i`` fills
+        slice ``i`` with ``sample_dist_into``. The result is reproducible for a given seed,
+        ``count``, and ``workers``, independent of thread scheduling, but differs from
+        ``sample_dist`` and across worker counts. Spawning advances the seed sequence, so
+        repeated calls on one ``rng`` draw fresh values. ``render_parallel`` renders the
+        same computation. Slices are filled on ``executor`` or a temporary thread pool.
+        """
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0")
+        out = np.empty(count, dtype=self._sample_dtype())
+        bounds = [index * count // workers for index in range(workers + 1)]
+        children = rng.spawn(workers)
+
+        def fill(index: int) -> None:
+            self.sample_dist_into(children[index], out[bounds[index] : bounds[index + 1]])
+
+        if workers == 1:
+            fill(0)
+        elif executor is not None:
+            tuple(executor.map(fill, range(workers)))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                tuple(pool.map(fill, range(workers)))
+        return out
+
+    def render_parallel(self, workers: int) -> str:
+        """Render ``sample_dist(rng, count)`` following the ``sample_dist_parallel`` contract."""
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0")
+        fill_lines = "".join(f"        {line}\n" for line in self._render_fill_lines("child", "part"))
+        return (
+            "def sample_dist(rng, count):\n"
+            "    from concurrent.futures import ThreadPoolExecutor\n"
+            "\n"
+            "    import numpy as np\n"
+            "\n"
+            f"    workers = {workers!r}\n"
+            f"    out = np.empty(count, dtype=np.{self._sample_dtype().name})\n"
+            "    bounds = [index * count // workers for index in range(workers + 1)]\n"
+            "    children = rng.spawn(workers)\n"
+            "\n"
+            "    def fill(index):\n"
+            "        child = children[index]\n"
+            "        part = out[bounds[index] : bounds[index + 1]]\n"
+            f"{fill_lines}"
+            "\n"
+            "    if workers == 1:\n"
+            "        fill(0)\n"
+            "    else:\n"
+            "        with ThreadPoolExecutor(max_workers=workers) as pool:\n"
+            "            tuple(pool.map(fill, range(workers)))\n"
+            "    return out\n"
+        )
+
+    def _sample_dtype(self) -> np.dtype:
+        return np.dtype(np.float64)
+
+    def _render_fill_lines(self, rng_name: str, out_name: str) -> tuple[str, ...]:
+        """Source lines equivalent to ``sample_dist_into(<rng_name>, <out_name>)``."""
+        raise NotImplementedError(f"family '{self.family}' does not support render_parallel()")
+
+    def analytic_moments(self) -> AnalyticMoments:
+        """Mean, variance, and fourth central moment of the sampled distribution."""
+        raise NotImplementedError(f"family '{self.family}' does not define analytic_moments()")
+
+    def analytic_histogram(self, bins: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return (interior edges, bin probabilities) for about ``bins`` bins.
+
+        The layout matches ``HistogramAccumulator``: ``len(edges) + 1`` bins, the first
+        and last unbounded below and above.
+        """
+        raise NotImplementedError(f"family '{self.family}' does not define analytic_histogram()")
+
+    @classmethod
+    def sample_dist_batch(cls, rng, count: int, **params):
+        """Sample ``count`` values for each of N parameter rows as an (N, count) array.
+
+        ``params`` are the family's parameter fields as length-N arrays. Seeding contract:
+        draws are taken from ``rng`` in row-major order, so row ``i`` is bit-identical to
+        calling ``sample_dist(rng, count)`` on spec ``i`` after specs ``0..i-1`` have
+        consumed the same generator. Splitting the rows into consecutive blocks and
+        calling this once per block therefore produces the same output.
+        """
+        raise NotImplementedError("spec families must implement sample_dist_batch()")
+
+    def sample_dist_chunks(
+        self,
+        rng,
+        count: int,
+        *,
+        chunk_size: int,
+    ) -> Iterator[np.ndarray]:
+        """Yield the output of ``sample_dist(rng, count)`` in consecutive chunks.
+
+        Families that are not ``chunk_invariant`` yield a single full-size chunk.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than 0")
+        if not self.chunk_invariant:
+            yield np.asarray(self.sample_dist(rng, count))
+            return
+        for start in range(0, count, chunk_size):
+            yield np.asarray(self.sample_dist(rng, min(chunk_size, count - start)))
+
+    def validate_output(
+        self,
+        output: Any,
+        *,
+        count: int,
+        block_size: int | None = None,
+    ) -> OutputVerificationReport:
+        """Run the output checks; see ``validate_output_detailed`` for per-check messages.
+
+        With ``block_size``, elementwise checks scan a 1D output in windows of that many
+        values, so temporaries stay bounded (e.g. for ``np.memmap`` outputs).
+        """
+        values = np.asarray(output)
+        if block_size is not None and values.ndim == 1 and values.shape[0] > block_size:
+            return self._validate_output_blocks(values, count=count, block_size=block_size)
+        # Decide pass/fail in one fused pass over shared reductions; only failing outputs
+        # pay for the detailed per-check results and messages.
+        summary = OutputSummary(values)
+        if all(
+            check.passes(values, spec=self, count=count, summary=summary)
+            for check in self.output_checks
+        ):
+            return self.passing_output_report
+        return self.validate_output_detailed(values, count=count)
+
+    def validate_output_detailed(self, output: Any, *, count: int) -> OutputVerificationReport:
         values = np.asarray(output)
         results = tuple(
             check.run(values, spec=self, count=count)
@@ -35,6 +200,52 @@ class BaseFunctionSpec(BaseModel):
             results=results,
         )
 
+    def _validate_output_blocks(
+        self,
+        values: np.ndarray,
+        *,
+        count: int,
+        block_size: int,
+    ) -> OutputVerificationReport:
+        validator = BlockwiseValidator(self, count=count)
+        # Feed every block, even after a failure, so that the per-check results match
+        # validate_output_detailed; checks that already failed are not rerun.
+        for start in range(0, values.shape[0], block_size):
+            validator.feed(values[start : start + block_size])
+        return validator.finish(values) or self.passing_output_report
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Stable content hash of the spec, including its output checks and equivalence cases.
+
+        It is derived from the model's canonical JSON dump, so specs that serialize
+        identically share a fingerprint across processes and runs. It is computed once per
+        instance and serves as the deduplication and cache key; equality stays pydantic's
+        field comparison.
+        """
+        return hashlib.blake2b(
+            self.model_dump_json().encode(),
+            digest_size=FINGERPRINT_DIGEST_SIZE,
+        ).hexdigest()
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # cached_property values live in __dict__ and would describe the original.
+            for name in tuple(copied.__dict__):
+                if name not in type(copied).model_fields:
+                    del copied.__dict__[name]
+        return copied
+
+    @cached_property
+    def passing_output_report(self) -> OutputVerificationReport:
+        """The report of an output that passes every check, built once per spec."""
+        return OutputVerificationReport(
+            family=self.family,
+            passed=True,
+            results=tuple(CheckResult(name=check.name, passed=True) for check in self.output_checks),
+        )
+
     def assert_valid_output(self, output: Any, *, count: int) -> None:
         report = self.validate_output(output, count=count)
         if report.passed:
@@ -49,6 +260,15 @@ class BaseFunctionSpec(BaseModel):
             f"output validation failed for family '{self.family}': {'; '.join(failures)}"
         )
 
+    def non_default_fields(self) -> tuple[str, ...]:
+        """Names of fields that are required or differ from their defaults."""
+        defaults = _field_defaults(type(self))
+        return tuple(
+            name
+            for name in type(self).model_fields
+            if name not in defaults or getattr(self, name) != defaults[name]
+        )
+
     def generated_equivalence_cases(self) -> tuple[EquivalenceCase, ...]:
         return ()
 
@@ -58,3 +278,12 @@ class BaseFunctionSpec(BaseModel):
     @classmethod
     def edge_specs(cls) -> tuple["BaseFunctionSpec", ...]:
         return ()
+
+
+@cache
+def _field_defaults(spec_cls: type[BaseFunctionSpec]) -> dict[str, Any]:
+    return {
+        name: field.get_default(call_default_factory=True)
+        for name, field in spec_cls.model_fields.items()
+        if not field.is_required()
+    }
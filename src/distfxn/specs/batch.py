@@ -0,0 +1,131 @@
+from collections.abc import Iterable, Iterator
+from numbers import Integral
+from typing import Any, ClassVar
+
+import numpy as np
+
+from .base import BaseFunctionSpec
+
+
+class BaseSpecBatch:
+    """Columnar (struct-of-arrays) batch of specs for a single family.
+
+    Parameters are held as 1D float64 columns. Individual specs are only built when a
+    single row is indexed, so sampling and validating millions of parameter sets does
+    not pay pydantic model construction. Only the family's parameter fields are stored;
+    materialized specs use the family's defaults for every other field (output dtype,
+    output checks, equivalence cases), and ``from_specs`` rejects specs that change them.
+    """
+
+    spec_cls: ClassVar[type[BaseFunctionSpec]]
+    param_fields: ClassVar[tuple[str, ...]]
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, *, validate: bool = True, **columns: Any):
+        expected = set(self.param_fields)
+        provided = set(columns)
+        if provided != expected:
+            missing = ", ".join(sorted(expected - provided)) or "<none>"
+            unexpected = ", ".join(sorted(provided - expected)) or "<none>"
+            raise TypeError(
+                f"{type(self).__name__} requires columns {self.param_fields!r} "
+                f"(missing: {missing}; unexpected: {unexpected})"
+            )
+
+        resolved: dict[str, np.ndarray] = {}
+        for name in self.param_fields:
+            column = np.ascontiguousarray(columns[name], dtype=np.float64)
+            if column.ndim != 1:
+                raise ValueError(f"column '{name}' must be 1D but got ndim={column.ndim}")
+            resolved[name] = column
+
+        lengths = {column.shape[0] for column in resolved.values()}
+        if len(lengths) != 1:
+            raise ValueError("all columns must have the same length")
+
+        self._columns = resolved
+        if validate:
+            self.validate()
+
+    @classmethod
+    def family(cls) -> str:
+        return cls.spec_cls.model_fields["family"].default
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._columns[name]
+        except KeyError as exc:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from exc
+
+    def __len__(self) -> int:
+        return self._columns[self.param_fields[0]].shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, Integral):
+            return self.spec_cls(
+                **{name: float(column[index]) for name, column in self._columns.items()}
+            )
+        return type(self)(
+            validate=False,
+            **{name: column[index] for name, column in self._columns.items()},
+        )
+
+    def __iter__(self) -> Iterator[BaseFunctionSpec]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(family={self.family()!r}, size={len(self)})"
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return dict(self._columns)
+
+    def sample_dist(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Return an (N, count) array; see ``BaseFunctionSpec.sample_dist_batch``."""
+        return self.spec_cls.sample_dist_batch(rng, count, **self._columns)
+
+    def invalid_rows(self) -> Iterator[tuple[np.ndarray, str]]:
+        """Yield (mask, message) pairs, where mask flags rows violating the rule."""
+        raise NotImplementedError("spec batches must implement invalid_rows()")
+
+    def validate(self) -> None:
+        for mask, message in self.invalid_rows():
+            if mask.any():
+                first_invalid = int(np.flatnonzero(mask)[0])
+                raise ValueError(f"{message} (first invalid row: {first_invalid})")
+
+    def to_specs(self) -> tuple[BaseFunctionSpec, ...]:
+        return tuple(
+            self.spec_cls(**dict(zip(self.param_fields, row, strict=True)))
+            for row in zip(*(column.tolist() for column in self._columns.values()), strict=True)
+        )
+
+    @classmethod
+    def from_specs(cls, specs: Iterable[BaseFunctionSpec]) -> "BaseSpecBatch":
+        specs = tuple(specs)
+        for row, spec in enumerate(specs):
+            if not isinstance(spec, cls.spec_cls):
+                raise TypeError(f"{cls.__name__} only accepts {cls.spec_cls.__name__} specs")
+            unsupported = set(spec.non_default_fields()) - set(cls.param_fields)
+            if unsupported:
+                # Rows materialize with default settings, so these would be silently lost.
+                raise ValueError(
+                    f"{cls.__name__} only stores {cls.param_fields!r}; row {row} sets "
+                    f"non-default fields {sorted(unsupported)!r}"
+                )
+        return cls(
+            validate=False,
+            **{
+                name: np.fromiter(
+                    (getattr(spec, name) for spec in specs),
+                    dtype=np.float64,
+                    count=len(specs),
+                )
+                for name in cls.param_fields
+            },
+        )
@@ -1,12 +1,20 @@
-from typing import Annotated, Literal
+from collections.abc import Iterator
+from typing import Annotated, ClassVar, Literal
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
+from .accumulators import AnalyticMoments
 from .base import BaseFunctionSpec
+from .batch import BaseSpecBatch
 from .output_checks import InSetCheck, OutputCheck, default_output_checks
 from .param_sampling import UniformFloatParamSampler
 
+BernoulliOutputDtype = Literal["int64", "uint8", "bool"]
+
+# Uniforms drawn per block by the threshold sampler, bounding its float64 scratch buffer.
+_THRESHOLD_BLOCK_SIZE = 1 << 16
+
 Probability = Annotated[
     float,
     Field(strict=True, allow_inf_nan=False, ge=0.0, le=1.0),
@@ -26,22 +34,71 @@ class BernoulliSamplingSpec(BaseModel):
 
 
 class BernoulliSpec(BaseFunctionSpec):
+    chunk_invariant: ClassVar[bool] = True
+    statistical_test: ClassVar[str] = "chi_square"
+
     family: Literal["bernoulli"] = "bernoulli"
     p: Probability
+    # "int64" keeps the binomial draw; "bool" and "uint8" use a uniform-threshold draw,
+    # ``rng.random(count) < p``, which is a different (and faster) canonical stream.
+    output_dtype: BernoulliOutputDtype = "int64"
     output_checks: tuple[OutputCheck, ...] = Field(
-        default_factory=lambda: default_output_checks()
+        default_factory=lambda: default_output_checks(dtype_field="output_dtype")
         + (InSetCheck(allowed=(0.0, 1.0)),)
     )
 
     def sample_dist(self, rng, count: int):
-        return rng.binomial(n=1, p=self.p, size=count)
+        if self.output_dtype == "int64":
+            return rng.binomial(n=1, p=self.p, size=count)
+        out = np.empty(count, dtype=self._sample_dtype())
+        self.sample_dist_into(rng, out)
+        return out
 
     def render(self) -> str:
-        return (
-            "def sample_dist(rng, count):\n"
-            f"    return rng.binomial(n=1, p={self.p!r}, size=count)\n"
+        if self.output_dtype == "int64":
+            draw = f"rng.binomial(n=1, p={self.p!r}, size=count)"
+        elif self.output_dtype == "bool":
+            draw = f"rng.random(count) < {self.p!r}"
+        else:
+            draw = f"(rng.random(count) < {self.p!r}).view({self.output_dtype!r})"
+        return f"def sample_dist(rng, count):\n    return {draw}\n"
+
+    def sample_dist_into(self, rng, out: np.ndarray) -> None:
+        if self.output_dtype == "int64":
+            out[...] = rng.binomial(n=1, p=self.p, size=out.shape[0])
+            return
+        flags = out.view(np.bool_)
+        scratch = np.empty(min(out.shape[0], _THRESHOLD_BLOCK_SIZE))
+        for start in range(0, out.shape[0], _THRESHOLD_BLOCK_SIZE):
+            uniforms = scratch[: min(_THRESHOLD_BLOCK_SIZE, out.shape[0] - start)]
+            rng.random(out=uniforms)
+            np.less(uniforms, self.p, out=flags[start : start + uniforms.shape[0]])
+
+    def _sample_dtype(self) -> np.dtype:
+        return np.dtype(self.output_dtype)
+
+    def _render_fill_lines(self, rng_name: str, out_name: str) -> tuple[str, ...]:
+        size = f"{out_name}.shape[0]"
+        if self.output_dtype == "int64":
+            return (f"{out_name}[...] = {rng_name}.binomial(n=1, p={self.p!r}, size={size})",)
+        return (f"{out_name}[...] = {rng_name}.random({size}) < {self.p!r}",)
+
+    def analytic_moments(self) -> AnalyticMoments:
+        variance = self.p * (1.0 - self.p)
+        return AnalyticMoments(
+            mean=self.p,
+            variance=variance,
+            fourth_central_moment=variance * (1.0 - 3.0 * variance),
         )
 
+    def analytic_histogram(self, bins: int) -> tuple[np.ndarray, np.ndarray]:
+        return np.array([0.5]), np.array([1.0 - self.p, self.p])
+
+    @classmethod
+    def sample_dist_batch(cls, rng, count: int, *, p):
+        p_column = np.asarray(p, dtype=np.float64)[:, None]
+        return rng.binomial(n=1, p=p_column, size=(p_column.shape[0], count))
+
     @classmethod
     def edge_specs(cls) -> tuple["BernoulliSpec", ...]:
         return (
@@ -69,9 +126,29 @@ class BernoulliSpec(BaseFunctionSpec):
         count: int,
         sampling_spec: BernoulliSamplingSpec | None = None,
     ) -> tuple["BernoulliSpec", ...]:
+        return cls.sample_batch(rng, count=count, sampling_spec=sampling_spec).to_specs()
+
+    @classmethod
+    def sample_batch(
+        cls,
+        rng: np.random.Generator,
+        *,
+        count: int,
+        sampling_spec: BernoulliSamplingSpec | None = None,
+    ) -> "BernoulliSpecBatch":
         if count <= 0:
             raise ValueError("count must be greater than 0")
         resolved_sampling_spec = sampling_spec or BernoulliSamplingSpec()
-        return tuple(
-            cls.sample_spec(rng, sampling_spec=resolved_sampling_spec) for _ in range(count)
-        )
+        p_values = resolved_sampling_spec.p_sampler.sample_many(rng, count)
+        return BernoulliSpecBatch(p=p_values)
+
+
+class BernoulliSpecBatch(BaseSpecBatch):
+    spec_cls = BernoulliSpec
+    param_fields = ("p",)
+
+    __slots__ = ()
+
+    def invalid_rows(self) -> Iterator[tuple[np.ndarray, str]]:
+        # NaN fails both comparisons, so this also rejects non-finite values.
+        yield ~((self.p >= 0.0) & (self.p <= 1.0)), "p must be a finite probability in [0, 1]"
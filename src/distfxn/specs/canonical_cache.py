@@ -0,0 +1,214 @@
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from .base import BaseFunctionSpec
+from .equivalence_cases import EquivalenceCase
+from .fingerprint import spec_fingerprint
+
+CanonicalKey = tuple[str, int, int, str]
+
+
+class CanonicalCacheStats(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    memory_evictions: int
+    disk_evictions: int
+    memory_bytes: int
+    disk_bytes: int
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
+
+
+class CanonicalOutputCache:
+    """Two-tier cache of canonical ``sample_dist`` outputs for equivalence cases.
+
+    Canonical outputs are deterministic for a frozen spec and a case, so they are keyed by
+    (spec fingerprint, seed, count, numpy version). The in-memory tier is an LRU bounded by
+    ``max_memory_bytes``. When ``directory`` is set, outputs are also written there as
+    ``.npy`` files, and the least recently used files are removed once the directory
+    exceeds ``max_disk_bytes``. Cached arrays are returned read-only.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_memory_bytes: int = 256 * 1024**2,
+        directory: str | Path | None = None,
+        max_disk_bytes: int = 4 * 1024**3,
+    ):
+        if max_memory_bytes < 0:
+            raise ValueError("max_memory_bytes must be greater than or equal to 0")
+        if max_disk_bytes < 0:
+            raise ValueError("max_disk_bytes must be greater than or equal to 0")
+
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = Path(directory) if directory is not None else None
+
+        self._lock = Lock()
+        self._memory: OrderedDict[CanonicalKey, np.ndarray] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._memory_evictions = 0
+        self._disk_evictions = 0
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._scan_directory()
+
+    @staticmethod
+    def key(spec: BaseFunctionSpec, case: EquivalenceCase) -> CanonicalKey:
+        return (spec_fingerprint(spec), case.seed, case.count, np.__version__)
+
+    def get(self, spec: BaseFunctionSpec, case: EquivalenceCase) -> np.ndarray | None:
+        key = self.key(spec, case)
+        with self._lock:
+            output = self._memory.get(key)
+            if output is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return output
+
+        output = self._load_from_disk(key)
+        with self._lock:
+            if output is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._remember(key, output)
+        return output
+
+    def put(self, spec: BaseFunctionSpec, case: EquivalenceCase, output) -> np.ndarray:
+        return self._store(self.key(spec, case), np.array(output, copy=True))
+
+    def get_or_sample(self, spec: BaseFunctionSpec, case: EquivalenceCase) -> np.ndarray:
+        output = self.get(spec, case)
+        if output is not None:
+            return output
+        # The freshly sampled array is owned here, so it is cached without a copy.
+        return self._store(
+            self.key(spec, case),
+            np.asarray(spec.sample_dist(np.random.default_rng(case.seed), case.count)),
+        )
+
+    def stats(self) -> CanonicalCacheStats:
+        with self._lock:
+            return CanonicalCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                memory_evictions=self._memory_evictions,
+                disk_evictions=self._disk_evictions,
+                memory_bytes=self._memory_bytes,
+                disk_bytes=self._disk_bytes,
+            )
+
+    def clear(self, *, disk: bool = False) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if disk and self.directory is not None:
+                for filename in self._disk:
+                    (self.directory / filename).unlink(missing_ok=True)
+                self._disk.clear()
+                self._disk_bytes = 0
+
+    def _store(self, key: CanonicalKey, values: np.ndarray) -> np.ndarray:
+        values.setflags(write=False)
+        with self._lock:
+            self._remember(key, values)
+        self._save_to_disk(key, values)
+        return values
+
+    def _remember(self, key: CanonicalKey, values: np.ndarray) -> None:
+        if values.nbytes > self.max_memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes
+        self._memory[key] = values
+        self._memory_bytes += values.nbytes
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+            self._memory_evictions += 1
+
+    @staticmethod
+    def _filename(key: CanonicalKey) -> str:
+        fingerprint, seed, count, numpy_version = key
+        return f"{fingerprint}_{seed}_{count}_np{numpy_version}.npy"
+
+    def _scan_directory(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.npy"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.name, stat.st_size))
+        for _, filename, size in sorted(entries):
+            self._disk[filename] = size
+            self._disk_bytes += size
+
+    def _load_from_disk(self, key: CanonicalKey) -> np.ndarray | None:
+        if self.directory is None:
+            return None
+        filename = self._filename(key)
+        path = self.directory / filename
+        try:
+            values = np.load(path, allow_pickle=False)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            with self._lock:
+                self._forget_file(filename)
+            return None
+
+        values.setflags(write=False)
+        os.utime(path)
+        with self._lock:
+            if filename in self._disk:
+                self._disk.move_to_end(filename)
+        return values
+
+    def _save_to_disk(self, key: CanonicalKey, values: np.ndarray) -> None:
+        if self.directory is None or values.dtype.hasobject or values.nbytes > self.max_disk_bytes:
+            return
+        filename = self._filename(key)
+        path = self.directory / filename
+        # A unique temporary file per writer, so threads and processes saving the same key
+        # never interleave their bytes; the last complete file wins the rename.
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, prefix=f".{filename}.", suffix=".tmp", delete=False
+        ) as handle:
+            try:
+                np.save(handle, values, allow_pickle=False)
+            except BaseException:
+                handle.close()
+                os.unlink(handle.name)
+                raise
+        os.replace(handle.name, path)
+
+        with self._lock:
+            self._disk_bytes -= self._disk.pop(filename, 0)
+            size = path.stat().st_size
+            self._disk[filename] = size
+            self._disk_bytes += size
+            while self._disk_bytes > self.max_disk_bytes and self._disk:
+                self._forget_file(next(iter(self._disk)))
+                self._disk_evictions += 1
+
+    def _forget_file(self, filename: str) -> None:
+        self._disk_bytes -= self._disk.pop(filename, 0)
+        (self.directory / filename).unlink(missing_ok=True)
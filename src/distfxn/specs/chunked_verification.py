@@ -0,0 +1,173 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from .base import BaseFunctionSpec
+from .equivalence_cases import EquivalenceCase
+from .memmap_output import DEFAULT_CHUNK_SIZE, ChunkSampler
+from .output_checks import BlockwiseValidator, OutputVerificationReport
+from .verification import (
+    CaseVerificationReport,
+    SpecVerificationReport,
+    _failure_reasons,
+    _sampler_error_report,
+    render_to_callable,
+)
+
+
+def verify_chunk_invariance(
+    spec: BaseFunctionSpec,
+    *,
+    seed: int = 0,
+    count: int = 1027,
+    chunk_sizes: Iterable[int] = (1, 10, 256),
+) -> bool:
+    """Check that drawing ``count`` values in chunks reproduces one ``sample_dist`` call.
+
+    ``count`` defaults to a prime so that every chunk size leaves a ragged final chunk.
+    """
+    expected = np.asarray(spec.sample_dist(np.random.default_rng(seed), count))
+    for chunk_size in chunk_sizes:
+        rng = np.random.default_rng(seed)
+        chunks = [
+            np.asarray(spec.sample_dist(rng, min(chunk_size, count - start)))
+            for start in range(0, count, chunk_size)
+        ]
+        if not np.array_equal(expected, np.concatenate(chunks)):
+            return False
+    return True
+
+
+def run_chunked_equivalence_cases(
+    spec: BaseFunctionSpec,
+    candidate_sampler: ChunkSampler | None = None,
+    *,
+    cases: tuple[EquivalenceCase, ...] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    check_invariance: bool = True,
+) -> SpecVerificationReport:
+    """``run_equivalence_cases`` that never materializes a full output.
+
+    Canonical and candidate outputs are drawn ``chunk_size`` values at a time from
+    generators seeded from the case; ``candidate_sampler(spec, rng, n)`` is called once
+    per chunk and defaults to the rendered ``sample_dist``. Each pair of chunks is
+    validated and compared as it arrives, and a case stops at the first chunk that fails
+    or differs, reporting ``first_mismatch_index``; checks then cover only the chunks drawn
+    so far, and a case that stops before every value was compared leaves
+    ``exact_output_match`` unset.
+
+    Only ``chunk_invariant`` families are eligible. Unless ``check_invariance`` is False,
+    that property is also confirmed for ``spec`` with ``verify_chunk_invariance`` first.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+    if not spec.chunk_invariant:
+        raise ValueError(f"family '{spec.family}' does not support chunked sampling")
+    if check_invariance and not verify_chunk_invariance(spec):
+        raise ValueError(
+            f"family '{spec.family}' is declared chunk_invariant but chunked draws differ"
+        )
+
+    resolved_cases = cases if cases is not None else spec.all_equivalence_cases()
+    if len(resolved_cases) == 0:
+        raise ValueError("at least one equivalence case is required")
+    if candidate_sampler is None:
+        rendered_sample_dist = render_to_callable(spec)
+
+        def candidate_sampler(_spec, rng, count):
+            return rendered_sample_dist(rng, count)
+
+    case_reports = tuple(
+        _run_chunked_case(spec, candidate_sampler, case=case, chunk_size=chunk_size)
+        for case in resolved_cases
+    )
+    return SpecVerificationReport(
+        family=spec.family,
+        passed=all(case_report.passed for case_report in case_reports),
+        case_reports=case_reports,
+    )
+
+
+def _run_chunked_case(
+    spec: BaseFunctionSpec,
+    candidate_sampler: ChunkSampler,
+    *,
+    case: EquivalenceCase,
+    chunk_size: int,
+) -> CaseVerificationReport:
+    samplers = {
+        "canonical": lambda rng, size: spec.sample_dist(rng, size),
+        "candidate": lambda rng, size: candidate_sampler(spec, rng, size),
+    }
+    rngs = {side: np.random.default_rng(case.seed) for side in samplers}
+    validators = {side: BlockwiseValidator(spec, count=case.count) for side in samplers}
+    errors: dict[str, OutputVerificationReport] = {}
+    last_chunks: dict[str, np.ndarray] = {}
+    first_mismatch_index = None
+    compared = 0
+
+    for offset in range(0, case.count, chunk_size):
+        size = min(chunk_size, case.count - offset)
+        for side, sample in samplers.items():
+            try:
+                chunk = np.asarray(sample(rngs[side], size))
+            except Exception as exc:
+                errors[side] = _sampler_error_report(spec, f"{side} sampler failed: {exc!r}")
+                continue
+            if chunk.ndim != 1 or chunk.shape[0] != size:
+                errors[side] = _sampler_error_report(
+                    spec,
+                    f"{side} sampler returned shape {chunk.shape} for a chunk of {size} "
+                    f"at offset {offset}",
+                )
+                continue
+            validators[side].feed(chunk)
+            last_chunks[side] = chunk
+
+        if errors:
+            break
+        canonical_chunk = last_chunks["canonical"]
+        candidate_chunk = last_chunks["candidate"]
+        if not np.array_equal(canonical_chunk, candidate_chunk):
+            differing = np.flatnonzero(canonical_chunk != candidate_chunk)
+            first_mismatch_index = offset + int(differing[0])
+            break
+        compared += size
+        if not (validators["canonical"].passed and validators["candidate"].passed):
+            break
+
+    reports = {}
+    for side, validator in validators.items():
+        if side in errors:
+            reports[side] = errors[side]
+            continue
+        chunk = last_chunks[side]
+        # Shape and dtype checks only need metadata, so a zero-stride view stands in for
+        # the full output.
+        stand_in = np.broadcast_to(chunk[-1:], (case.count,))
+        reports[side] = validator.finish(stand_in) or spec.passing_output_report
+
+    # Unknown (None) when sampling stopped early, before every value could be compared.
+    if first_mismatch_index is not None:
+        exact_output_match = False
+    else:
+        exact_output_match = True if compared == case.count else None
+    passed = (
+        reports["canonical"].passed
+        and reports["candidate"].passed
+        and exact_output_match is True
+    )
+    return CaseVerificationReport(
+        case=case,
+        canonical_output_report=reports["canonical"],
+        candidate_output_report=reports["candidate"],
+        exact_output_match=exact_output_match,
+        passed=passed,
+        failure_reasons=_failure_reasons(
+            canonical_output_report=reports["canonical"],
+            candidate_output_report=reports["candidate"],
+            exact_output_match=exact_output_match,
+            first_mismatch_index=first_mismatch_index,
+        ),
+        first_mismatch_index=first_mismatch_index,
+    )
@@ -0,0 +1,410 @@
+import json
+import math
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import batched
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from .base import BaseFunctionSpec
+from .equivalence_cases import EquivalenceCase
+from .fingerprint import intern_specs
+from .registry import FAMILY_REGISTRY
+from .verification import (
+    CandidateSampler,
+    SpecVerificationReport,
+    run_equivalence_cases,
+    run_render_equivalence_cases,
+)
+
+if TYPE_CHECKING:
+    from .results_store import VerificationResultStore
+
+
+def spec_payload(spec: BaseFunctionSpec) -> dict[str, Any]:
+    """Compact payload for ``FAMILY_REGISTRY.parse``; fields left at their defaults are omitted.
+
+    Only top-level fields are compared with their defaults; customized fields such as
+    ``output_checks`` are dumped in full, so nested discriminators like ``kind`` survive.
+    """
+    return {"family": spec.family, **spec.model_dump(include=set(spec.non_default_fields()))}
+
+
+def iter_jsonl_specs(source: str | Path | IO[str]) -> Iterator[BaseFunctionSpec]:
+    """Lazily parse one spec payload per line of a JSONL file; blank lines are skipped."""
+    if isinstance(source, (str, Path)):
+        with open(source, encoding="utf-8") as handle:
+            yield from iter_jsonl_specs(handle)
+        return
+
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"line {line_number} is not valid JSON: {exc}") from exc
+        yield FAMILY_REGISTRY.parse(payload)
+
+
+def append_jsonl(records: Iterable[BaseModel], destination: str | Path | IO[str]) -> int:
+    """Append each record as one JSON line as it arrives; returns the number written."""
+    if isinstance(destination, (str, Path)):
+        with open(destination, "a", encoding="utf-8") as handle:
+            return append_jsonl(records, handle)
+
+    written = 0
+    for record in records:
+        destination.write(record.model_dump_json())
+        destination.write("\n")
+        written += 1
+    destination.flush()
+    return written
+
+
+def _as_spec(item: BaseFunctionSpec | Mapping[str, Any]) -> BaseFunctionSpec:
+    if isinstance(item, BaseFunctionSpec):
+        return item
+    return FAMILY_REGISTRY.parse(item)
+
+
+def _as_payload(item: BaseFunctionSpec | Mapping[str, Any]) -> Mapping[str, Any]:
+    if isinstance(item, BaseFunctionSpec):
+        return spec_payload(item)
+    return item
+
+
+def _verify_spec(
+    spec: BaseFunctionSpec,
+    *,
+    candidate_sampler: CandidateSampler | None,
+    cases: tuple[EquivalenceCase, ...] | None,
+) -> SpecVerificationReport:
+    if candidate_sampler is None:
+        return run_render_equivalence_cases(spec, cases=cases)
+    return run_equivalence_cases(spec, candidate_sampler, cases=cases)
+
+
+def _verify_payload_chunk(
+    payloads: tuple[Mapping[str, Any], ...],
+    *,
+    candidate_sampler: CandidateSampler | None,
+    cases: tuple[EquivalenceCase, ...] | None,
+) -> list[SpecVerificationReport]:
+    return [
+        _verify_spec(
+            FAMILY_REGISTRY.parse(payload),
+            candidate_sampler=candidate_sampler,
+            cases=cases,
+        )
+        for payload in payloads
+    ]
+
+
+class _ChunkPipeline:
+    """Bounded submission of payload chunks to a process pool, returning results in order."""
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        max_in_flight: int,
+        mp_context,
+        candidate_sampler: CandidateSampler | None,
+        cases: tuple[EquivalenceCase, ...] | None,
+    ):
+        self.max_in_flight = max_in_flight
+        self._verify_chunk = partial(
+            _verify_payload_chunk, candidate_sampler=candidate_sampler, cases=cases
+        )
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+        self._pending: deque[Future] = deque()
+
+    def submit(self, chunk: tuple[Mapping[str, Any], ...]) -> list[SpecVerificationReport]:
+        """Submit ``chunk``; once ``max_in_flight`` are pending, wait for the oldest."""
+        self._pending.append(self._executor.submit(self._verify_chunk, chunk))
+        if len(self._pending) >= self.max_in_flight:
+            return self._pending.popleft().result()
+        return []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def wait_oldest(self) -> list[SpecVerificationReport]:
+        return self._pending.popleft().result()
+
+    def finish(self) -> Iterator[SpecVerificationReport]:
+        while self._pending:
+            yield from self.wait_oldest()
+
+    def __enter__(self) -> "_ChunkPipeline":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_verify(
+    specs: Iterable[BaseFunctionSpec | Mapping[str, Any]],
+    *,
+    candidate_sampler: CandidateSampler | None = None,
+    cases: tuple[EquivalenceCase, ...] | None = None,
+    workers: int = 1,
+    chunksize: int = 64,
+    max_in_flight: int | None = None,
+    mp_context=None,
+    deduplicate: bool = False,
+    results_store: "VerificationResultStore | None" = None,
+    candidate_id: str | None = None,
+) -> Iterator[SpecVerificationReport]:
+    """Lazily verify specs (or raw payloads), yielding reports in input order.
+
+    ``specs`` is consumed on demand, so with ``iter_jsonl_specs`` on the input side and
+    ``append_jsonl`` on the output side peak memory does not grow with corpus size. With
+    ``workers > 1``, at most ``max_in_flight`` chunks of ``chunksize`` payloads (default:
+    two per worker) are submitted to the process pool at once.
+
+    With ``deduplicate``, specs with the same fingerprint are verified once and share one
+    report; this keeps a report per unique spec in memory. With ``results_store``, specs
+    that already passed for the same cases, candidate, and numpy version are not
+    re-verified, and new passing reports are recorded; ``candidate_id`` identifies
+    ``candidate_sampler`` (the rendered source is identified by its hash).
+    """
+    if workers <= 0:
+        raise ValueError("workers must be greater than 0")
+    if chunksize <= 0:
+        raise ValueError("chunksize must be greater than 0")
+    resolved_max_in_flight = max_in_flight or workers * 2
+    if resolved_max_in_flight <= 0:
+        raise ValueError("max_in_flight must be greater than 0")
+    if results_store is not None and candidate_sampler is not None and candidate_id is None:
+        raise ValueError("candidate_id is required when candidate_sampler is provided")
+
+    if deduplicate or results_store is not None:
+        yield from _iter_verify_incremental(
+            specs,
+            deduplicate=deduplicate,
+            results_store=results_store,
+            candidate_id=candidate_id,
+            candidate_sampler=candidate_sampler,
+            cases=cases,
+            workers=workers,
+            chunksize=chunksize,
+            max_in_flight=resolved_max_in_flight,
+            mp_context=mp_context,
+        )
+        return
+
+    if workers == 1:
+        for item in specs:
+            yield _verify_spec(_as_spec(item), candidate_sampler=candidate_sampler, cases=cases)
+        return
+
+    with _ChunkPipeline(
+        workers=workers,
+        max_in_flight=resolved_max_in_flight,
+        mp_context=mp_context,
+        candidate_sampler=candidate_sampler,
+        cases=cases,
+    ) as pipeline:
+        for chunk in batched((_as_payload(item) for item in specs), chunksize):
+            yield from pipeline.submit(chunk)
+        yield from pipeline.finish()
+
+
+def _iter_verify_incremental(
+    specs: Iterable[BaseFunctionSpec | Mapping[str, Any]],
+    *,
+    deduplicate: bool,
+    results_store: "VerificationResultStore | None",
+    candidate_id: str | None,
+    candidate_sampler: CandidateSampler | None,
+    cases: tuple[EquivalenceCase, ...] | None,
+    workers: int,
+    chunksize: int,
+    max_in_flight: int,
+    mp_context,
+) -> Iterator[SpecVerificationReport]:
+    # Reports that are ready to emit, keyed by fingerprint when deduplicating (and kept
+    # for later duplicates) or by input position otherwise.
+    ready: dict[Any, SpecVerificationReport] = {}
+    input_order: deque[Any] = deque()
+    submitted: deque[tuple[Any, BaseFunctionSpec]] = deque()
+    # Fingerprints submitted but not yet recorded, so duplicates are not verified twice.
+    # Positions are unique, so without deduplication nothing needs tracking.
+    in_flight: set[Any] = set()
+
+    def classify() -> Iterator[BaseFunctionSpec | None]:
+        # Yields once per input: the spec if it must be verified, otherwise None.
+        for position, item in enumerate(specs):
+            spec = _as_spec(item)
+            key = spec.fingerprint if deduplicate else position
+            input_order.append(key)
+            if key in ready or key in in_flight:
+                yield None
+                continue
+            if results_store is not None:
+                stored = results_store.get(spec, cases=cases, candidate_id=candidate_id)
+                if stored is not None:
+                    ready[key] = stored
+                    yield None
+                    continue
+            if deduplicate:
+                in_flight.add(key)
+            submitted.append((key, spec))
+            yield spec
+
+    def drain() -> Iterator[SpecVerificationReport]:
+        while input_order and input_order[0] in ready:
+            key = input_order.popleft()
+            yield ready[key] if deduplicate else ready.pop(key)
+
+    def record(report: SpecVerificationReport) -> None:
+        key, spec = submitted.popleft()
+        ready[key] = report
+        in_flight.discard(key)
+        if results_store is not None:
+            results_store.put(spec, report, cases=cases, candidate_id=candidate_id)
+
+    try:
+        if workers == 1:
+            # Verify inline so that skipped specs stream out as they are read.
+            for spec in classify():
+                if spec is not None:
+                    record(_verify_spec(spec, candidate_sampler=candidate_sampler, cases=cases))
+                yield from drain()
+            return
+
+        # Skipped specs still wait behind earlier unverified ones to keep input order, so
+        # reading stops once this many inputs are waiting until the oldest chunk returns.
+        max_waiting = (max_in_flight + 1) * chunksize
+        with _ChunkPipeline(
+            workers=workers,
+            max_in_flight=max_in_flight,
+            mp_context=mp_context,
+            candidate_sampler=candidate_sampler,
+            cases=cases,
+        ) as pipeline:
+            chunk: list[Mapping[str, Any]] = []
+
+            def submit_chunk() -> None:
+                for report in pipeline.submit(tuple(chunk)):
+                    record(report)
+                chunk.clear()
+
+            for spec in classify():
+                if spec is not None:
+                    chunk.append(spec_payload(spec))
+                    if len(chunk) == chunksize:
+                        submit_chunk()
+                yield from drain()
+                while len(input_order) > max_waiting:
+                    if len(pipeline):
+                        for report in pipeline.wait_oldest():
+                            record(report)
+                    elif chunk:
+                        submit_chunk()
+                    else:
+                        break
+                    yield from drain()
+            if chunk:
+                submit_chunk()
+            for report in pipeline.finish():
+                record(report)
+                yield from drain()
+    finally:
+        if results_store is not None:
+            results_store.flush()
+
+
+def verify_many(
+    specs: Sequence[BaseFunctionSpec],
+    *,
+    candidate_sampler: CandidateSampler | None = None,
+    cases: tuple[EquivalenceCase, ...] | None = None,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    mp_context=None,
+    deduplicate: bool = True,
+    results_store: "VerificationResultStore | None" = None,
+    candidate_id: str | None = None,
+) -> tuple[SpecVerificationReport, ...]:
+    """Verify a corpus of specs across a process pool.
+
+    Each spec is checked against ``candidate_sampler`` (or its own ``render()`` when
+    omitted), and reports are returned in the same order as ``specs``. Specs cross the
+    process boundary as ``spec_payload`` dicts and are rebuilt with ``FAMILY_REGISTRY``,
+    so custom families must be registered when ``distfxn.specs`` is imported in the
+    workers, and ``candidate_sampler`` must be picklable (e.g. a module-level function).
+    ``workers=1`` verifies serially in the calling process. With ``deduplicate``
+    (the default), each unique spec is verified once and its report is shared by all of
+    its duplicates. ``results_store`` and ``candidate_id`` skip and record specs as in
+    ``iter_verify``.
+    """
+    if deduplicate:
+        unique_specs, indices = intern_specs(_as_spec(item) for item in specs)
+        unique_reports = verify_many(
+            unique_specs,
+            candidate_sampler=candidate_sampler,
+            cases=cases,
+            workers=workers,
+            chunksize=chunksize,
+            mp_context=mp_context,
+            deduplicate=False,
+            results_store=results_store,
+            candidate_id=candidate_id,
+        )
+        return tuple(unique_reports[index] for index in indices)
+
+    if results_store is not None:
+        if candidate_sampler is not None and candidate_id is None:
+            raise ValueError("candidate_id is required when candidate_sampler is provided")
+        resolved_specs = tuple(_as_spec(item) for item in specs)
+        reports = [
+            results_store.get(spec, cases=cases, candidate_id=candidate_id)
+            for spec in resolved_specs
+        ]
+        missing = [index for index, report in enumerate(reports) if report is None]
+        if missing:
+            verified = verify_many(
+                tuple(resolved_specs[index] for index in missing),
+                candidate_sampler=candidate_sampler,
+                cases=cases,
+                workers=workers,
+                chunksize=chunksize,
+                mp_context=mp_context,
+                deduplicate=False,
+            )
+            for index, report in zip(missing, verified):
+                reports[index] = report
+                results_store.put(
+                    resolved_specs[index], report, cases=cases, candidate_id=candidate_id
+                )
+            results_store.flush()
+        return tuple(reports)
+
+    resolved_workers = workers if workers is not None else (os.cpu_count() or 1)
+    if resolved_workers <= 0:
+        raise ValueError("workers must be greater than 0")
+    if chunksize is not None and chunksize <= 0:
+        raise ValueError("chunksize must be greater than 0")
+
+    if len(specs) <= 1:
+        resolved_workers = 1
+
+    resolved_chunksize = chunksize or max(1, math.ceil(len(specs) / (resolved_workers * 4)))
+    return tuple(
+        iter_verify(
+            specs,
+            candidate_sampler=candidate_sampler,
+            cases=cases,
+            workers=resolved_workers,
+            chunksize=resolved_chunksize,
+            mp_context=mp_context,
+        )
+    )
@@ -0,0 +1,29 @@
+from collections.abc import Iterable
+
+from .base import FINGERPRINT_DIGEST_SIZE as FINGERPRINT_DIGEST_SIZE
+from .base import BaseFunctionSpec
+
+
+def spec_fingerprint(spec: BaseFunctionSpec) -> str:
+    """Stable content hash of a spec; see ``BaseFunctionSpec.fingerprint``."""
+    return spec.fingerprint
+
+
+def intern_specs(
+    specs: Iterable[BaseFunctionSpec],
+) -> tuple[tuple[BaseFunctionSpec, ...], tuple[int, ...]]:
+    """Collapse duplicate specs by fingerprint.
+
+    Returns the unique specs in first-seen order and, for every input spec, the index of
+    its unique representative, so per-spec results can be fanned back out with
+    ``[results[index] for index in indices]``.
+    """
+    positions: dict[str, int] = {}
+    unique: list[BaseFunctionSpec] = []
+    indices: list[int] = []
+    for spec in specs:
+        position = positions.setdefault(spec.fingerprint, len(unique))
+        if position == len(unique):
+            unique.append(spec)
+        indices.append(position)
+    return tuple(unique), tuple(indices)
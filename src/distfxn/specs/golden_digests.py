@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from .base import BaseFunctionSpec
+from .equivalence_cases import EquivalenceCase
+from .fingerprint import spec_fingerprint
+from .output_checks import BlockwiseValidator
+
+GoldenKey = tuple[str, int, int, str]
+
+DIGEST_SIZE = 16
+_HASH_BLOCK_BYTES = 1 << 24
+_RECORD_CHUNK_SIZE = 1 << 20
+_STORE_FORMAT_VERSION = 1
+
+
+class OutputDigest:
+    """Streaming blake2b digest of an output array's raw buffer, dtype, and shape.
+
+    ``update`` accepts consecutive 1D chunks of one output, so chunked or memory-mapped
+    outputs hash to the same value as the full array passed to ``output_digest``.
+    """
+
+    __slots__ = ("_hash", "_dtype", "_length")
+
+    def __init__(self):
+        self._hash = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        self._dtype: np.dtype | None = None
+        self._length = 0
+
+    def update(self, chunk) -> None:
+        values = np.asarray(chunk)
+        if values.ndim != 1:
+            raise ValueError(f"expected a 1D chunk but got ndim={values.ndim}")
+        if values.dtype.hasobject:
+            raise TypeError("object arrays cannot be digested")
+        if self._dtype is None:
+            self._dtype = values.dtype
+        elif values.dtype != self._dtype:
+            raise ValueError(f"chunk dtype {values.dtype} differs from earlier dtype {self._dtype}")
+        _hash_buffer(self._hash, values)
+        self._length += values.shape[0]
+
+    def hexdigest(self) -> str:
+        dtype = self._dtype if self._dtype is not None else np.dtype(np.float64)
+        return _finish(self._hash.copy(), dtype, (self._length,))
+
+
+def output_digest(output) -> str:
+    """Digest of a whole output array; equal digests mean equal dtype, shape, and bytes."""
+    values = np.asarray(output)
+    if values.dtype.hasobject:
+        raise TypeError("object arrays cannot be digested")
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    _hash_buffer(digest, values)
+    return _finish(digest, values.dtype, values.shape)
+
+
+class GoldenDigestStore:
+    """Digests of validated canonical outputs, keyed by (spec fingerprint, seed, count,
+    numpy version).
+
+    Lets ``run_equivalence_cases`` check a candidate against the canonical output
+    without regenerating or holding it. Digests are only recorded for canonical outputs
+    that pass the spec's output checks. ``save``/``load`` persist the store as JSON.
+    """
+
+    def __init__(self, digests: dict[GoldenKey, str] | None = None):
+        self._digests: dict[GoldenKey, str] = dict(digests or {})
+
+    @classmethod
+    def build(
+        cls,
+        specs: Iterable[BaseFunctionSpec] = (),
+        *,
+        edge_specs: bool = True,
+        cases: tuple[EquivalenceCase, ...] | None = None,
+    ) -> "GoldenDigestStore":
+        """Record digests for ``specs`` and, with ``edge_specs``, every registered family's
+        ``edge_specs()``, over ``cases`` or each spec's own equivalence cases."""
+        store = cls()
+        if edge_specs:
+            from .registry import FAMILY_REGISTRY
+
+            for family in FAMILY_REGISTRY.list_families():
+                store.record_many(FAMILY_REGISTRY.get(family).edge_specs(), cases=cases)
+        store.record_many(specs, cases=cases)
+        return store
+
+    @staticmethod
+    def key(spec: BaseFunctionSpec, case: EquivalenceCase) -> GoldenKey:
+        return (spec_fingerprint(spec), case.seed, case.count, np.__version__)
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def __contains__(self, key: GoldenKey) -> bool:
+        return key in self._digests
+
+    def get(self, spec: BaseFunctionSpec, case: EquivalenceCase) -> str | None:
+        return self._digests.get(self.key(spec, case))
+
+    def record(self, spec: BaseFunctionSpec, case: EquivalenceCase) -> str:
+        """Sample, validate, and digest the canonical output for ``case``."""
+        key = self.key(spec, case)
+        digest = self._digests.get(key)
+        if digest is not None:
+            return digest
+
+        # Families that are not chunk_invariant yield the whole output as one chunk.
+        chunks = spec.sample_dist_chunks(
+            np.random.default_rng(case.seed), case.count, chunk_size=_RECORD_CHUNK_SIZE
+        )
+        streaming = OutputDigest()
+        validator = BlockwiseValidator(spec, count=case.count)
+        last_chunk = None
+        for chunk in chunks:
+            validator.feed(chunk)
+            streaming.update(chunk)
+            last_chunk = chunk
+        report = validator.finish(np.broadcast_to(last_chunk[-1:], (case.count,)))
+        if report is not None:
+            details = "; ".join(
+                f"{result.name}: {result.message or 'failed'}" for result in report.failed_results()
+            )
+            raise ValueError(
+                f"canonical output for family '{spec.family}' case '{case.name}' is invalid: "
+                f"{details}"
+            )
+        digest = streaming.hexdigest()
+
+        self._digests[key] = digest
+        return digest
+
+    def record_many(
+        self,
+        specs: Iterable[BaseFunctionSpec],
+        *,
+        cases: tuple[EquivalenceCase, ...] | None = None,
+    ) -> int:
+        recorded = 0
+        for spec in specs:
+            for case in cases if cases is not None else spec.all_equivalence_cases():
+                self.record(spec, case)
+                recorded += 1
+        return recorded
+
+    def to_dict(self) -> dict:
+        return {
+            "version": _STORE_FORMAT_VERSION,
+            "digests": [[*key, digest] for key, digest in self._digests.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GoldenDigestStore":
+        if data.get("version") != _STORE_FORMAT_VERSION:
+            raise ValueError(f"unsupported golden digest store version {data.get('version')!r}")
+        return cls(
+            {
+                (fingerprint, int(seed), int(count), numpy_version): digest
+                for fingerprint, seed, count, numpy_version, digest in data["digests"]
+            }
+        )
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        temporary_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps(self.to_dict()) + "\n")
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "GoldenDigestStore":
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+
+def _hash_buffer(digest, values: np.ndarray) -> None:
+    contiguous = np.ascontiguousarray(values)
+    buffer = memoryview(contiguous.reshape(-1)).cast("B")
+    for start in range(0, buffer.nbytes, _HASH_BLOCK_BYTES):
+        digest.update(buffer[start : start + _HASH_BLOCK_BYTES])
+
+
+def _finish(digest, dtype: np.dtype, shape: tuple[int, ...]) -> str:
+    digest.update(f"|{dtype.str}|{shape}".encode())
+    return digest.hexdigest()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Literal
+
+from pydantic import BaseModel, ConfigDict
+
+if TYPE_CHECKING:
+    from .base import BaseFunctionSpec
+    from .equivalence_cases import EquivalenceCase
+    from .output_checks import CheckResult, OutputCheckBase
+    from .verification import CaseVerificationReport
+
+VerificationPhase = Literal[
+    "canonical_sampling",
+    "canonical_verify",
+    "candidate_sampling",
+    "candidate_verify",
+    "compare",
+    "report",
+]
+OutputSide = Literal["canonical", "candidate"]
+
+
+class CaseTiming(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    canonical_sampling_seconds: float = 0.0
+    canonical_verify_seconds: float = 0.0
+    candidate_sampling_seconds: float = 0.0
+    candidate_verify_seconds: float = 0.0
+    compare_seconds: float = 0.0
+    report_seconds: float = 0.0
+
+    @property
+    def total_seconds(self) -> float:
+        return (
+            self.canonical_sampling_seconds
+            + self.canonical_verify_seconds
+            + self.candidate_sampling_seconds
+            + self.candidate_verify_seconds
+            + self.compare_seconds
+            + self.report_seconds
+        )
+
+    def to_line(self) -> str:
+        return (
+            f"canonical_sampling={self.canonical_sampling_seconds:.6f}s "
+            f"canonical_verify={self.canonical_verify_seconds:.6f}s "
+            f"candidate_sampling={self.candidate_sampling_seconds:.6f}s "
+            f"candidate_verify={self.candidate_verify_seconds:.6f}s "
+            f"compare={self.compare_seconds:.6f}s "
+            f"report={self.report_seconds:.6f}s"
+        )
+
+
+class VerificationHooks:
+    """Tracer interface for ``run_equivalence_cases``; override only the callbacks you need.
+
+    Passing hooks routes output validation through the per-check path so that
+    ``on_check`` sees every check, which is slower than the fused validator.
+    """
+
+    def on_case_start(self, *, spec: BaseFunctionSpec, case: EquivalenceCase) -> None:
+        pass
+
+    def on_case_end(
+        self,
+        *,
+        spec: BaseFunctionSpec,
+        case: EquivalenceCase,
+        report: CaseVerificationReport,
+    ) -> None:
+        pass
+
+    def on_phase_start(
+        self,
+        phase: VerificationPhase,
+        *,
+        spec: BaseFunctionSpec,
+        case: EquivalenceCase,
+    ) -> None:
+        pass
+
+    def on_phase_end(
+        self,
+        phase: VerificationPhase,
+        *,
+        spec: BaseFunctionSpec,
+        case: EquivalenceCase,
+        elapsed: float,
+    ) -> None:
+        pass
+
+    def on_check(
+        self,
+        check: OutputCheckBase,
+        result: CheckResult,
+        *,
+        spec: BaseFunctionSpec,
+        case: EquivalenceCase,
+        side: OutputSide,
+        elapsed: float,
+    ) -> None:
+        pass
+
+
+class PhaseRecorder:
+    """Times the phases of one equivalence case and forwards them to hooks."""
+
+    __slots__ = ("hooks", "spec", "case", "durations", "_phase", "_started")
+
+    def __init__(
+        self,
+        hooks: VerificationHooks | None,
+        *,
+        spec: BaseFunctionSpec,
+        case: EquivalenceCase,
+    ):
+        self.hooks = hooks
+        self.spec = spec
+        self.case = case
+        self.durations: dict[str, float] = {}
+        self._phase: VerificationPhase | None = None
+        self._started = 0.0
+
+    def start(self, phase: VerificationPhase) -> None:
+        if self.hooks is not None:
+            self.hooks.on_phase_start(phase, spec=self.spec, case=self.case)
+        self._phase = phase
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        phase = self._phase
+        if phase is None:
+            return
+        elapsed = time.perf_counter() - self._started
+        self._phase = None
+        self.durations[phase] = self.durations.get(phase, 0.0) + elapsed
+        if self.hooks is not None:
+            self.hooks.on_phase_end(phase, spec=self.spec, case=self.case, elapsed=elapsed)
+
+    def timing(self) -> CaseTiming:
+        return CaseTiming(
+            **{f"{phase}_seconds": seconds for phase, seconds in self.durations.items()}
+        )
+
+
+class AllocationTracker:
+    """Measures peak traced allocations per case, starting tracemalloc only if needed."""
+
+    __slots__ = ("_started_tracing", "_baseline")
+
+    def __init__(self):
+        self._started_tracing = False
+        self._baseline = 0
+
+    def __enter__(self) -> AllocationTracker:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def reset(self) -> None:
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def peak_bytes(self) -> int:
+        """Peak traced memory since ``reset()``, above what was already allocated then."""
+        return max(0, tracemalloc.get_traced_memory()[1] - self._baseline)
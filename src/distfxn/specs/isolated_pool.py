@@ -0,0 +1,226 @@
+import multiprocessing
+import os
+import queue
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from typing import Any
+
+import numpy as np
+
+from .base import BaseFunctionSpec
+from .registry import FAMILY_REGISTRY
+from .verification import CandidateSampler
+
+DEFAULT_TIMEOUT_SECONDS = 10.0
+DEFAULT_MAX_TASKS_PER_WORKER = 200
+
+
+class IsolatedExecutionError(RuntimeError):
+    """A task could not be completed by an isolated worker."""
+
+
+class WorkerTimeoutError(IsolatedExecutionError, TimeoutError):
+    """A task exceeded the pool's wall-clock limit; its worker was killed and replaced."""
+
+
+class WorkerCrashedError(IsolatedExecutionError):
+    """A worker died while running a task (e.g. killed or crashed); it was replaced."""
+
+
+class IsolatedWorkerPool:
+    """Persistent worker processes that run rendered or candidate samplers in isolation.
+
+    Workers are started up front (forked where available, so they inherit an already
+    imported numpy and ``distfxn.specs``) and reused across tasks. Every task is subject to
+    a ``timeout`` wall-clock limit, after which its worker is killed and replaced.
+    ``memory_limit_bytes`` caps each worker's address space with ``RLIMIT_AS``, so runaway
+    allocations fail with ``MemoryError`` in the worker instead of exhausting the host.
+    Workers are recycled after ``max_tasks_per_worker`` tasks or a ``MemoryError``.
+
+    ``sample_rendered`` and ``sampler(...)`` have the ``CandidateSampler`` signature, so
+    they plug straight into ``run_equivalence_cases``. The generator is pickled into the
+    worker and its final state is copied back, so the caller's ``rng`` advances exactly as
+    it would in-process. A pool may be shared by threads; each task occupies one worker.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        timeout: float | None = DEFAULT_TIMEOUT_SECONDS,
+        memory_limit_bytes: int | None = None,
+        max_tasks_per_worker: int = DEFAULT_MAX_TASKS_PER_WORKER,
+        mp_context: str | None = None,
+    ):
+        resolved_workers = workers if workers is not None else (os.cpu_count() or 1)
+        if resolved_workers <= 0:
+            raise ValueError("workers must be greater than 0")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be greater than 0")
+        if memory_limit_bytes is not None and memory_limit_bytes <= 0:
+            raise ValueError("memory_limit_bytes must be greater than 0")
+        if max_tasks_per_worker <= 0:
+            raise ValueError("max_tasks_per_worker must be greater than 0")
+
+        self.timeout = timeout
+        self.memory_limit_bytes = memory_limit_bytes
+        self.max_tasks_per_worker = max_tasks_per_worker
+        if mp_context is None:
+            mp_context = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        self._context = multiprocessing.get_context(mp_context)
+        self._idle: queue.SimpleQueue[_Worker] = queue.SimpleQueue()
+        self._workers: set[_Worker] = set()
+        self._closed = False
+        # Families register lazily; load them all before forking so that every worker,
+        # including replacements, inherits built spec models instead of rebuilding them.
+        FAMILY_REGISTRY.load_all()
+        for _ in range(resolved_workers):
+            self._idle.put(self._spawn())
+
+    def sample_rendered(self, spec: BaseFunctionSpec, rng, count: int) -> np.ndarray:
+        """Run ``spec.render()``'s ``sample_dist(rng, count)`` in a worker."""
+        return self._run(rng, ("render", rng, count, spec.render()))
+
+    def sample(
+        self,
+        candidate_sampler: CandidateSampler,
+        spec: BaseFunctionSpec,
+        rng,
+        count: int,
+    ) -> np.ndarray:
+        """Run a picklable ``candidate_sampler(spec, rng, count)`` in a worker."""
+        return self._run(rng, ("call", rng, count, candidate_sampler, spec))
+
+    def sampler(self, candidate_sampler: CandidateSampler) -> CandidateSampler:
+        """Wrap a picklable candidate sampler so every call runs in this pool."""
+
+        def isolated_sampler(spec: BaseFunctionSpec, rng, count: int) -> np.ndarray:
+            return self.sample(candidate_sampler, spec, rng, count)
+
+        return isolated_sampler
+
+    def close(self) -> None:
+        self._closed = True
+        for worker in tuple(self._workers):
+            self._retire(worker, kill=False)
+
+    def __enter__(self) -> "IsolatedWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self, rng: np.random.Generator, task: tuple) -> np.ndarray:
+        if self._closed:
+            raise RuntimeError("pool is closed")
+        worker = self._idle.get()
+        replacement = worker
+        try:
+            ok, result = worker.run(task, timeout=self.timeout)
+            if worker.tasks >= self.max_tasks_per_worker or isinstance(result, MemoryError):
+                replacement = self._replace(worker, kill=False)
+        except WorkerTimeoutError:
+            replacement = self._replace(worker, kill=True)
+            raise
+        except (EOFError, OSError) as exc:
+            replacement = self._replace(worker, kill=True)
+            raise WorkerCrashedError(
+                f"worker exited with code {worker.process.exitcode}"
+            ) from exc
+        finally:
+            self._idle.put(replacement)
+        if not ok:
+            raise result
+        output, rng.bit_generator.state = result
+        return output
+
+    def _spawn(self) -> "_Worker":
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.memory_limit_bytes, self.max_tasks_per_worker),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        self._workers.add(worker)
+        return worker
+
+    def _replace(self, worker: "_Worker", *, kill: bool) -> "_Worker":
+        self._retire(worker, kill=kill)
+        return self._spawn()
+
+    def _retire(self, worker: "_Worker", *, kill: bool) -> None:
+        self._workers.discard(worker)
+        worker.stop(kill=kill)
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "tasks")
+
+    def __init__(self, process, conn: Connection):
+        self.process = process
+        self.conn = conn
+        self.tasks = 0
+
+    def run(self, task: tuple, *, timeout: float | None) -> tuple[bool, Any]:
+        self.tasks += 1
+        self.conn.send(task)
+        if not self.conn.poll(timeout):
+            raise WorkerTimeoutError(f"task exceeded the {timeout}s wall-clock limit")
+        return self.conn.recv()
+
+    def stop(self, *, kill: bool) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            # Forked siblings inherit this end of the pipe, so closing it would not signal
+            # EOF; ask the worker to exit instead.
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+        self.conn.close()
+        self.process.join(timeout=None if kill else 1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+
+def _worker_main(
+    conn: Connection,
+    memory_limit_bytes: int | None,
+    max_tasks: int,
+) -> None:
+    # Both are no-ops after a fork and warm spawned workers before their first task.
+    from .render_cache import RenderCache
+
+    FAMILY_REGISTRY.load_all()
+    if memory_limit_bytes is not None:
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+
+    render_cache = RenderCache(max_size=256)
+    handlers: dict[str, Callable[..., Any]] = {
+        "render": lambda rng, count, source: render_cache.get_callable(source)(rng, count),
+        "call": lambda rng, count, candidate_sampler, spec: candidate_sampler(spec, rng, count),
+    }
+    for _ in range(max_tasks):
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        kind, rng, *args = task
+        try:
+            output = np.asarray(handlers[kind](rng, *args))
+            response = (True, (output, rng.bit_generator.state))
+        except BaseException as exc:
+            response = (False, exc)
+        try:
+            conn.send(response)
+        except Exception as exc:
+            conn.send((False, IsolatedExecutionError(f"could not return task result: {exc!r}")))
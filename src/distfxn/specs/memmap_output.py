@@ -0,0 +1,170 @@
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .base import BaseFunctionSpec
+from .equivalence_cases import EquivalenceCase
+from .output_checks import OutputVerificationReport
+from .verification import (
+    CaseVerificationReport,
+    SpecVerificationReport,
+    _failure_reasons,
+    _sampler_error_report,
+    render_to_callable,
+)
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+ChunkSampler = Callable[[BaseFunctionSpec, np.random.Generator, int], Any]
+
+
+def sample_dist_to_memmap(
+    spec: BaseFunctionSpec,
+    rng,
+    count: int,
+    path: str | Path,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    sampler: ChunkSampler | None = None,
+) -> np.memmap:
+    """Write ``count`` samples to an ``.npy`` file at ``path`` and return it memory-mapped.
+
+    Samples are drawn ``chunk_size`` at a time from ``rng`` with ``sampler`` (default
+    ``spec.sample_dist``), so only one chunk is resident at once. The file matches
+    ``sample_dist(rng, count)`` exactly; families that are not ``chunk_invariant`` are
+    sampled in a single chunk.
+    """
+    if count <= 0:
+        raise ValueError("count must be greater than 0")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+
+    sample = sampler if sampler is not None else _canonical_sampler
+    step = chunk_size if spec.chunk_invariant else count
+    output = None
+    offset = 0
+    while offset < count:
+        size = min(step, count - offset)
+        chunk = np.asarray(sample(spec, rng, size))
+        if chunk.ndim != 1 or chunk.shape[0] != size:
+            raise ValueError(f"expected a 1D chunk of length {size} but got shape {chunk.shape}")
+        if output is None:
+            output = np.lib.format.open_memmap(path, mode="w+", dtype=chunk.dtype, shape=(count,))
+        elif chunk.dtype != output.dtype:
+            raise ValueError(f"chunk dtype {chunk.dtype} differs from earlier dtype {output.dtype}")
+        output[offset : offset + size] = chunk
+        offset += size
+
+    output.flush()
+    return output
+
+
+def outputs_equal(left, right, *, block_size: int = DEFAULT_CHUNK_SIZE) -> bool:
+    """``np.array_equal`` for 1D arrays, compared ``block_size`` elements at a time."""
+    left = np.asarray(left)
+    right = np.asarray(right)
+    if left.shape != right.shape:
+        return False
+    if left.ndim != 1:
+        return bool(np.array_equal(left, right))
+    return all(
+        np.array_equal(left[start : start + block_size], right[start : start + block_size])
+        for start in range(0, left.shape[0], block_size)
+    )
+
+
+def run_memmap_equivalence_cases(
+    spec: BaseFunctionSpec,
+    candidate_sampler: ChunkSampler | None = None,
+    *,
+    cases: tuple[EquivalenceCase, ...] | None = None,
+    directory: str | Path | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SpecVerificationReport:
+    """``run_equivalence_cases`` for outputs too large to hold in memory.
+
+    Canonical and candidate outputs are written to memory-mapped ``.npy`` files under
+    ``directory`` (a temporary directory by default, removed afterwards), then validated
+    and compared ``chunk_size`` elements at a time, so resident memory is bounded by the
+    chunk size rather than ``count``. ``candidate_sampler(spec, rng, n)`` is called once
+    per chunk on a single generator seeded from the case; it defaults to the rendered
+    ``sample_dist``.
+    """
+    resolved_cases = cases if cases is not None else spec.all_equivalence_cases()
+    if len(resolved_cases) == 0:
+        raise ValueError("at least one equivalence case is required")
+    if candidate_sampler is None:
+        rendered_sample_dist = render_to_callable(spec)
+
+        def candidate_sampler(_spec, rng, count):
+            return rendered_sample_dist(rng, count)
+
+    with tempfile.TemporaryDirectory(dir=directory, prefix="distfxn-memmap-") as workdir:
+        case_reports = tuple(
+            _run_memmap_case(
+                spec,
+                candidate_sampler,
+                case=case,
+                workdir=Path(workdir),
+                chunk_size=chunk_size,
+            )
+            for case in resolved_cases
+        )
+
+    return SpecVerificationReport(
+        family=spec.family,
+        passed=all(case_report.passed for case_report in case_reports),
+        case_reports=case_reports,
+    )
+
+
+def _run_memmap_case(
+    spec: BaseFunctionSpec,
+    candidate_sampler: ChunkSampler,
+    *,
+    case: EquivalenceCase,
+    workdir: Path,
+    chunk_size: int,
+) -> CaseVerificationReport:
+    outputs = {}
+    reports: dict[str, OutputVerificationReport] = {}
+    for side, sampler in (("canonical", None), ("candidate", candidate_sampler)):
+        path = workdir / f"{case.name}.{side}.npy"
+        try:
+            output = sample_dist_to_memmap(
+                spec,
+                np.random.default_rng(case.seed),
+                case.count,
+                path,
+                chunk_size=chunk_size,
+                sampler=sampler,
+            )
+            reports[side] = spec.validate_output(output, count=case.count, block_size=chunk_size)
+            outputs[side] = output
+        except Exception as exc:
+            reports[side] = _sampler_error_report(spec, f"{side} sampler failed: {exc!r}")
+
+    exact_output_match = len(outputs) == 2 and outputs_equal(
+        outputs["canonical"], outputs["candidate"], block_size=chunk_size
+    )
+
+    passed = reports["canonical"].passed and reports["candidate"].passed and exact_output_match
+    return CaseVerificationReport(
+        case=case,
+        canonical_output_report=reports["canonical"],
+        candidate_output_report=reports["candidate"],
+        exact_output_match=exact_output_match,
+        passed=passed,
+        failure_reasons=_failure_reasons(
+            canonical_output_report=reports["canonical"],
+            candidate_output_report=reports["candidate"],
+            exact_output_match=exact_output_match,
+        ),
+    )
+
+
+def _canonical_sampler(spec: BaseFunctionSpec, rng, count: int):
+    return spec.sample_dist(rng, count)
@@ -1,11 +1,16 @@
-from typing import Annotated, Literal
+from collections.abc import Iterator
+from statistics import NormalDist
+from typing import Annotated, ClassVar, Literal
 
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from .accumulators import AnalyticMoments
 from .base import BaseFunctionSpec
+from .batch import BaseSpecBatch
 from .param_sampling import LogUniformPositiveFloatParamSampler, UniformFloatParamSampler
-from .types import FiniteStrictFloat
+from .output_checks import OutputCheck, default_output_checks
+from .types import FiniteStrictFloat, FloatOutputDtype
 
 PositiveFiniteStrictFloat = Annotated[
     float,
@@ -33,19 +38,82 @@ class NormalSamplingSpec(BaseModel):
 
 
 class NormalSpec(BaseFunctionSpec):
+    chunk_invariant: ClassVar[bool] = True
+
     family: Literal["normal"] = "normal"
     mean: FiniteStrictFloat
     stddev: PositiveFiniteStrictFloat
+    # "float32" draws ``rng.standard_normal(dtype=float32)`` and scales it in float32.
+    output_dtype: FloatOutputDtype = "float64"
+    output_checks: tuple[OutputCheck, ...] = Field(
+        default_factory=lambda: default_output_checks(dtype_field="output_dtype")
+    )
+
+    @model_validator(mode="after")
+    def validate_float32_params(self) -> "NormalSpec":
+        if self.output_dtype == "float32":
+            with np.errstate(over="ignore", under="ignore"):
+                mean, stddev = np.array([self.mean, self.stddev], dtype=np.float32)
+            if not (np.isfinite(mean) and np.isfinite(stddev) and stddev > 0.0):
+                raise ValueError("mean and stddev must be finite, and stddev > 0, in float32")
+        return self
 
     def sample_dist(self, rng, count: int):
-        return rng.normal(self.mean, self.stddev, size=count)
+        if self.output_dtype == "float64":
+            return rng.normal(self.mean, self.stddev, size=count)
+        out = np.empty(count, dtype=np.float32)
+        self.sample_dist_into(rng, out)
+        return out
 
     def render(self) -> str:
+        if self.output_dtype == "float64":
+            return (
+                "def sample_dist(rng, count):\n"
+                f"    return rng.normal({self.mean!r}, {self.stddev!r}, size=count)\n"
+            )
         return (
             "def sample_dist(rng, count):\n"
-            f"    return rng.normal({self.mean!r}, {self.stddev!r}, size=count)\n"
+            '    values = rng.standard_normal(count, dtype="float32")\n'
+            f"    values *= {self.stddev!r}\n"
+            f"    values += {self.mean!r}\n"
+            "    return values\n"
         )
 
+    def sample_dist_into(self, rng, out: np.ndarray) -> None:
+        rng.standard_normal(out=out, dtype=out.dtype)
+        out *= self.stddev
+        out += self.mean
+
+    def _sample_dtype(self) -> np.dtype:
+        return np.dtype(self.output_dtype)
+
+    def _render_fill_lines(self, rng_name: str, out_name: str) -> tuple[str, ...]:
+        return (
+            f"{rng_name}.standard_normal(out={out_name}, dtype={out_name}.dtype)",
+            f"{out_name} *= {self.stddev!r}",
+            f"{out_name} += {self.mean!r}",
+        )
+
+    def analytic_moments(self) -> AnalyticMoments:
+        variance = self.stddev**2
+        return AnalyticMoments(
+            mean=self.mean,
+            variance=variance,
+            fourth_central_moment=3.0 * variance**2,
+        )
+
+    def analytic_histogram(self, bins: int) -> tuple[np.ndarray, np.ndarray]:
+        # Equiprobable bins between normal quantiles.
+        distribution = NormalDist(self.mean, self.stddev)
+        edges = np.array([distribution.inv_cdf(index / bins) for index in range(1, bins)])
+        return edges, np.full(bins, 1.0 / bins)
+
+    @classmethod
+    def sample_dist_batch(cls, rng, count: int, *, mean, stddev):
+        mean_column = np.asarray(mean, dtype=np.float64)[:, None]
+        stddev_column = np.asarray(stddev, dtype=np.float64)[:, None]
+        return rng.normal(mean_column, stddev_column, size=(mean_column.shape[0], count))
+
     @classmethod
     def edge_specs(cls) -> tuple["NormalSpec", ...]:
         return (
@@ -77,9 +145,34 @@ class NormalSpec(BaseFunctionSpec):
         count: int,
         sampling_spec: NormalSamplingSpec | None = None,
     ) -> tuple["NormalSpec", ...]:
+        return cls.sample_batch(rng, count=count, sampling_spec=sampling_spec).to_specs()
+
+    @classmethod
+    def sample_batch(
+        cls,
+        rng: np.random.Generator,
+        *,
+        count: int,
+        sampling_spec: NormalSamplingSpec | None = None,
+    ) -> "NormalSpecBatch":
         if count <= 0:
             raise ValueError("count must be greater than 0")
         resolved_sampling_spec = sampling_spec or NormalSamplingSpec()
-        return tuple(
-            cls.sample_spec(rng, sampling_spec=resolved_sampling_spec) for _ in range(count)
+        mean_values = resolved_sampling_spec.mean_sampler.sample_many(rng, count)
+        stddev_values = resolved_sampling_spec.stddev_sampler.sample_many(
+            rng,
+            count,
+            context={"mean": mean_values},
         )
+        return NormalSpecBatch(mean=mean_values, stddev=stddev_values)
+
+
+class NormalSpecBatch(BaseSpecBatch):
+    spec_cls = NormalSpec
+    param_fields = ("mean", "stddev")
+
+    __slots__ = ()
+
+    def invalid_rows(self) -> Iterator[tuple[np.ndarray, str]]:
+        yield ~np.isfinite(self.mean), "mean must be finite"
+        yield ~(np.isfinite(self.stddev) & (self.stddev > 0.0)), "stddev must be finite and > 0"
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Annotated, Literal
+import math
+from functools import cached_property
+from typing import TYPE_CHECKING, Annotated, ClassVar, Literal
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 if TYPE_CHECKING:
     from .base import BaseFunctionSpec
+from .accumulators import HistogramAccumulator, MomentAccumulator
+from .stats import chi2_sf
 from .types import FiniteStrictFloat
 
 
@@ -49,8 +53,40 @@ class OutputVerificationReport(BaseModel):
         return self.model_dump()
 
 
+class OutputSummary:
+    """Reductions over an output array, computed at most once per validation pass.
+
+    ``bounds()`` gives (min, max) for real numeric (including bool) arrays without allocating any
+    array-sized temporaries; NaN propagates into both, so it also exposes non-finite
+    values to range and finiteness checks.
+    """
+
+    __slots__ = ("values", "_bounds")
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+        self._bounds = None
+
+    @property
+    def is_real_numeric(self) -> bool:
+        return self.values.dtype.kind in "biuf"
+
+    def bounds(self):
+        if self.values.size == 0:
+            return None
+        if self._bounds is None:
+            self._bounds = (self.values.min(), self.values.max())
+        return self._bounds
+
+
 class OutputCheckBase(BaseModel):
     model_config = ConfigDict(extra="forbid", frozen=True)
+    # Elementwise checks pass on an array iff they pass on every slice of it, so they can
+    # be evaluated block by block.
+    elementwise: ClassVar[bool] = False
+    # Streaming checks reduce the output into a mergeable accumulator, so they can also be
+    # fed block by block (and merged across workers) before being evaluated.
+    streaming: ClassVar[bool] = False
 
     kind: str
     name: str
@@ -58,6 +94,27 @@ class OutputCheckBase(BaseModel):
     def run(self, values: np.ndarray, *, spec: BaseFunctionSpec, count: int) -> CheckResult:
         raise NotImplementedError("output checks must implement run()")
 
+    def accumulator(self, spec: BaseFunctionSpec, count: int):
+        raise NotImplementedError("streaming output checks must implement accumulator()")
+
+    def evaluate(self, accumulator, *, spec: BaseFunctionSpec, count: int) -> CheckResult:
+        raise NotImplementedError("streaming output checks must implement evaluate()")
+
+    def passes(
+        self,
+        values: np.ndarray,
+        *,
+        spec: BaseFunctionSpec,
+        count: int,
+        summary: OutputSummary,
+    ) -> bool:
+        """Fast pass/fail decision that must agree with ``run(...).passed``.
+
+        Checks override this to answer from ``summary`` without building a
+        ``CheckResult``; the default falls back to ``run()``.
+        """
+        return self.run(values, spec=spec, count=count).passed
+
 
 class OneDimensionalCheck(OutputCheckBase):
     kind: Literal["one_dimensional"] = "one_dimensional"
@@ -68,6 +125,16 @@ class OneDimensionalCheck(OutputCheckBase):
         message = None if passed else f"expected 1D output but got ndim={values.ndim}"
         return CheckResult(name=self.name, passed=passed, message=message)
 
+    def passes(
+        self,
+        values: np.ndarray,
+        *,
+        spec: BaseFunctionSpec,
+        count: int,
+        summary: OutputSummary,
+    ) -> bool:
+        return values.ndim == 1
+
 
 class LengthCheck(OutputCheckBase):
     kind: Literal["length"] = "length"
@@ -82,39 +149,120 @@ class LengthCheck(OutputCheckBase):
         message = None if passed else f"expected length {count} but got {values.shape[0]}"
         return CheckResult(name=self.name, passed=passed, message=message)
 
+    def passes(
+        self,
+        values: np.ndarray,
+        *,
+        spec: BaseFunctionSpec,
+        count: int,
+        summary: OutputSummary,
+    ) -> bool:
+        return count > 0 and values.ndim == 1 and values.shape[0] == count
+
 
 class NumericDtypeCheck(OutputCheckBase):
+    """Require a numeric (or bool) output, or an exact dtype.
+
+    ``dtype`` always requires that exact dtype. ``dtype_field`` names a spec field
+    holding the declared output dtype; it is enforced only when the spec declares a
+    non-default dtype, so default specs keep accepting any numeric output.
+    """
+
     kind: Literal["numeric_dtype"] = "numeric_dtype"
     name: str = "numeric_dtype"
+    dtype: str | None = None
+    dtype_field: str | None = None
+
+    @model_validator(mode="after")
+    def validate_dtype_source(self) -> "NumericDtypeCheck":
+        if self.dtype is not None and self.dtype_field is not None:
+            raise ValueError("provide at most one of dtype or dtype_field")
+        if self.dtype is not None:
+            np.dtype(self.dtype)
+        return self
+
+    def _resolve_dtype(self, spec: BaseFunctionSpec) -> np.dtype | None:
+        if self.dtype_field is not None:
+            declared = getattr(spec, self.dtype_field)
+            field = type(spec).model_fields.get(self.dtype_field)
+            if field is not None and declared == field.default:
+                return None
+            return np.dtype(declared)
+        if self.dtype is not None:
+            return np.dtype(self.dtype)
+        return None
 
     def run(self, values: np.ndarray, *, spec: BaseFunctionSpec, count: int) -> CheckResult:
-        passed = np.issubdtype(values.dtype, np.number)
-        message = None if passed else f"expected numeric dtype but got {values.dtype}"
+        try:
+            expected = self._resolve_dtype(spec)
+        except (AttributeError, TypeError) as exc:
+            return CheckResult(name=self.name, passed=False, message=str(exc))
+        if expected is not None:
+            passed = values.dtype == expected
+            message = None if passed else f"expected dtype {expected} but got {values.dtype}"
+        else:
+            passed = _is_numeric(values.dtype)
+            message = None if passed else f"expected numeric dtype but got {values.dtype}"
         return CheckResult(name=self.name, passed=passed, message=message)
 
+    def passes(
+        self,
+        values: np.ndarray,
+        *,
+        spec: BaseFunctionSpec,
+        count: int,
+        summary: OutputSummary,
+    ) -> bool:
+        try:
+            expected = self._resolve_dtype(spec)
+        except (AttributeError, TypeError):
+            return False
+        if expected is None:
+            return _is_numeric(values.dtype)
+        return values.dtype == expected
+
 
 class FiniteValuesCheck(OutputCheckBase):
+    elementwise: ClassVar[bool] = True
+
     kind: Literal["finite_values"] = "finite_values"
     name: str = "finite_values"
 
     def run(self, values: np.ndarray, *, spec: BaseFunctionSpec, count: int) -> CheckResult:
-        if not np.issubdtype(values.dtype, np.number):
+        if not _is_numeric(values.dtype):
             return CheckResult(name=self.name, passed=False, message="finite check requires numeric dtype")
         passed = bool(np.isfinite(values).all())
         message = None if passed else "output contains NaN or infinite values"
         return CheckResult(name=self.name, passed=passed, message=message)
 
+    def passes(
+        self,
+        values: np.ndarray,
+        *,
+        spec: BaseFunctionSpec,
+        count: int,
+        summary: OutputSummary,
+    ) -> bool:
+        if values.dtype.kind in "biu":
+            return True
+        if values.dtype.kind != "f":
+            return super().passes(values, spec=spec, count=count, summary=summary)
+        bounds = summary.bounds()
+        return bounds is None or bool(np.isfinite(bounds[0]) and np.isfinite(bounds[1]))
+
 
 class InSetCheck(OutputCheckBase):
+    elementwise: ClassVar[bool] = True
+
     kind: Literal["in_set"] = "in_set"
     name: str = "in_set"
     allowed: tuple[FiniteStrictFloat, ...] = Field(min_length=1)
 
     def run(self, values: np.ndarray, *, spec: BaseFunctionSpec, count: int) -> CheckResult:
-        if not np.issubdtype(values.dtype, np.number):
+        if not _is_numeric(values.dtype):
             return CheckResult(name=self.name, passed=False, message="set check requires numeric dtype")
 
-        mask = np.isin(values, np.array(self.allowed))
+        mask = np.isin(values, self._allowed_array)
         passed = bool(mask.all())
         if passed:
             return CheckResult(name=self.name, passed=True)
@@ -123,8 +271,43 @@ class InSetCheck(OutputCheckBase):
         message = f"value {first_invalid!r} is not in allowed set {self.allowed!r}"
         return CheckResult(name=self.name, passed=False, message=message)
 
+    def passes(
+        self,
+        values: np.ndarray,
+        *,
+        spec: BaseFunctionSpec,
+        count: int,
+        summary: OutputSummary,
+    ) -> bool:
+        if not summary.is_real_numeric:
+            return super().passes(values, spec=spec, count=count, summary=summary)
+        bounds = summary.bounds()
+        if bounds is None:
+            return True
+        lower, upper = bounds
+        if lower not in self._allowed_set or upper not in self._allowed_set:
+            return False
+        if (
+            values.dtype.kind in "biu"
+            and int(upper) - int(lower) < len(self._allowed_set)
+            and all(value in self._allowed_set for value in range(int(lower), int(upper) + 1))
+        ):
+            # Every integer between the extremes is allowed, so every value is.
+            return True
+        return bool(np.isin(values, self._allowed_array).all())
+
+    @cached_property
+    def _allowed_array(self) -> np.ndarray:
+        return np.array(self.allowed)
+
+    @cached_property
+    def _allowed_set(self) -> frozenset[float]:
+        return frozenset(self.allowed)
+
 
 class InRangeCheck(OutputCheckBase):
+    elementwise: ClassVar[bool] = True
+
     kind: Literal["in_range"] = "in_range"
     name: str = "in_range"
     min_value: FiniteStrictFloat | None = None
@@ -161,7 +344,7 @@ class InRangeCheck(OutputCheckBase):
         return float(self.max_value)
 
     def run(self, values: np.ndarray, *, spec: BaseFunctionSpec, count: int) -> CheckResult:
-        if not np.issubdtype(values.dtype, np.number):
+        if not _is_numeric(values.dtype):
             return CheckResult(name=self.name, passed=False, message="range check requires numeric dtype")
 
         try:
@@ -194,6 +377,268 @@ class InRangeCheck(OutputCheckBase):
         )
         return CheckResult(name=self.name, passed=False, message=message)
 
+    def passes(
+        self,
+        values: np.ndarray,
+        *,
+        spec: BaseFunctionSpec,
+        count: int,
+        summary: OutputSummary,
+    ) -> bool:
+        if not summary.is_real_numeric:
+            return super().passes(values, spec=spec, count=count, summary=summary)
+        try:
+            lower = self._resolve_min(spec)
+            upper = self._resolve_max(spec)
+        except (AttributeError, TypeError, ValueError):
+            return False
+        if lower > upper:
+            return False
+
+        bounds = summary.bounds()
+        if bounds is None:
+            return True
+        smallest, largest = bounds
+        lower_ok = smallest >= lower if self.include_min else smallest > lower
+        upper_ok = largest <= upper if self.include_max else largest < upper
+        return bool(lower_ok and upper_ok)
+
+
+class StreamingCheckBase(OutputCheckBase):
+    streaming: ClassVar[bool] = True
+
+    def run(self, values: np.ndarray, *, spec: BaseFunctionSpec, count: int) -> CheckResult:
+        if values.ndim != 1 or not _is_numeric(values.dtype):
+            return CheckResult(
+                name=self.name,
+                passed=False,
+                message=f"{self.kind} check requires 1D numeric output",
+            )
+        try:
+            accumulator = self.accumulator(spec, count)
+        except (NotImplementedError, ValueError) as exc:
+            return CheckResult(name=self.name, passed=False, message=str(exc))
+        accumulator.update(values)
+        return self.evaluate(accumulator, spec=spec, count=count)
+
+
+class MomentCheck(StreamingCheckBase):
+    """Compare the output's mean and variance with ``spec.analytic_moments()``.
+
+    Each may deviate by ``max_z`` standard errors of the sample statistic, widened by the
+    output dtype's spacing near the analytic values to allow for rounding.
+    """
+
+    kind: Literal["moments"] = "moments"
+    name: str = "moments"
+    max_z: float = Field(default=6.0, gt=0)
+
+    def accumulator(self, spec: BaseFunctionSpec, count: int) -> MomentAccumulator:
+        return MomentAccumulator()
+
+    def evaluate(
+        self,
+        accumulator: MomentAccumulator,
+        *,
+        spec: BaseFunctionSpec,
+        count: int,
+    ) -> CheckResult:
+        try:
+            moments = spec.analytic_moments()
+        except NotImplementedError as exc:
+            return CheckResult(name=self.name, passed=False, message=str(exc))
+        n = accumulator.count
+        if n == 0:
+            return CheckResult(name=self.name, passed=False, message="moment check requires output")
+
+        stddev = math.sqrt(moments.variance)
+        resolution = _resolution(accumulator.dtype, abs(moments.mean) + self.max_z * stddev)
+        mean_tolerance = self.max_z * stddev / math.sqrt(n) + resolution
+        if not abs(accumulator.mean - moments.mean) <= mean_tolerance:
+            message = (
+                f"mean {accumulator.mean!r} differs from analytic mean {moments.mean!r} "
+                f"by more than {mean_tolerance:.6g}"
+            )
+            return CheckResult(name=self.name, passed=False, message=message)
+
+        # Exact mean and variance of the ddof=0 sample variance for n draws.
+        expected_variance = moments.variance * (n - 1) / n
+        variance_of_variance = 0.0
+        if n > 1:
+            variance_of_variance = max(
+                0.0,
+                (n - 1) ** 2
+                / n**3
+                * (moments.fourth_central_moment - (n - 3) / (n - 1) * moments.variance**2),
+            )
+        variance_tolerance = (
+            self.max_z * math.sqrt(variance_of_variance)
+            + 2.0 * stddev * resolution
+            + resolution**2
+        )
+        if not abs(accumulator.variance - expected_variance) <= variance_tolerance:
+            message = (
+                f"variance {accumulator.variance!r} differs from expected "
+                f"{expected_variance!r} by more than {variance_tolerance:.6g}"
+            )
+            return CheckResult(name=self.name, passed=False, message=message)
+        return CheckResult(name=self.name, passed=True)
+
+
+class HistogramCheck(StreamingCheckBase):
+    """Chi-square goodness-of-fit test against ``spec.analytic_histogram(bins)``.
+
+    The bin count is capped at ``count // 5`` (at least 2) so that small outputs keep
+    about five expected values per bin. Outputs whose dtype is coarser than the bins
+    (e.g. float32 over a range of a few ulps) fail, since they cannot fill them evenly.
+    """
+
+    kind: Literal["histogram"] = "histogram"
+    name: str = "histogram"
+    bins: int = Field(default=32, ge=2)
+    alpha: float = Field(default=1e-6, gt=0, lt=1)
+
+    def _bins(self, count: int) -> int:
+        return min(self.bins, max(2, count // 5))
+
+    def accumulator(self, spec: BaseFunctionSpec, count: int) -> HistogramAccumulator:
+        edges, _probabilities = spec.analytic_histogram(self._bins(count))
+        return HistogramAccumulator(edges)
+
+    def evaluate(
+        self,
+        accumulator: HistogramAccumulator,
+        *,
+        spec: BaseFunctionSpec,
+        count: int,
+    ) -> CheckResult:
+        _edges, probabilities = spec.analytic_histogram(self._bins(count))
+        observed = accumulator.counts
+        n = int(observed.sum())
+        if n == 0:
+            return CheckResult(
+                name=self.name, passed=False, message="histogram check requires output"
+            )
+        support = probabilities > 0
+        outside = int(observed[~support].sum())
+        if outside:
+            message = f"{outside} values fall in bins with zero analytic probability"
+            return CheckResult(name=self.name, passed=False, message=message)
+        if support.sum() < 2:
+            return CheckResult(name=self.name, passed=True)
+
+        expected = n * probabilities[support]
+        statistic = float(((observed[support] - expected) ** 2 / expected).sum())
+        p_value = chi2_sf(statistic, int(support.sum()) - 1)
+        if p_value < self.alpha:
+            message = (
+                f"chi-square statistic {statistic:.6g} over {int(support.sum())} bins has "
+                f"p_value {p_value:.6g} below alpha={self.alpha:g}"
+            )
+            return CheckResult(name=self.name, passed=False, message=message)
+        return CheckResult(name=self.name, passed=True)
+
+
+class BlockwiseValidator:
+    """Runs a spec's output checks over an output that arrives in consecutive blocks.
+
+    Elementwise checks see each block as it is fed (sharing one summary per block) and
+    stop once they fail, and streaming checks fold each block into their accumulator. The
+    remaining checks only need shape and dtype, so ``finish`` runs them against
+    ``values``, which may be any array with the full output's shape and dtype, e.g. a
+    zero-stride ``np.broadcast_to`` view. Validators fed disjoint parts of one output
+    (e.g. by parallel workers) can be combined with ``merge`` before ``finish``.
+    """
+
+    __slots__ = ("spec", "count", "failures", "seen", "_pending", "_accumulators")
+
+    def __init__(self, spec: BaseFunctionSpec, *, count: int):
+        self.spec = spec
+        self.count = count
+        self.failures: dict[int, CheckResult] = {}
+        self.seen = 0
+        self._pending = [
+            index for index, check in enumerate(spec.output_checks) if check.elementwise
+        ]
+        self._accumulators = {}
+        for index, check in enumerate(spec.output_checks):
+            if not check.streaming:
+                continue
+            try:
+                self._accumulators[index] = check.accumulator(spec, count)
+            except (NotImplementedError, ValueError) as exc:
+                self.failures[index] = CheckResult(name=check.name, passed=False, message=str(exc))
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+    def feed(self, block: np.ndarray) -> bool:
+        """Check one block; return False once any elementwise check has failed."""
+        self.seen += block.shape[0] if block.ndim else 1
+        summary = OutputSummary(block)
+        for index in tuple(self._pending):
+            check = self.spec.output_checks[index]
+            if not check.passes(block, spec=self.spec, count=self.count, summary=summary):
+                self.failures[index] = check.run(block, spec=self.spec, count=self.count)
+                self._pending.remove(index)
+        if self._accumulators:
+            if block.ndim == 1 and _is_numeric(block.dtype):
+                for accumulator in self._accumulators.values():
+                    accumulator.update(block)
+            else:
+                for index in self._accumulators:
+                    check = self.spec.output_checks[index]
+                    self.failures[index] = check.run(block, spec=self.spec, count=self.count)
+                self._accumulators.clear()
+        return not self.failures
+
+    def merge(self, other: "BlockwiseValidator") -> "BlockwiseValidator":
+        """Fold in a validator that was fed a disjoint part of the same output."""
+        if other.spec is not self.spec or other.count != self.count:
+            raise ValueError("can only merge validators for the same spec and count")
+        for index, result in other.failures.items():
+            self.failures.setdefault(index, result)
+            if index in self._pending:
+                self._pending.remove(index)
+        for index in tuple(self._accumulators):
+            if index in self.failures:
+                del self._accumulators[index]
+            else:
+                self._accumulators[index].merge(other._accumulators[index])
+        self.seen += other.seen
+        return self
+
+    def finish(self, values: np.ndarray) -> OutputVerificationReport | None:
+        """Run the non-elementwise checks; return a report if anything failed, else None.
+
+        Streaming checks are only evaluated once the full ``count`` values were fed.
+        """
+        summary = OutputSummary(values)
+        for index, check in enumerate(self.spec.output_checks):
+            if check.elementwise or index in self.failures:
+                continue
+            if check.streaming:
+                if self.seen == self.count:
+                    result = check.evaluate(
+                        self._accumulators[index], spec=self.spec, count=self.count
+                    )
+                    if not result.passed:
+                        self.failures[index] = result
+                continue
+            if not check.passes(values, spec=self.spec, count=self.count, summary=summary):
+                self.failures[index] = check.run(values, spec=self.spec, count=self.count)
+        if not self.failures:
+            return None
+        return OutputVerificationReport(
+            family=self.spec.family,
+            passed=False,
+            results=tuple(
+                self.failures.get(index, CheckResult(name=check.name, passed=True))
+                for index, check in enumerate(self.spec.output_checks)
+            ),
+        )
+
 
 OutputCheck = Annotated[
     OneDimensionalCheck
@@ -201,15 +646,29 @@ OutputCheck = Annotated[
     | NumericDtypeCheck
     | FiniteValuesCheck
     | InSetCheck
-    | InRangeCheck,
+    | InRangeCheck
+    | MomentCheck
+    | HistogramCheck,
     Field(discriminator="kind"),
 ]
 
 
-def default_output_checks() -> tuple[OutputCheck, ...]:
+def default_output_checks(*, dtype_field: str | None = None) -> tuple[OutputCheck, ...]:
     return (
         OneDimensionalCheck(),
         LengthCheck(),
-        NumericDtypeCheck(),
+        NumericDtypeCheck(dtype_field=dtype_field),
         FiniteValuesCheck(),
     )
+
+
+def _resolution(dtype: np.dtype | None, magnitude: float) -> float:
+    """Spacing of ``dtype`` near ``magnitude``; zero for exact (bool and integer) outputs."""
+    if dtype is None or dtype.kind != "f":
+        return 0.0
+    return float(np.spacing(dtype.type(magnitude)))
+
+
+def _is_numeric(dtype: np.dtype) -> bool:
+    # Bool outputs are accepted as compact 0/1 values.
+    return dtype.kind == "b" or bool(np.issubdtype(dtype, np.number))
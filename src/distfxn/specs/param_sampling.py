@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import cached_property
+
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -37,6 +39,21 @@ class UniformFloatParamSampler(BaseModel):
             raise SamplingSpecError(f"sampler '{self.name}' produced a non-finite value")
         return value
 
+    def sample_many(
+        self,
+        rng: np.random.Generator,
+        n: int,
+        *,
+        context: dict[str, np.ndarray] | None = None,
+    ) -> np.ndarray:
+        del context
+        if n <= 0:
+            raise ValueError("n must be greater than 0")
+        values = rng.uniform(self.min_value, self.max_value, size=n)
+        if not np.isfinite(values).all():
+            raise SamplingSpecError(f"sampler '{self.name}' produced a non-finite value")
+        return values
+
 
 class LogUniformPositiveFloatParamSampler(BaseModel):
     """Samples a finite positive float log-uniformly from [min_value, max_value]."""
@@ -60,14 +77,37 @@ class LogUniformPositiveFloatParamSampler(BaseModel):
         context: dict[str, float] | None = None,
     ) -> float:
         del context
-        log_min = float(np.log(self.min_value))
-        log_max = float(np.log(self.max_value))
-        if not np.isfinite(log_min) or not np.isfinite(log_max):
-            raise SamplingSpecError(f"sampler '{self.name}' has invalid log-space bounds")
-
+        log_min, log_max = self.log_bounds
         value = float(np.exp(rng.uniform(log_min, log_max)))
         if not np.isfinite(value):
             raise SamplingSpecError(f"sampler '{self.name}' produced a non-finite value")
         if value <= 0.0:
             raise SamplingSpecError(f"sampler '{self.name}' produced a non-positive value")
         return value
+
+    def sample_many(
+        self,
+        rng: np.random.Generator,
+        n: int,
+        *,
+        context: dict[str, np.ndarray] | None = None,
+    ) -> np.ndarray:
+        del context
+        if n <= 0:
+            raise ValueError("n must be greater than 0")
+        log_min, log_max = self.log_bounds
+        values = rng.uniform(log_min, log_max, size=n)
+        np.exp(values, out=values)
+        if not np.isfinite(values).all():
+            raise SamplingSpecError(f"sampler '{self.name}' produced a non-finite value")
+        if not (values > 0.0).all():
+            raise SamplingSpecError(f"sampler '{self.name}' produced a non-positive value")
+        return values
+
+    @cached_property
+    def log_bounds(self) -> tuple[float, float]:
+        log_min = float(np.log(self.min_value))
+        log_max = float(np.log(self.max_value))
+        if not np.isfinite(log_min) or not np.isfinite(log_max):
+            raise SamplingSpecError(f"sampler '{self.name}' has invalid log-space bounds")
+        return log_min, log_max
@@ -1,14 +1,26 @@
-from collections.abc import Mapping
-from typing import Any
+from __future__ import annotations
 
-from .base import BaseFunctionSpec
+from collections.abc import Iterable, Mapping
+from importlib import import_module
+from typing import TYPE_CHECKING, Annotated, Any, Union
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+    from .base import BaseFunctionSpec
+    from .batch import BaseSpecBatch
 
 
 class FamilyRegistry:
     def __init__(self):
         self._families: dict[str, type[BaseFunctionSpec]] = {}
+        self._batches: dict[str, type[BaseSpecBatch]] = {}
+        self._lazy: dict[str, tuple[str, str, str | None]] = {}
+        self._list_adapter: TypeAdapter | None = None
 
     def register(self, spec_cls: type[BaseFunctionSpec]) -> None:
+        from .base import BaseFunctionSpec
+
         if not issubclass(spec_cls, BaseFunctionSpec):
             raise TypeError(f"{spec_cls!r} must inherit from BaseFunctionSpec")
 
@@ -16,17 +28,64 @@ class FamilyRegistry:
         if not isinstance(family, str) or not family:
             raise ValueError(f"{spec_cls.__name__}.family must be a non-empty string literal")
 
+        self._load_lazy(family)
         existing = self._families.get(family)
         if existing is not None and existing is not spec_cls:
             raise ValueError(f"family '{family}' already registered for {existing.__name__}")
 
-        self._families[family] = spec_cls
+        if existing is None:
+            self._families[family] = spec_cls
+            self._list_adapter = None
+
+    def register_lazy(
+        self,
+        family: str,
+        module: str,
+        spec_attr: str,
+        batch_attr: str | None = None,
+    ) -> None:
+        """Declare a family whose module is only imported the first time it is looked up."""
+        if not family:
+            raise ValueError("family must be a non-empty string")
+        target = (module, spec_attr, batch_attr)
+        pending = self._lazy.get(family)
+        if family in self._families or (pending is not None and pending != target):
+            raise ValueError(f"family '{family}' is already registered")
+        self._lazy[family] = target
+
+    def register_batch(self, batch_cls: type[BaseSpecBatch]) -> None:
+        from .batch import BaseSpecBatch
+
+        if not issubclass(batch_cls, BaseSpecBatch):
+            raise TypeError(f"{batch_cls!r} must inherit from BaseSpecBatch")
+
+        family = batch_cls.family()
+        self._load_lazy(family)
+        if self._families.get(family) is not batch_cls.spec_cls:
+            raise ValueError(
+                f"{batch_cls.__name__}.spec_cls must be the registered spec class for family "
+                f"'{family}'"
+            )
+
+        existing = self._batches.get(family)
+        if existing is not None and existing is not batch_cls:
+            raise ValueError(f"batch for family '{family}' already registered for {existing.__name__}")
+
+        self._batches[family] = batch_cls
+
+    def get_batch(self, family: str) -> type[BaseSpecBatch]:
+        self.get(family)
+        try:
+            return self._batches[family]
+        except KeyError as exc:
+            raise KeyError(f"family '{family}' has no registered spec batch") from exc
 
     def get(self, family: str) -> type[BaseFunctionSpec]:
+        self._load_lazy(family)
         try:
             return self._families[family]
         except KeyError as exc:
-            available = ", ".join(sorted(self._families)) or "<none>"
+            available = ", ".join(self.list_families()) or "<none>"
             raise KeyError(f"unknown family '{family}'. available families: {available}") from exc
 
     def parse(self, data: Mapping[str, Any]) -> BaseFunctionSpec:
@@ -36,8 +95,93 @@ class FamilyRegistry:
         spec_cls = self.get(family_value)
         return spec_cls.model_validate(data)
 
+    def parse_many(self, payloads: Iterable[Mapping[str, Any]]) -> tuple[BaseFunctionSpec, ...]:
+        return tuple(self._get_list_adapter().validate_python(list(payloads)))
+
+    def parse_json(self, data: str | bytes) -> tuple[BaseFunctionSpec, ...]:
+        """Parse a JSON array of spec payloads straight from JSON text or bytes."""
+        return tuple(self._get_list_adapter().validate_json(data))
+
+    def parse_json_lines(self, data: str | bytes) -> tuple[BaseFunctionSpec, ...]:
+        """Parse JSONL (one payload per line, blank lines ignored) in a single validation call.
+
+        Invalid input raises ``ValueError`` naming the first bad line (1-based).
+        """
+        from pydantic import ValidationError
+
+        raw = data.encode() if isinstance(data, str) else data
+        numbered = [
+            (line_number, line)
+            for line_number, line in enumerate(raw.splitlines(), start=1)
+            if line.strip()
+        ]
+        try:
+            return self.parse_json(b"[" + b",".join(line for _, line in numbered) + b"]")
+        except ValidationError as exc:
+            # Only failing input pays for revalidating line by line to locate the error.
+            adapter = self._get_list_adapter()
+            for line_number, line in numbered:
+                try:
+                    adapter.validate_json(b"[" + line + b"]")
+                except ValidationError as line_exc:
+                    raise ValueError(f"line {line_number}: {line_exc}") from exc
+            raise
+
+    def spec_union(self) -> Any:
+        """Discriminated union of every registered spec class, keyed on ``family``."""
+        from pydantic import Field
+
+        self.load_all()
+        spec_classes = tuple(self._families.values())
+        if not spec_classes:
+            raise KeyError("no families registered")
+        if len(spec_classes) == 1:
+            return spec_classes[0]
+        return Annotated[Union[spec_classes], Field(discriminator="family")]
+
+    def _get_list_adapter(self) -> TypeAdapter:
+        # Bulk parsing validates against a discriminated union of the registered families.
+        # The compiled adapter is cached and rebuilt after a new family is registered.
+        from pydantic import PydanticUserError, TypeAdapter
+
+        self.load_all()
+        adapter = self._list_adapter
+        if adapter is not None:
+            return adapter
+
+        try:
+            adapter = TypeAdapter(list[self.spec_union()])
+        except PydanticUserError as exc:
+            raise TypeError(
+                "bulk parsing requires every registered family to declare 'family' as a Literal"
+            ) from exc
+        self._list_adapter = adapter
+        return adapter
+
+    def load_all(self) -> None:
+        for family in tuple(self._lazy):
+            self._load_lazy(family)
+
+    def _load_lazy(self, family: str) -> None:
+        target = self._lazy.get(family)
+        if target is None:
+            return
+        module_name, spec_attr, batch_attr = target
+        module = import_module(module_name)
+        del self._lazy[family]
+        self.register(getattr(module, spec_attr))
+        if batch_attr is not None:
+            self.register_batch(getattr(module, batch_attr))
+
     def list_families(self) -> tuple[str, ...]:
-        return tuple(sorted(self._families))
+        return tuple(sorted({*self._families, *self._lazy}))
 
 
 FAMILY_REGISTRY = FamilyRegistry()
+for _family, _spec_attr, _batch_attr in (
+    ("bernoulli", "BernoulliSpec", "BernoulliSpecBatch"),
+    ("uniform", "UniformSpec", "UniformSpecBatch"),
+    ("normal", "NormalSpec", "NormalSpecBatch"),
+):
+    FAMILY_REGISTRY.register_lazy(_family, f"{__package__}.{_family}", _spec_attr, _batch_attr)
+del _family, _spec_attr, _batch_attr
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from types import CodeType
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RenderCacheStats(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
+
+
+class RenderCache:
+    """Bounded LRU cache of compiled ``render()`` sources and their ``sample_dist``.
+
+    Entries are keyed by the rendered source, so equal specs (and distinct specs that
+    render identically) share one compiled callable.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self._entries: OrderedDict[str, tuple[CodeType, Callable[..., Any]]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._max_size = 0
+        self.max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("max_size must be greater than or equal to 0")
+        with self._lock:
+            self._max_size = value
+            self._evict_over_capacity()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_callable(self, source: str) -> Callable[..., Any]:
+        with self._lock:
+            entry = self._entries.get(source)
+            if entry is not None:
+                self._entries.move_to_end(source)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+
+        code, sample_dist = compile_sample_dist(source)
+
+        with self._lock:
+            if self._max_size > 0:
+                self._entries[source] = (code, sample_dist)
+                self._entries.move_to_end(source)
+                self._evict_over_capacity()
+        return sample_dist
+
+    def stats(self) -> RenderCacheStats:
+        with self._lock:
+            return RenderCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _evict_over_capacity(self) -> None:
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+def compile_sample_dist(source: str) -> tuple[CodeType, Callable[..., Any]]:
+    code = compile(source, "<rendered sample_dist>", "exec")
+    namespace = {}
+    exec(code, namespace, namespace)
+    sample_dist = namespace.get("sample_dist")
+    if not callable(sample_dist):
+        raise ValueError("render() must define a callable named 'sample_dist'")
+    return code, sample_dist
+
+
+RENDER_CACHE = RenderCache()
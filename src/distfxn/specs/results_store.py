@@ -0,0 +1,183 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .base import FINGERPRINT_DIGEST_SIZE, BaseFunctionSpec
+from .equivalence_cases import EquivalenceCase
+from .verification import (
+    CandidateSampler,
+    SpecVerificationReport,
+    run_equivalence_cases,
+    run_render_equivalence_cases,
+)
+
+ResultKey = tuple[str, str, str, str]
+
+RENDER_CANDIDATE_PREFIX = "render:"
+_COMMIT_EVERY = 256
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verified (
+    fingerprint TEXT NOT NULL,
+    cases TEXT NOT NULL,
+    candidate TEXT NOT NULL,
+    numpy_version TEXT NOT NULL,
+    report TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (fingerprint, cases, candidate, numpy_version)
+) WITHOUT ROWID
+"""
+
+
+def cases_digest(cases: tuple[EquivalenceCase, ...]) -> str:
+    payload = json.dumps([case.model_dump() for case in cases], separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=FINGERPRINT_DIGEST_SIZE).hexdigest()
+
+
+def render_candidate_id(spec: BaseFunctionSpec) -> str:
+    """Candidate identity of ``spec.render()``: a hash of the rendered source."""
+    digest = hashlib.blake2b(spec.render().encode(), digest_size=FINGERPRINT_DIGEST_SIZE)
+    return f"{RENDER_CANDIDATE_PREFIX}{digest.hexdigest()}"
+
+
+class VerificationResultStore:
+    """SQLite-backed record of passing verification reports, for incremental re-runs.
+
+    Reports are keyed by (spec fingerprint, digest of the equivalence cases, candidate
+    id, numpy version), so a change to any of them triggers re-verification. The rendered
+    candidate is identified by a hash of ``render()``; other candidates need an explicit
+    ``candidate_id`` that changes whenever their implementation does. Only passing
+    reports are recorded, so failures (including transient sampler errors) are always
+    retried. Writes are committed in batches; use ``flush``/``close`` or the context
+    manager to persist them. A store may be shared by threads; a lock serializes access
+    to its connection.
+    """
+
+    def __init__(self, path: str | Path = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+        self._uncommitted = 0
+
+    @staticmethod
+    def key(
+        spec: BaseFunctionSpec,
+        *,
+        cases: tuple[EquivalenceCase, ...] | None = None,
+        candidate_id: str | None = None,
+    ) -> ResultKey:
+        """Store key; ``cases`` defaults to the spec's own and ``candidate_id`` to its render."""
+        resolved_cases = cases if cases is not None else spec.all_equivalence_cases()
+        return (
+            spec.fingerprint,
+            cases_digest(resolved_cases),
+            candidate_id if candidate_id is not None else render_candidate_id(spec),
+            np.__version__,
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM verified").fetchone()[0]
+
+    def get(
+        self,
+        spec: BaseFunctionSpec,
+        *,
+        cases: tuple[EquivalenceCase, ...] | None = None,
+        candidate_id: str | None = None,
+    ) -> SpecVerificationReport | None:
+        key = self.key(spec, cases=cases, candidate_id=candidate_id)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT report FROM verified "
+                "WHERE fingerprint = ? AND cases = ? AND candidate = ? AND numpy_version = ?",
+                key,
+            ).fetchone()
+        if row is None:
+            return None
+        return SpecVerificationReport.model_validate_json(row[0])
+
+    def put(
+        self,
+        spec: BaseFunctionSpec,
+        report: SpecVerificationReport,
+        *,
+        cases: tuple[EquivalenceCase, ...] | None = None,
+        candidate_id: str | None = None,
+    ) -> bool:
+        """Record ``report`` if it passed; returns whether it was recorded."""
+        if not report.passed:
+            return False
+        row = (
+            *self.key(spec, cases=cases, candidate_id=candidate_id),
+            report.model_dump_json(),
+            time.time(),
+        )
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO verified VALUES (?, ?, ?, ?, ?, ?)", row
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= _COMMIT_EVERY:
+                self._commit()
+        return True
+
+    def verify(
+        self,
+        spec: BaseFunctionSpec,
+        candidate_sampler: CandidateSampler | None = None,
+        *,
+        candidate_id: str | None = None,
+        cases: tuple[EquivalenceCase, ...] | None = None,
+    ) -> SpecVerificationReport:
+        """Return the stored report for this combination, or verify and record it.
+
+        Without ``candidate_sampler`` the spec's rendered source is verified.
+        """
+        if candidate_sampler is not None and candidate_id is None:
+            raise ValueError("candidate_id is required when candidate_sampler is provided")
+        report = self.get(spec, cases=cases, candidate_id=candidate_id)
+        if report is not None:
+            return report
+        if candidate_sampler is None:
+            report = run_render_equivalence_cases(spec, cases=cases)
+        else:
+            report = run_equivalence_cases(spec, candidate_sampler, cases=cases)
+        self.put(spec, report, cases=cases, candidate_id=candidate_id)
+        return report
+
+    def prune(self) -> int:
+        """Delete reports recorded under other numpy versions; returns how many."""
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM verified WHERE numpy_version != ?", (np.__version__,)
+            )
+            self._commit()
+            return cursor.rowcount
+
+    def flush(self) -> None:
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit()
+            self._connection.close()
+
+    def _commit(self) -> None:
+        self._connection.commit()
+        self._uncommitted = 0
+
+    def __enter__(self) -> "VerificationResultStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
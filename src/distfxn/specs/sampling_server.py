@@ -0,0 +1,40 @@
+import asyncio
+import json
+
+import numpy as np
+
+from .base import BaseFunctionSpec
+from .corpus import spec_payload
+
+# Wire protocol, one exchange per line on a persistent TCP connection:
+#   request:  {"spec": <spec payload>, "seed": int, "count": int}\n
+#   response: {"ok": true, "dtype": "<f8", "count": n}\n followed by the raw output bytes,
+#             or {"ok": false, "error": "..."}\n
+
+
+class RemoteCandidateSampler:
+    """Async candidate sampler that requests outputs from a sampling server.
+
+    Instances are ``AsyncCandidateSampler`` callables. Each call uses its own connection,
+    so concurrent calls do not wait on each other.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+
+    async def __call__(self, spec: BaseFunctionSpec, seed: int, count: int) -> np.ndarray:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            request = {"spec": spec_payload(spec), "seed": seed, "count": count}
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            header = json.loads(await reader.readline())
+            if not header["ok"]:
+                raise RuntimeError(f"sampling server error: {header['error']}")
+            dtype = np.dtype(header["dtype"])
+            body = await reader.readexactly(header["count"] * dtype.itemsize)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+        return np.frombuffer(body, dtype=dtype)
@@ -0,0 +1,131 @@
+from collections.abc import Callable
+
+import numpy as np
+
+from .base import BaseFunctionSpec
+from .equivalence_cases import EquivalenceCase
+from .output_checks import NumericDtypeCheck
+from .stats import chi_square_2samp, ks_2samp
+from .verification import (
+    CandidateSampler,
+    CaseVerificationReport,
+    SpecVerificationReport,
+    StatisticalTestResult,
+    _failure_reasons,
+    _sampler_error_report,
+    render_to_callable,
+)
+
+DEFAULT_ALPHA = 1e-3
+DEFAULT_SAMPLE_SIZE = 10_000
+# Mixed into the case seed so the reference sample is independent of the candidate's.
+_REFERENCE_STREAM = 0x5A17
+
+STATISTICAL_TESTS: dict[str, Callable[..., tuple[float, float]]] = {
+    "ks": ks_2samp,
+    "chi_square": chi_square_2samp,
+}
+
+
+def run_statistical_equivalence_cases(
+    spec: BaseFunctionSpec,
+    candidate_sampler: CandidateSampler | None = None,
+    *,
+    cases: tuple[EquivalenceCase, ...] | None = None,
+    alpha: float = DEFAULT_ALPHA,
+    sample_size: int | None = DEFAULT_SAMPLE_SIZE,
+) -> SpecVerificationReport:
+    """Check that ``candidate_sampler`` matches ``spec.sample_dist`` in distribution.
+
+    Unlike ``run_equivalence_cases``, outputs need not be bit-identical: for each case the
+    candidate draws ``sample_size`` values (``case.count`` if None) from
+    ``default_rng(case.seed)``, ``spec.sample_dist`` draws an independent reference sample
+    of the same size, and the spec's ``statistical_test`` must not reject at ``alpha``.
+    Both outputs must still pass the spec's output checks, except that the candidate may
+    use any numeric dtype (e.g. bool or float32 for a faster sampler). Outputs are not
+    compared exactly, so reports leave ``exact_output_match`` unset. The rendered sampler
+    is used when ``candidate_sampler`` is None.
+    """
+    resolved_cases = cases if cases is not None else spec.all_equivalence_cases()
+    if len(resolved_cases) == 0:
+        raise ValueError("at least one equivalence case is required")
+    if not 0.0 < alpha < 1.0:
+        raise ValueError("alpha must be between 0 and 1")
+    if sample_size is not None and sample_size <= 0:
+        raise ValueError("sample_size must be greater than 0")
+    try:
+        two_sample_test = STATISTICAL_TESTS[spec.statistical_test]
+    except KeyError:
+        raise ValueError(
+            f"unknown statistical test '{spec.statistical_test}' for family '{spec.family}'"
+        ) from None
+    if candidate_sampler is None:
+        rendered_sample_dist = render_to_callable(spec)
+
+        def candidate_sampler(_spec, rng, count):
+            return rendered_sample_dist(rng, count)
+
+    candidate_checks_spec = spec.model_copy(
+        update={
+            "output_checks": tuple(
+                NumericDtypeCheck(name=check.name) if isinstance(check, NumericDtypeCheck) else check
+                for check in spec.output_checks
+            )
+        }
+    )
+
+    case_reports = []
+    for case in resolved_cases:
+        count = sample_size if sample_size is not None else case.count
+        reference_output = None
+        try:
+            reference_output = spec.sample_dist(
+                np.random.default_rng([_REFERENCE_STREAM, case.seed]), count
+            )
+            canonical_report = spec.validate_output(reference_output, count=count)
+        except Exception as exc:
+            canonical_report = _sampler_error_report(spec, f"canonical sampler failed: {exc!r}")
+
+        candidate_output = None
+        try:
+            candidate_output = candidate_sampler(spec, np.random.default_rng(case.seed), count)
+            candidate_report = candidate_checks_spec.validate_output(candidate_output, count=count)
+        except Exception as exc:
+            candidate_report = _sampler_error_report(spec, f"candidate sampler failed: {exc!r}")
+
+        if canonical_report.passed and candidate_report.passed:
+            statistic, p_value = two_sample_test(reference_output, candidate_output)
+            statistical_test = StatisticalTestResult(
+                test=spec.statistical_test,
+                statistic=statistic,
+                p_value=p_value,
+                alpha=alpha,
+                sample_size=count,
+                passed=p_value >= alpha,
+            )
+        else:
+            statistical_test = StatisticalTestResult(
+                test=spec.statistical_test, alpha=alpha, sample_size=count, passed=False
+            )
+        case_reports.append(
+            CaseVerificationReport(
+                case=case,
+                canonical_output_report=canonical_report,
+                candidate_output_report=candidate_report,
+                exact_output_match=None,
+                passed=statistical_test.passed,
+                failure_reasons=_failure_reasons(
+                    canonical_output_report=canonical_report,
+                    candidate_output_report=candidate_report,
+                    exact_output_match=None,
+                    statistical_test=statistical_test,
+                ),
+                statistical_test=statistical_test,
+            )
+        )
+
+    return SpecVerificationReport(
+        family=spec.family,
+        passed=all(case_report.passed for case_report in case_reports),
+        case_reports=tuple(case_reports),
+    )
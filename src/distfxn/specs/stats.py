@@ -0,0 +1,108 @@
+import math
+
+import numpy as np
+
+_MAX_ITERATIONS = 500
+_EPSILON = 1e-15
+
+
+def ks_2samp(x, y) -> tuple[float, float]:
+    """Two-sample Kolmogorov-Smirnov test; returns (D statistic, asymptotic p-value)."""
+    x = np.sort(np.asarray(x, dtype=np.float64).ravel())
+    y = np.sort(np.asarray(y, dtype=np.float64).ravel())
+    n, m = x.shape[0], y.shape[0]
+    if n == 0 or m == 0:
+        raise ValueError("ks_2samp requires non-empty samples")
+    # Evaluating both empirical CDFs at every observed point handles ties exactly.
+    points = np.concatenate((x, y))
+    cdf_x = np.searchsorted(x, points, side="right") / n
+    cdf_y = np.searchsorted(y, points, side="right") / m
+    statistic = float(np.max(np.abs(cdf_x - cdf_y)))
+    effective_n = math.sqrt(n * m / (n + m))
+    return statistic, kolmogorov_sf((effective_n + 0.12 + 0.11 / effective_n) * statistic)
+
+
+def chi_square_2samp(x, y) -> tuple[float, float]:
+    """Chi-square test that two samples of a discrete variable share one distribution.
+
+    Categories are the distinct values observed in either sample; returns
+    (statistic, p-value) with ``categories - 1`` degrees of freedom.
+    """
+    x = np.asarray(x).ravel()
+    y = np.asarray(y).ravel()
+    if x.shape[0] == 0 or y.shape[0] == 0:
+        raise ValueError("chi_square_2samp requires non-empty samples")
+    categories, inverse = np.unique(np.concatenate((x, y)), return_inverse=True)
+    if categories.shape[0] < 2:
+        return 0.0, 1.0
+    observed = np.stack(
+        (
+            np.bincount(inverse[: x.shape[0]], minlength=categories.shape[0]),
+            np.bincount(inverse[x.shape[0] :], minlength=categories.shape[0]),
+        )
+    ).astype(np.float64)
+    expected = observed.sum(axis=1, keepdims=True) * observed.sum(axis=0) / observed.sum()
+    statistic = float(((observed - expected) ** 2 / expected).sum())
+    return statistic, chi2_sf(statistic, categories.shape[0] - 1)
+
+
+def kolmogorov_sf(value: float) -> float:
+    """Survival function of the Kolmogorov distribution."""
+    if value <= 0.0:
+        return 1.0
+    if value < 1.18:
+        # The alternating series converges slowly for small arguments; use the theta form.
+        factor = -(math.pi**2) / (8.0 * value * value)
+        total = sum(math.exp(factor * (2 * k - 1) ** 2) for k in range(1, 8))
+        return min(1.0, max(0.0, 1.0 - math.sqrt(2.0 * math.pi) / value * total))
+    total = 0.0
+    for k in range(1, 101):
+        term = math.exp(-2.0 * k * k * value * value)
+        total += term if k % 2 else -term
+        if term < _EPSILON:
+            break
+    return min(1.0, max(0.0, 2.0 * total))
+
+
+def chi2_sf(statistic: float, df: int) -> float:
+    """Survival function of the chi-square distribution with ``df`` degrees of freedom."""
+    if df <= 0:
+        raise ValueError("df must be greater than 0")
+    if statistic <= 0.0:
+        return 1.0
+    return _regularized_upper_gamma(df / 2.0, statistic / 2.0)
+
+
+def _regularized_upper_gamma(a: float, x: float) -> float:
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1.0:
+        # Series for the lower function P(a, x).
+        term = total = 1.0 / a
+        denominator = a
+        for _ in range(_MAX_ITERATIONS):
+            denominator += 1.0
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * _EPSILON:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+
+    # Continued fraction for Q(a, x) (modified Lentz).
+    tiny = 1e-300
+    b = x + 1.0 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    for i in range(1, _MAX_ITERATIONS):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < _EPSILON:
+            break
+    return min(1.0, math.exp(log_prefix) * h)
@@ -1,6 +1,7 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
 from pydantic import Field
 
 FiniteStrictFloat = Annotated[float, Field(strict=True, allow_inf_nan=False)]
 
+FloatOutputDtype = Literal["float64", "float32"]
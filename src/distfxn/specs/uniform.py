@@ -1,16 +1,19 @@
-from typing import Literal
+from collections.abc import Iterator
+from typing import ClassVar, Literal
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from .accumulators import AnalyticMoments
 from .base import BaseFunctionSpec
+from .batch import BaseSpecBatch
 from .output_checks import InRangeCheck, OutputCheck, default_output_checks
 from .param_sampling import (
     LogUniformPositiveFloatParamSampler,
     SamplingSpecError,
     UniformFloatParamSampler,
 )
-from .types import FiniteStrictFloat
+from .types import FiniteStrictFloat, FloatOutputDtype
 
 
 class UniformSamplingSpec(BaseModel):
@@ -33,11 +36,16 @@ class UniformSamplingSpec(BaseModel):
 
 
 class UniformSpec(BaseFunctionSpec):
+    chunk_invariant: ClassVar[bool] = True
+
     family: Literal["uniform"] = "uniform"
     start: FiniteStrictFloat
     end: FiniteStrictFloat
+    # "float32" draws ``rng.random(dtype=float32)``, scales it in float32, and clamps the
+    # result below float32(end) so rounding cannot reach the excluded upper bound.
+    output_dtype: FloatOutputDtype = "float64"
     output_checks: tuple[OutputCheck, ...] = Field(
-        default_factory=lambda: default_output_checks()
+        default_factory=lambda: default_output_checks(dtype_field="output_dtype")
         + (InRangeCheck(min_field="start", max_field="end", include_max=False),)
     )
 
@@ -45,16 +53,78 @@ class UniformSpec(BaseFunctionSpec):
     def validate_bounds(self) -> "UniformSpec":
         if self.start >= self.end:
             raise ValueError("start must be less than end")
+        if self.output_dtype == "float32":
+            with np.errstate(over="ignore"):
+                bounds = np.array([self.start, self.end, self.end - self.start], dtype=np.float32)
+            if not np.isfinite(bounds).all():
+                raise ValueError("start, end, and end - start must be finite in float32")
+            if bounds[0] >= bounds[1]:
+                raise ValueError("start must be less than end after rounding to float32")
         return self
 
     def sample_dist(self, rng, count: int):
-        return rng.uniform(self.start, self.end, size=count)
+        if self.output_dtype == "float64":
+            return rng.uniform(self.start, self.end, size=count)
+        out = np.empty(count, dtype=np.float32)
+        self.sample_dist_into(rng, out)
+        return out
 
     def render(self) -> str:
+        if self.output_dtype == "float64":
+            return (
+                "def sample_dist(rng, count):\n"
+                f"    return rng.uniform({self.start!r}, {self.end!r}, size=count)\n"
+            )
         return (
             "def sample_dist(rng, count):\n"
-            f"    return rng.uniform({self.start!r}, {self.end!r}, size=count)\n"
+            '    values = rng.random(count, dtype="float32")\n'
+            f"    values *= {self.end - self.start!r}\n"
+            f"    values += {self.start!r}\n"
+            f"    return values.clip(max={self._float32_upper()!r}, out=values)\n"
+        )
+
+    def sample_dist_into(self, rng, out: np.ndarray) -> None:
+        rng.random(out=out, dtype=out.dtype)
+        out *= self.end - self.start
+        out += self.start
+        if self.output_dtype == "float32":
+            out.clip(max=self._float32_upper(), out=out)
+
+    def _sample_dtype(self) -> np.dtype:
+        return np.dtype(self.output_dtype)
+
+    def _float32_upper(self) -> float:
+        return float(np.nextafter(np.float32(self.end), np.float32(-np.inf)))
+
+    def _render_fill_lines(self, rng_name: str, out_name: str) -> tuple[str, ...]:
+        lines = (
+            f"{rng_name}.random(out={out_name}, dtype={out_name}.dtype)",
+            f"{out_name} *= {self.end - self.start!r}",
+            f"{out_name} += {self.start!r}",
         )
+        if self.output_dtype == "float32":
+            lines += (f"{out_name}.clip(max={self._float32_upper()!r}, out={out_name})",)
+        return lines
+
+    def analytic_moments(self) -> AnalyticMoments:
+        width = self.end - self.start
+        return AnalyticMoments(
+            mean=self.start + width / 2.0,
+            variance=width**2 / 12.0,
+            fourth_central_moment=width**4 / 80.0,
+        )
+
+    def analytic_histogram(self, bins: int) -> tuple[np.ndarray, np.ndarray]:
+        edges = np.linspace(self.start, self.end, bins + 1)
+        probabilities = np.diff(edges) / (self.end - self.start)
+        # Nothing may fall below start or at or above end.
+        return edges, np.concatenate(([0.0], probabilities, [0.0]))
+
+    @classmethod
+    def sample_dist_batch(cls, rng, count: int, *, start, end):
+        start_column = np.asarray(start, dtype=np.float64)[:, None]
+        end_column = np.asarray(end, dtype=np.float64)[:, None]
+        return rng.uniform(start_column, end_column, size=(start_column.shape[0], count))
 
     @classmethod
     def edge_specs(cls) -> tuple["UniformSpec", ...]:
@@ -90,9 +160,38 @@ class UniformSpec(BaseFunctionSpec):
         count: int,
         sampling_spec: UniformSamplingSpec | None = None,
     ) -> tuple["UniformSpec", ...]:
+        return cls.sample_batch(rng, count=count, sampling_spec=sampling_spec).to_specs()
+
+    @classmethod
+    def sample_batch(
+        cls,
+        rng: np.random.Generator,
+        *,
+        count: int,
+        sampling_spec: UniformSamplingSpec | None = None,
+    ) -> "UniformSpecBatch":
         if count <= 0:
             raise ValueError("count must be greater than 0")
         resolved_sampling_spec = sampling_spec or UniformSamplingSpec()
-        return tuple(
-            cls.sample_spec(rng, sampling_spec=resolved_sampling_spec) for _ in range(count)
+        start_values = resolved_sampling_spec.start_sampler.sample_many(rng, count)
+        width_values = resolved_sampling_spec.width_sampler.sample_many(
+            rng,
+            count,
+            context={"start": start_values},
         )
+        end_values = start_values + width_values
+        if not np.isfinite(end_values).all():
+            raise SamplingSpecError("sampled uniform bounds produced a non-finite end value")
+        return UniformSpecBatch(start=start_values, end=end_values)
+
+
+class UniformSpecBatch(BaseSpecBatch):
+    spec_cls = UniformSpec
+    param_fields = ("start", "end")
+
+    __slots__ = ()
+
+    def invalid_rows(self) -> Iterator[tuple[np.ndarray, str]]:
+        yield ~np.isfinite(self.start), "start must be finite"
+        yield ~np.isfinite(self.end), "end must be finite"
+        yield ~(self.start < self.end), "start must be less than end"
@@ -1,33 +1,84 @@
+import time
 from collections.abc import Callable
+from contextlib import nullcontext
 from typing import Any
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict
 
 from .base import BaseFunctionSpec
+from .canonical_cache import CanonicalOutputCache
 from .equivalence_cases import EquivalenceCase
+from .golden_digests import GoldenDigestStore, output_digest
+from .instrumentation import (
+    AllocationTracker,
+    CaseTiming,
+    OutputSide,
+    PhaseRecorder,
+    VerificationHooks,
+)
 from .output_checks import CheckResult, OutputVerificationReport
+from .render_cache import RENDER_CACHE, RenderCache, compile_sample_dist
 
 CandidateSampler = Callable[[BaseFunctionSpec, np.random.Generator, int], Any]
 
 
+class StatisticalTestResult(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    test: str
+    # None when the test was not run because an output failed its checks.
+    statistic: float | None = None
+    p_value: float | None = None
+    alpha: float
+    sample_size: int
+    passed: bool
+
+    def to_line(self) -> str:
+        status = "PASS" if self.passed else "FAIL"
+        if self.p_value is None:
+            result = "not run"
+        else:
+            result = f"statistic={self.statistic:.6g} p_value={self.p_value:.6g}"
+        return f"[{status}] {self.test} {result} alpha={self.alpha:g} sample_size={self.sample_size}"
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
+
+
 class CaseVerificationReport(BaseModel):
     model_config = ConfigDict(extra="forbid", frozen=True)
 
     case: EquivalenceCase
     canonical_output_report: OutputVerificationReport
     candidate_output_report: OutputVerificationReport
-    exact_output_match: bool
+    # None when outputs were not compared exactly (statistical mode, or a comparison that
+    # stopped early).
+    exact_output_match: bool | None
     passed: bool
     failure_reasons: tuple[str, ...] = ()
+    first_mismatch_index: int | None = None
+    statistical_test: StatisticalTestResult | None = None
+    timing: CaseTiming | None = None
+    peak_allocated_bytes: int | None = None
 
     def to_lines(self) -> tuple[str, ...]:
         status = "PASS" if self.passed else "FAIL"
-        lines = [
-            f"[{status}] case '{self.case.name}' seed={self.case.seed} count={self.case.count}",
-            f"  exact_output_match: {self.exact_output_match}",
-            "  canonical:",
-        ]
+        header = f"[{status}] case '{self.case.name}' seed={self.case.seed} count={self.case.count}"
+        if self.statistical_test is not None:
+            header += f" sample_size={self.statistical_test.sample_size}"
+        lines = [header]
+        if self.exact_output_match is not None:
+            lines.append(f"  exact_output_match: {self.exact_output_match}")
+        if self.first_mismatch_index is not None:
+            lines.append(f"  first_mismatch_index: {self.first_mismatch_index}")
+        if self.statistical_test is not None:
+            lines.append(f"  statistical_test: {self.statistical_test.to_line()}")
+        if self.timing is not None:
+            lines.append(f"  timing: {self.timing.to_line()}")
+        if self.peak_allocated_bytes is not None:
+            lines.append(f"  peak_allocated_bytes: {self.peak_allocated_bytes}")
+        lines.append("  canonical:")
         lines.extend(f"    {line}" for line in self.canonical_output_report.to_lines())
         lines.append("  candidate:")
         lines.extend(f"    {line}" for line in self.candidate_output_report.to_lines())
@@ -68,13 +119,12 @@ CaseEquivalenceResult = CaseVerificationReport
 SpecEquivalenceReport = SpecVerificationReport
 
 
-def render_to_callable(spec: BaseFunctionSpec):
-    namespace = {}
-    exec(spec.render(), namespace, namespace)
-    sample_dist = namespace.get("sample_dist")
-    if not callable(sample_dist):
-        raise ValueError("render() must define a callable named 'sample_dist'")
-    return sample_dist
+def render_to_callable(spec: BaseFunctionSpec, *, cache: RenderCache | None = RENDER_CACHE):
+    source = spec.render()
+    if cache is None:
+        _code, sample_dist = compile_sample_dist(source)
+        return sample_dist
+    return cache.get_callable(source)
 
 
 def _sampler_error_report(spec: BaseFunctionSpec, message: str) -> OutputVerificationReport:
@@ -88,7 +138,9 @@ def _sampler_error_report(spec: BaseFunctionSpec, message: str) -> OutputVerific
 def _failure_reasons(
     canonical_output_report: OutputVerificationReport,
     candidate_output_report: OutputVerificationReport,
-    exact_output_match: bool,
+    exact_output_match: bool | None,
+    first_mismatch_index: int | None = None,
+    statistical_test: StatisticalTestResult | None = None,
 ) -> tuple[str, ...]:
     reasons = [
         f"canonical.{result.name}: {result.message or 'failed'}"
@@ -98,8 +150,15 @@ def _failure_reasons(
         f"candidate.{result.name}: {result.message or 'failed'}"
         for result in candidate_output_report.failed_results()
     )
-    if not exact_output_match:
-        reasons.append("exact_output_match: canonical and candidate outputs differ")
+    if statistical_test is not None and statistical_test.p_value is not None:
+        if not statistical_test.passed:
+            reasons.append(
+                f"{statistical_test.test}: p_value={statistical_test.p_value:.6g} is below "
+                f"alpha={statistical_test.alpha:g}"
+            )
+    elif exact_output_match is False:
+        location = "" if first_mismatch_index is None else f" at index {first_mismatch_index}"
+        reasons.append(f"exact_output_match: canonical and candidate outputs differ{location}")
     return tuple(reasons)
 
 
@@ -108,36 +167,125 @@ def run_equivalence_cases(
     candidate_sampler: CandidateSampler,
     *,
     cases: tuple[EquivalenceCase, ...] | None = None,
+    hooks: VerificationHooks | None = None,
+    timing: bool = False,
+    trace_allocations: bool = False,
+    canonical_cache: CanonicalOutputCache | None = None,
+    golden_store: GoldenDigestStore | None = None,
+    digest_only: bool = False,
 ) -> SpecVerificationReport:
+    """Compare ``candidate_sampler`` against ``spec.sample_dist`` on each equivalence case.
+
+    ``hooks`` receives callbacks around every phase and check. ``timing`` attaches
+    per-phase wall-clock durations to each case report, and ``trace_allocations`` attaches
+    the tracemalloc peak allocated during the case (starting tracemalloc if needed).
+    With ``canonical_cache``, canonical outputs are reused across calls instead of being
+    resampled.
+
+    With ``golden_store``, cases that have a recorded digest skip canonical sampling and
+    compare the candidate's output digest instead. ``digest_only`` requires a digest for
+    every case and also skips the candidate's output checks when its digest matches,
+    since it is then byte-identical to a validated canonical output. Digests cover dtype
+    and shape as well as values, so digest comparison is stricter than the exact
+    comparison: e.g. int32 0/1 output for an int64 Bernoulli spec matches exactly but
+    not by digest.
+    """
     resolved_cases = cases if cases is not None else spec.all_equivalence_cases()
     if len(resolved_cases) == 0:
         raise ValueError("at least one equivalence case is required")
+    if digest_only:
+        if golden_store is None:
+            raise ValueError("digest_only requires a golden_store")
+        for case in resolved_cases:
+            if golden_store.get(spec, case) is None:
+                raise KeyError(f"no golden digest for family '{spec.family}' case '{case.name}'")
 
     case_reports: list[CaseVerificationReport] = []
-
-    for case in resolved_cases:
-        canonical_output = None
-        try:
-            canonical_output = spec.sample_dist(np.random.default_rng(case.seed), case.count)
-            canonical_report = verify_output(spec, canonical_output, count=case.count)
-        except Exception as exc:
-            canonical_report = _sampler_error_report(spec, f"canonical sampler failed: {exc!r}")
-
-        candidate_output = None
-        try:
-            candidate_output = candidate_sampler(spec, np.random.default_rng(case.seed), case.count)
-            candidate_report = verify_output(spec, candidate_output, count=case.count)
-        except Exception as exc:
-            candidate_report = _sampler_error_report(spec, f"candidate sampler failed: {exc!r}")
-
-        exact_output_match = (
-            canonical_output is not None
-            and candidate_output is not None
-            and bool(np.array_equal(canonical_output, candidate_output))
-        )
-        passed = canonical_report.passed and candidate_report.passed and exact_output_match
-        case_reports.append(
-            CaseVerificationReport(
+    allocation_tracker = AllocationTracker() if trace_allocations else None
+
+    with allocation_tracker or nullcontext():
+        for case in resolved_cases:
+            if hooks is not None:
+                hooks.on_case_start(spec=spec, case=case)
+            if allocation_tracker is not None:
+                allocation_tracker.reset()
+            recorder = PhaseRecorder(hooks, spec=spec, case=case)
+
+            golden_digest = golden_store.get(spec, case) if golden_store is not None else None
+
+            # Only the samplers run inside the try blocks, so exceptions raised by hooks or
+            # output checks propagate instead of being reported as sampler failures.
+            canonical_output = None
+            if golden_digest is not None:
+                # Digests are only recorded for canonical outputs that passed validation.
+                canonical_report = spec.passing_output_report
+            else:
+                canonical_error = None
+                recorder.start("canonical_sampling")
+                try:
+                    if canonical_cache is not None:
+                        canonical_output = canonical_cache.get_or_sample(spec, case)
+                    else:
+                        canonical_output = spec.sample_dist(
+                            np.random.default_rng(case.seed), case.count
+                        )
+                except Exception as exc:
+                    canonical_error = exc
+                recorder.stop()
+                if canonical_error is not None:
+                    canonical_report = _sampler_error_report(
+                        spec, f"canonical sampler failed: {canonical_error!r}"
+                    )
+                else:
+                    recorder.start("canonical_verify")
+                    canonical_report = _verify_case_output(
+                        spec, canonical_output, case=case, side="canonical", hooks=hooks
+                    )
+                    recorder.stop()
+
+            candidate_output = None
+            candidate_error = None
+            digest_match = False
+            recorder.start("candidate_sampling")
+            try:
+                candidate_output = np.asarray(
+                    candidate_sampler(spec, np.random.default_rng(case.seed), case.count)
+                )
+            except Exception as exc:
+                candidate_error = exc
+            recorder.stop()
+            if candidate_error is not None:
+                candidate_report = _sampler_error_report(
+                    spec, f"candidate sampler failed: {candidate_error!r}"
+                )
+            else:
+                if golden_digest is not None:
+                    recorder.start("compare")
+                    digest_match = _matches_digest(candidate_output, golden_digest)
+                    recorder.stop()
+                recorder.start("candidate_verify")
+                if digest_only and digest_match:
+                    candidate_report = spec.passing_output_report
+                else:
+                    candidate_report = _verify_case_output(
+                        spec, candidate_output, case=case, side="candidate", hooks=hooks
+                    )
+                recorder.stop()
+
+            recorder.start("compare")
+            if golden_digest is not None:
+                exact_output_match = digest_match
+            else:
+                exact_output_match = (
+                    canonical_output is not None
+                    and candidate_output is not None
+                    and bool(np.array_equal(canonical_output, candidate_output))
+                )
+            recorder.stop()
+
+            recorder.start("report")
+            passed = canonical_report.passed and candidate_report.passed and exact_output_match
+            case_report = CaseVerificationReport(
                 case=case,
                 canonical_output_report=canonical_report,
                 candidate_output_report=candidate_report,
@@ -149,7 +297,22 @@ def run_equivalence_cases(
                     exact_output_match=exact_output_match,
                 ),
             )
-        )
+            recorder.stop()
+
+            if timing or allocation_tracker is not None:
+                case_report = case_report.model_copy(
+                    update={
+                        "timing": recorder.timing() if timing else None,
+                        "peak_allocated_bytes": (
+                            allocation_tracker.peak_bytes()
+                            if allocation_tracker is not None
+                            else None
+                        ),
+                    }
+                )
+            if hooks is not None:
+                hooks.on_case_end(spec=spec, case=case, report=case_report)
+            case_reports.append(case_report)
 
     return SpecVerificationReport(
         family=spec.family,
@@ -158,16 +321,61 @@ def run_equivalence_cases(
     )
 
 
+def _matches_digest(output, digest: str) -> bool:
+    try:
+        return output_digest(output) == digest
+    except (TypeError, ValueError):
+        return False
+
+
+def _verify_case_output(
+    spec: BaseFunctionSpec,
+    output,
+    *,
+    case: EquivalenceCase,
+    side: OutputSide,
+    hooks: VerificationHooks | None,
+) -> OutputVerificationReport:
+    if hooks is None:
+        return verify_output(spec, output, count=case.count)
+
+    values = np.asarray(output)
+    results = []
+    for check in spec.output_checks:
+        started = time.perf_counter()
+        result = check.run(values, spec=spec, count=case.count)
+        elapsed = time.perf_counter() - started
+        hooks.on_check(check, result, spec=spec, case=case, side=side, elapsed=elapsed)
+        results.append(result)
+    return OutputVerificationReport(
+        family=spec.family,
+        passed=all(result.passed for result in results),
+        results=tuple(results),
+    )
+
+
 def run_render_equivalence_cases(
     spec: BaseFunctionSpec,
     *,
     cases: tuple[EquivalenceCase, ...] | None = None,
+    hooks: VerificationHooks | None = None,
+    timing: bool = False,
+    trace_allocations: bool = False,
+    canonical_cache: CanonicalOutputCache | None = None,
+    golden_store: GoldenDigestStore | None = None,
+    digest_only: bool = False,
 ) -> SpecVerificationReport:
     rendered_sample_dist = render_to_callable(spec)
     return run_equivalence_cases(
         spec,
         lambda _spec, rng, count: rendered_sample_dist(rng, count),
         cases=cases,
+        hooks=hooks,
+        timing=timing,
+        trace_allocations=trace_allocations,
+        canonical_cache=canonical_cache,
+        golden_store=golden_store,
+        digest_only=digest_only,
     )
 
 
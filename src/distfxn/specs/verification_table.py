@@ -0,0 +1,359 @@
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from .equivalence_cases import EquivalenceCase
+from .instrumentation import CaseTiming
+from .output_checks import CheckResult, OutputVerificationReport
+from .verification import (
+    CaseVerificationReport,
+    SpecVerificationReport,
+    StatisticalTestResult,
+    _failure_reasons,
+)
+
+TIMING_FIELDS = tuple(CaseTiming.model_fields)
+CASE_ROW_DTYPE = np.dtype(
+    [
+        ("spec_id", np.int64),
+        ("case", np.int32),
+        ("family", np.int16),
+        ("canonical_layout", np.int32),
+        ("candidate_layout", np.int32),
+        ("canonical_failed", np.uint64),
+        ("candidate_failed", np.uint64),
+        ("exact_match", np.bool_),
+        ("exact_compared", np.bool_),
+        ("passed", np.bool_),
+        ("first_mismatch", np.int64),
+        ("stat_test", np.int16),
+        ("statistic", np.float64),
+        ("p_value", np.float64),
+        ("alpha", np.float64),
+        ("stat_sample_size", np.int64),
+        ("stat_passed", np.bool_),
+        ("timing", np.float64, (len(TIMING_FIELDS),)),
+        ("peak_allocated_bytes", np.int64),
+    ]
+)
+MESSAGE_ROW_DTYPE = np.dtype(
+    [
+        ("row", np.int64),
+        ("side", np.uint8),
+        ("check", np.uint8),
+        ("message", np.int32),
+    ]
+)
+
+NO_INDEX = -1
+CANONICAL_SIDE = 0
+CANDIDATE_SIDE = 1
+MAX_CHECKS_PER_REPORT = 64
+
+
+class _GrowableRows:
+    __slots__ = ("array", "size")
+
+    def __init__(self, dtype: np.dtype, capacity: int = 1024):
+        self.array = np.zeros(capacity, dtype=dtype)
+        self.size = 0
+
+    def append(self, row: tuple) -> int:
+        if self.size == self.array.shape[0]:
+            grown = np.zeros(self.array.shape[0] * 2, dtype=self.array.dtype)
+            grown[: self.size] = self.array
+            self.array = grown
+        self.array[self.size] = row
+        self.size += 1
+        return self.size - 1
+
+    def view(self) -> np.ndarray:
+        return self.array[: self.size]
+
+
+class _Vocabulary:
+    __slots__ = ("_index", "values")
+
+    def __init__(self):
+        self._index: dict = {}
+        self.values: list = []
+
+    def intern(self, value) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.values)
+            self._index[value] = index
+            self.values.append(value)
+        return index
+
+
+class VerificationTable:
+    """Array-backed store of verification results, one row per (spec, case).
+
+    Each row holds interned ids for the family, case, and check-name layout of both
+    output reports, plus bitmask columns of failed checks (bit ``i`` is check ``i`` of
+    the layout). Failure messages live in a side table that is only written for failed
+    checks, so passing cases cost one fixed-size row. Per-phase timings and peak
+    allocations are kept when the reports carry them. ``to_report()`` rebuilds the
+    ``SpecVerificationReport`` on demand.
+    """
+
+    def __init__(self):
+        self._rows = _GrowableRows(CASE_ROW_DTYPE)
+        self._messages = _GrowableRows(MESSAGE_ROW_DTYPE, capacity=64)
+        self._families = _Vocabulary()
+        self._cases = _Vocabulary()
+        self._layouts = _Vocabulary()
+        self._message_texts = _Vocabulary()
+        self._tests = _Vocabulary()
+        self._next_spec_id = 0
+
+    @classmethod
+    def from_reports(cls, reports: Iterable[SpecVerificationReport]) -> "VerificationTable":
+        table = cls()
+        table.extend(reports)
+        return table
+
+    def __len__(self) -> int:
+        return self._rows.size
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows.view()
+
+    @property
+    def messages(self) -> np.ndarray:
+        return self._messages.view()
+
+    @property
+    def cases(self) -> tuple[EquivalenceCase, ...]:
+        return tuple(self._cases.values)
+
+    @property
+    def families(self) -> tuple[str, ...]:
+        return tuple(self._families.values)
+
+    @property
+    def layouts(self) -> tuple[tuple[str, ...], ...]:
+        return tuple(self._layouts.values)
+
+    def message_text(self, message_id: int) -> str:
+        return self._message_texts.values[message_id]
+
+    def append(self, report: SpecVerificationReport, *, spec_id: int | None = None) -> int:
+        resolved_spec_id = self._next_spec_id if spec_id is None else spec_id
+        self._next_spec_id = max(self._next_spec_id, resolved_spec_id + 1)
+
+        family_id = self._families.intern(report.family)
+        for case_report in report.case_reports:
+            canonical_layout, canonical_failed = self._encode(case_report.canonical_output_report)
+            candidate_layout, candidate_failed = self._encode(case_report.candidate_output_report)
+            row = self._rows.append(
+                (
+                    resolved_spec_id,
+                    self._cases.intern(case_report.case),
+                    family_id,
+                    canonical_layout,
+                    candidate_layout,
+                    canonical_failed,
+                    candidate_failed,
+                    bool(case_report.exact_output_match),
+                    case_report.exact_output_match is not None,
+                    case_report.passed,
+                    _encode_index(case_report.first_mismatch_index),
+                    *self._encode_statistical_test(case_report.statistical_test),
+                    _encode_timing(case_report.timing),
+                    _encode_index(case_report.peak_allocated_bytes),
+                )
+            )
+            self._record_messages(row, CANONICAL_SIDE, case_report.canonical_output_report)
+            self._record_messages(row, CANDIDATE_SIDE, case_report.candidate_output_report)
+        return resolved_spec_id
+
+    def extend(self, reports: Iterable[SpecVerificationReport]) -> None:
+        for report in reports:
+            self.append(report)
+
+    def spec_ids(self) -> np.ndarray:
+        return np.unique(self.rows["spec_id"])
+
+    def spec_passed(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return (spec_ids, passed) where passed is True when every case of the spec passed."""
+        rows = self.rows
+        spec_ids, inverse = np.unique(rows["spec_id"], return_inverse=True)
+        failed_counts = np.bincount(inverse, weights=~rows["passed"], minlength=spec_ids.shape[0])
+        return spec_ids, failed_counts == 0
+
+    def to_report(self, spec_id: int) -> SpecVerificationReport:
+        row_indices = np.flatnonzero(self.rows["spec_id"] == spec_id)
+        if row_indices.shape[0] == 0:
+            raise KeyError(f"no verification results for spec_id {spec_id}")
+        return self._build_report(row_indices)
+
+    def to_reports(self) -> Iterator[tuple[int, SpecVerificationReport]]:
+        spec_ids = self.rows["spec_id"]
+        if spec_ids.shape[0] == 0:
+            return
+        boundaries = np.flatnonzero(spec_ids[1:] != spec_ids[:-1]) + 1
+        for row_indices in np.split(np.arange(spec_ids.shape[0]), boundaries):
+            yield int(spec_ids[row_indices[0]]), self._build_report(row_indices)
+
+    def nbytes(self) -> int:
+        return self.rows.nbytes + self.messages.nbytes
+
+    def _encode(self, report: OutputVerificationReport) -> tuple[int, int]:
+        if len(report.results) > MAX_CHECKS_PER_REPORT:
+            raise ValueError(
+                f"verification tables support at most {MAX_CHECKS_PER_REPORT} checks per report"
+            )
+        layout = self._layouts.intern(tuple(result.name for result in report.results))
+        failed = 0
+        for position, result in enumerate(report.results):
+            if not result.passed:
+                failed |= 1 << position
+        return layout, failed
+
+    def _encode_statistical_test(
+        self, result: StatisticalTestResult | None
+    ) -> tuple[int, float, float, float, int, bool]:
+        if result is None:
+            return (NO_INDEX, 0.0, 0.0, 0.0, 0, False)
+        # NaN marks a test that was not run; computed statistics and p-values are finite.
+        return (
+            self._tests.intern(result.test),
+            np.nan if result.statistic is None else result.statistic,
+            np.nan if result.p_value is None else result.p_value,
+            result.alpha,
+            result.sample_size,
+            result.passed,
+        )
+
+    def _decode_statistical_test(self, row) -> StatisticalTestResult | None:
+        test_id = int(row["stat_test"])
+        if test_id == NO_INDEX:
+            return None
+        p_value = float(row["p_value"])
+        return StatisticalTestResult(
+            test=self._tests.values[test_id],
+            statistic=None if np.isnan(p_value) else float(row["statistic"]),
+            p_value=None if np.isnan(p_value) else p_value,
+            alpha=float(row["alpha"]),
+            sample_size=int(row["stat_sample_size"]),
+            passed=bool(row["stat_passed"]),
+        )
+
+    def _record_messages(self, row: int, side: int, report: OutputVerificationReport) -> None:
+        for position, result in enumerate(report.results):
+            if not result.passed and result.message is not None:
+                self._messages.append(
+                    (row, side, position, self._message_texts.intern(result.message))
+                )
+
+    def _build_report(self, row_indices: np.ndarray) -> SpecVerificationReport:
+        messages = self.messages
+        # Messages are appended in row order, so this spec's messages form one slice. Rows
+        # of other specs interleaved by explicit spec_ids may fall inside it; the lookup
+        # below is keyed by row, so they are never read.
+        start = int(np.searchsorted(messages["row"], row_indices[0], side="left"))
+        stop = int(np.searchsorted(messages["row"], row_indices[-1], side="right"))
+        message_rows = messages[start:stop]
+        message_lookup = {
+            (int(entry["row"]), int(entry["side"]), int(entry["check"])): self.message_text(
+                int(entry["message"])
+            )
+            for entry in message_rows
+        }
+
+        family = self._families.values[int(self.rows[row_indices[0]]["family"])]
+        case_reports = []
+        for row_index in row_indices.tolist():
+            row = self.rows[row_index]
+            canonical_report = self._decode(
+                family,
+                row_index,
+                CANONICAL_SIDE,
+                int(row["canonical_layout"]),
+                int(row["canonical_failed"]),
+                message_lookup,
+            )
+            candidate_report = self._decode(
+                family,
+                row_index,
+                CANDIDATE_SIDE,
+                int(row["candidate_layout"]),
+                int(row["candidate_failed"]),
+                message_lookup,
+            )
+            exact_output_match = bool(row["exact_match"]) if row["exact_compared"] else None
+            first_mismatch_index = _decode_index(int(row["first_mismatch"]))
+            statistical_test = self._decode_statistical_test(row)
+            case_reports.append(
+                CaseVerificationReport(
+                    case=self._cases.values[int(row["case"])],
+                    canonical_output_report=canonical_report,
+                    candidate_output_report=candidate_report,
+                    exact_output_match=exact_output_match,
+                    passed=bool(row["passed"]),
+                    failure_reasons=_failure_reasons(
+                        canonical_output_report=canonical_report,
+                        candidate_output_report=candidate_report,
+                        exact_output_match=exact_output_match,
+                        first_mismatch_index=first_mismatch_index,
+                        statistical_test=statistical_test,
+                    ),
+                    first_mismatch_index=first_mismatch_index,
+                    statistical_test=statistical_test,
+                    timing=_decode_timing(row["timing"]),
+                    peak_allocated_bytes=_decode_index(int(row["peak_allocated_bytes"])),
+                )
+            )
+
+        return SpecVerificationReport(
+            family=family,
+            passed=all(case_report.passed for case_report in case_reports),
+            case_reports=tuple(case_reports),
+        )
+
+    def _decode(
+        self,
+        family: str,
+        row_index: int,
+        side: int,
+        layout: int,
+        failed: int,
+        message_lookup: dict[tuple[int, int, int], str],
+    ) -> OutputVerificationReport:
+        results = tuple(
+            CheckResult(
+                name=name,
+                passed=not (failed >> position) & 1,
+                message=message_lookup.get((row_index, side, position)),
+            )
+            for position, name in enumerate(self._layouts.values[layout])
+        )
+        return OutputVerificationReport(
+            family=family,
+            passed=failed == 0,
+            results=results,
+        )
+
+
+def _encode_index(index: int | None) -> int:
+    return NO_INDEX if index is None else index
+
+
+def _decode_index(value: int) -> int | None:
+    return None if value == NO_INDEX else value
+
+
+def _encode_timing(timing: CaseTiming | None) -> tuple[float, ...]:
+    # NaN marks a case recorded without timing; measured durations are finite.
+    if timing is None:
+        return (np.nan,) * len(TIMING_FIELDS)
+    return tuple(getattr(timing, name) for name in TIMING_FIELDS)
+
+
+def _decode_timing(values: np.ndarray) -> CaseTiming | None:
+    if np.isnan(values[0]):
+        return None
+    return CaseTiming(**dict(zip(TIMING_FIELDS, values.tolist())))
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import NormalSpec, NormalSpecBatch, SpecArchive, UniformSpec, UniformSpecBatch
+
+
+def test_archive_round_trips_specs_and_outputs(tmp_path):
+    specs = [NormalSpec(mean=float(i), stddev=1.0 + i) for i in range(5)]
+    batch = NormalSpecBatch.from_specs(specs)
+
+    archive = SpecArchive.write(
+        tmp_path / "normal", batch, count=16, rng=np.int64(9), block_rows=2
+    )
+
+    assert archive.manifest["seed"] == 9
+    assert [archive.spec(i) for i in range(len(archive))] == specs
+    assert np.array_equal(
+        archive.outputs, batch.sample_dist(np.random.default_rng(9), 16)
+    )
+
+
+def test_specs_with_non_default_settings_cannot_be_archived(tmp_path):
+    spec = UniformSpec(start=0.0, end=1.0, output_dtype="float32")
+
+    with pytest.raises(ValueError, match="output_dtype"):
+        SpecArchive.write(tmp_path / "uniform", UniformSpecBatch.from_specs([spec]))
+
+    assert not (tmp_path / "uniform").exists()
+
+
+@pytest.mark.parametrize("count", [None, 8])
+def test_empty_batch_round_trips(tmp_path, count):
+    archive = SpecArchive.write(
+        tmp_path / "empty", NormalSpecBatch.from_specs([]), count=count, rng=0
+    )
+
+    reopened = SpecArchive(tmp_path / "empty")
+    assert len(reopened) == len(reopened.batch()) == 0
+    assert reopened.count == archive.count == count
+    if count is None:
+        assert reopened.outputs is None
+    else:
+        assert reopened.outputs.shape == (0, count)
+
+
+@pytest.mark.parametrize("block_rows", [1, 3, 4, 6, 50])
+def test_uneven_blocks_with_a_generator_match_one_batch_draw(tmp_path, block_rows):
+    specs = [UniformSpec(start=float(i), end=2.0 * i + 1.0) for i in range(7)]
+    batch = UniformSpecBatch.from_specs(specs)
+
+    archive = SpecArchive.write(
+        tmp_path / "uniform",
+        batch,
+        count=5,
+        rng=np.random.default_rng(np.random.SeedSequence(11)),
+        block_rows=block_rows,
+    )
+
+    assert archive.manifest["seed"] is None
+    expected = batch.sample_dist(np.random.default_rng(np.random.SeedSequence(11)), 5)
+    assert archive.outputs.dtype == expected.dtype
+    assert archive.outputs.tobytes() == expected.tobytes()
+
+
+def test_overwrite_replaces_the_archive_and_cleans_up(tmp_path):
+    path = tmp_path / "normal"
+    SpecArchive.write(path, NormalSpecBatch.from_specs([NormalSpec(mean=0.0, stddev=1.0)]))
+    replacement = [NormalSpec(mean=1.0, stddev=2.0), NormalSpec(mean=3.0, stddev=4.0)]
+
+    with pytest.raises(FileExistsError):
+        SpecArchive.write(path, NormalSpecBatch.from_specs(replacement))
+    archive = SpecArchive.write(path, NormalSpecBatch.from_specs(replacement), overwrite=True)
+
+    assert [archive.spec(i) for i in range(len(archive))] == replacement
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == ["normal"]
+
+
+def test_failed_overwrite_keeps_the_old_archive(tmp_path, monkeypatch):
+    path = tmp_path / "normal"
+    original = [NormalSpec(mean=0.0, stddev=1.0)]
+    SpecArchive.write(path, NormalSpecBatch.from_specs(original), count=4, rng=1)
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(SpecArchive, "_write_outputs", staticmethod(fail))
+    with pytest.raises(OSError, match="disk full"):
+        SpecArchive.write(
+            path,
+            NormalSpecBatch.from_specs([NormalSpec(mean=5.0, stddev=1.0)]),
+            count=4,
+            rng=1,
+            overwrite=True,
+        )
+
+    archive = SpecArchive(path)
+    assert archive.spec(0) == original[0]
+    assert archive.outputs.shape == (1, 4)
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == ["normal"]
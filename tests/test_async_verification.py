@@ -0,0 +1,197 @@
+import asyncio
+import json
+from typing import Any
+
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    FAMILY_REGISTRY,
+    EquivalenceCase,
+    NormalSpec,
+    RemoteCandidateSampler,
+    UniformSpec,
+    async_run_equivalence_cases,
+    async_verify_many,
+)
+
+CASES = tuple(EquivalenceCase(name=f"case_{seed}", seed=seed, count=64) for seed in range(6))
+
+
+class StubSamplingServer:
+    """Local sampling service speaking ``RemoteCandidateSampler``'s protocol.
+
+    Serves ``sampler(spec, np.random.default_rng(seed), count)`` (``spec.sample_dist`` by
+    default) after an optional ``delay`` in seconds, and records the peak number of
+    requests in flight.
+    """
+
+    def __init__(self, *, sampler=None, delay: float = 0.0):
+        self.sampler = sampler
+        self.delay = delay
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def __aenter__(self) -> "StubSamplingServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                header, body = await self._respond(line)
+                writer.write(json.dumps(header).encode() + b"\n" + body)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def _respond(self, line: bytes) -> tuple[dict[str, Any], bytes]:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            request = json.loads(line)
+            spec = FAMILY_REGISTRY.parse(request["spec"])
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            # Sampling is CPU-bound; keep it off the event loop so requests overlap.
+            values = await asyncio.to_thread(self._sample, spec, request["seed"], request["count"])
+        except Exception as exc:
+            return {"ok": False, "error": repr(exc)}, b""
+        finally:
+            self.in_flight -= 1
+        return {"ok": True, "dtype": values.dtype.str, "count": values.shape[0]}, values.tobytes()
+
+    def _sample(self, spec, seed: int, count: int) -> np.ndarray:
+        rng = np.random.default_rng(seed)
+        sampler = self.sampler if self.sampler is not None else type(spec).sample_dist
+        return np.ascontiguousarray(sampler(spec, rng, count))
+
+
+def run_against_server(coroutine_factory, **server_options):
+    async def main():
+        async with StubSamplingServer(**server_options) as server:
+            result = await coroutine_factory(RemoteCandidateSampler(*server.address))
+            return server, result
+
+    return asyncio.run(main())
+
+
+def test_remote_candidate_matches_canonical_outputs():
+    spec = NormalSpec(mean=1.0, stddev=3.0)
+
+    _, report = run_against_server(
+        lambda sampler: async_run_equivalence_cases(spec, sampler, cases=CASES)
+    )
+
+    assert report.passed, report.to_markdown()
+    assert all(case_report.exact_output_match for case_report in report.case_reports)
+
+
+def test_remote_mismatch_and_server_errors_fail_their_cases():
+    def shifted(spec, rng, count):
+        if count == 1:
+            raise ValueError("unsupported count")
+        return spec.sample_dist(rng, count) + 1.0
+
+    spec = UniformSpec(start=0.0, end=2.0)
+    cases = (CASES[0], EquivalenceCase(name="single", seed=1, count=1))
+
+    _, report = run_against_server(
+        lambda sampler: async_run_equivalence_cases(spec, sampler, cases=cases),
+        sampler=shifted,
+    )
+
+    mismatch, error = report.case_reports
+    assert not report.passed
+    assert mismatch.exact_output_match is False
+    assert "candidate sampler failed" in error.failure_reasons[0]
+    assert "unsupported count" in error.failure_reasons[0]
+
+
+def test_concurrency_bounds_cases_in_flight_across_specs():
+    specs = [NormalSpec(mean=float(i), stddev=1.0) for i in range(3)]
+
+    server, reports = run_against_server(
+        lambda sampler: async_verify_many(specs, sampler, cases=CASES, concurrency=2),
+        delay=0.02,
+    )
+
+    assert all(report.passed for report in reports)
+    assert server.peak_in_flight == 2
+
+
+def test_cases_that_exceed_the_timeout_fail():
+    spec = NormalSpec(mean=0.0, stddev=1.0)
+
+    _, report = run_against_server(
+        lambda sampler: async_run_equivalence_cases(spec, sampler, cases=CASES[:2], timeout=0.05),
+        delay=0.3,
+    )
+
+    assert not report.passed
+    for case_report in report.case_reports:
+        assert case_report.failure_reasons[0] == (
+            "candidate.sampler_error: candidate sampler timed out after 0.05s"
+        )
+
+
+class CheckBug(Exception):
+    pass
+
+
+async def local_sampler(spec, seed, count):
+    await asyncio.sleep(0)
+    return spec.sample_dist(np.random.default_rng(seed), count)
+
+
+def test_output_check_errors_propagate_instead_of_failing_the_case(monkeypatch):
+    def broken_validate_output(self, output, *, count, block_size=None):
+        raise CheckBug("check crashed")
+
+    monkeypatch.setattr(NormalSpec, "validate_output", broken_validate_output)
+
+    with pytest.raises(CheckBug):
+        asyncio.run(async_run_equivalence_cases(NormalSpec(mean=0.0, stddev=1.0), local_sampler))
+
+
+def test_verify_many_consumes_specs_with_bounded_tasks():
+    consumed = 0
+    peak_tasks = 0
+
+    def generate_specs():
+        nonlocal consumed
+        for index in range(40):
+            consumed += 1
+            if index % 3:
+                yield UniformSpec(start=0.0, end=float(index + 1))
+            else:
+                yield NormalSpec(mean=float(index), stddev=1.0)
+
+    async def sampler(spec, seed, count):
+        nonlocal peak_tasks
+        peak_tasks = max(peak_tasks, len(asyncio.all_tasks()))
+        return await local_sampler(spec, seed, count)
+
+    reports = asyncio.run(
+        async_verify_many(generate_specs(), sampler, cases=CASES[:2], concurrency=2)
+    )
+
+    assert consumed == len(reports) == 40
+    assert [report.family for report in reports] == [
+        "uniform" if index % 3 else "normal" for index in range(40)
+    ]
+    assert all(report.passed for report in reports)
+    # The main task, two workers, and the case tasks of the two specs they verify.
+    assert peak_tasks <= 1 + 2 + 2 * 2
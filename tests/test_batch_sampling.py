@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    BernoulliSpec,
+    BernoulliSpecBatch,
+    NormalSpec,
+    NormalSpecBatch,
+    UniformSpec,
+    UniformSpecBatch,
+)
+
+BATCHES = [
+    NormalSpecBatch.from_specs(
+        [NormalSpec(mean=float(i) - 3.0, stddev=0.5 + i) for i in range(7)]
+    ),
+    UniformSpecBatch.from_specs(
+        [UniformSpec(start=float(i), end=float(i) + 1.5**i) for i in range(7)]
+    ),
+    BernoulliSpecBatch.from_specs([BernoulliSpec(p=i / 6) for i in range(7)]),
+]
+
+
+@pytest.mark.parametrize("batch", BATCHES, ids=lambda batch: batch.family())
+@pytest.mark.parametrize("count", [1, 33])
+def test_rows_match_sequential_sample_dist_calls(batch, count):
+    rng = np.random.default_rng(21)
+    sequential_rng = np.random.default_rng(21)
+
+    outputs = batch.sample_dist(rng, count)
+    expected = [np.asarray(spec.sample_dist(sequential_rng, count)) for spec in batch.to_specs()]
+
+    assert outputs.shape == (len(batch), count)
+    for row, expected_row in zip(outputs, expected, strict=True):
+        assert row.dtype == expected_row.dtype
+        assert row.tobytes() == expected_row.tobytes()
+    assert rng.bit_generator.state == sequential_rng.bit_generator.state
+
+
+@pytest.mark.parametrize("batch", BATCHES, ids=lambda batch: batch.family())
+@pytest.mark.parametrize("block_rows", [1, 2, 3, 7])
+def test_consecutive_row_blocks_reproduce_one_batch_call(batch, block_rows):
+    expected = batch.sample_dist(np.random.default_rng(4), 16)
+
+    rng = np.random.default_rng(4)
+    blocks = [
+        batch[start : start + block_rows].sample_dist(rng, 16)
+        for start in range(0, len(batch), block_rows)
+    ]
+
+    assert np.concatenate(blocks).tobytes() == expected.tobytes()
@@ -0,0 +1,120 @@
+import threading
+
+import numpy as np
+import pytest
+
+from distfxn.specs import CanonicalOutputCache, EquivalenceCase, NormalSpec
+
+SPEC = NormalSpec(mean=0.0, stddev=1.0)
+CASES = tuple(EquivalenceCase(name=f"case_{seed}", seed=seed, count=100) for seed in range(4))
+OUTPUT_BYTES = 100 * 8
+
+
+def expected_output(case):
+    return SPEC.sample_dist(np.random.default_rng(case.seed), case.count)
+
+
+def test_get_or_sample_returns_read_only_canonical_outputs():
+    cache = CanonicalOutputCache()
+
+    first = cache.get_or_sample(SPEC, CASES[0])
+    second = cache.get_or_sample(SPEC, CASES[0])
+
+    assert np.array_equal(first, expected_output(CASES[0]))
+    assert second is first and not first.flags.writeable
+    stats = cache.stats()
+    assert (stats.memory_hits, stats.misses) == (1, 1)
+
+
+def test_memory_tier_evicts_least_recently_used_outputs_by_bytes():
+    cache = CanonicalOutputCache(max_memory_bytes=2 * OUTPUT_BYTES)
+    cache.get_or_sample(SPEC, CASES[0])
+    cache.get_or_sample(SPEC, CASES[1])
+    cache.get(SPEC, CASES[0])
+
+    cache.get_or_sample(SPEC, CASES[2])
+
+    assert cache.get(SPEC, CASES[1]) is None
+    assert cache.get(SPEC, CASES[0]) is not None
+    assert cache.get(SPEC, CASES[2]) is not None
+    stats = cache.stats()
+    assert stats.memory_evictions == 1
+    assert stats.memory_bytes == 2 * OUTPUT_BYTES
+
+
+def test_outputs_larger_than_the_memory_budget_are_not_kept():
+    cache = CanonicalOutputCache(max_memory_bytes=OUTPUT_BYTES - 1)
+
+    cache.get_or_sample(SPEC, CASES[0])
+
+    assert cache.get(SPEC, CASES[0]) is None
+    assert cache.stats().memory_bytes == 0
+
+
+def test_disk_tier_round_trips_across_instances(tmp_path):
+    CanonicalOutputCache(directory=tmp_path).get_or_sample(SPEC, CASES[0])
+
+    reopened = CanonicalOutputCache(directory=tmp_path)
+    output = reopened.get(SPEC, CASES[0])
+
+    assert np.array_equal(output, expected_output(CASES[0]))
+    assert not output.flags.writeable
+    stats = reopened.stats()
+    assert (stats.disk_hits, stats.misses) == (1, 0)
+    assert stats.disk_bytes > OUTPUT_BYTES
+
+
+def test_disk_tier_evicts_oldest_files_by_bytes(tmp_path):
+    file_bytes = OUTPUT_BYTES + 128
+    cache = CanonicalOutputCache(
+        max_memory_bytes=0, directory=tmp_path, max_disk_bytes=2 * file_bytes
+    )
+
+    for case in CASES[:3]:
+        cache.get_or_sample(SPEC, case)
+
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+    assert cache.get(SPEC, CASES[0]) is None
+    assert cache.get(SPEC, CASES[2]) is not None
+    assert cache.stats().disk_evictions == 1
+
+
+def test_numpy_version_change_invalidates_entries(tmp_path, monkeypatch):
+    cache = CanonicalOutputCache(directory=tmp_path)
+    cache.get_or_sample(SPEC, CASES[0])
+
+    monkeypatch.setattr(np, "__version__", "0.0.0")
+
+    assert cache.get(SPEC, CASES[0]) is None
+    assert CanonicalOutputCache(directory=tmp_path).get(SPEC, CASES[0]) is None
+
+
+def test_concurrent_saves_of_one_key_leave_a_complete_file(tmp_path):
+    cache = CanonicalOutputCache(max_memory_bytes=0, directory=tmp_path)
+    output = np.arange(200_000, dtype=np.float64)
+    barrier = threading.Barrier(4)
+    errors = []
+
+    def save():
+        barrier.wait()
+        try:
+            cache.put(SPEC, CASES[0], output)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=save) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [path.name for path in tmp_path.iterdir()] == [
+        CanonicalOutputCache._filename(CanonicalOutputCache.key(SPEC, CASES[0]))
+    ]
+    assert np.array_equal(CanonicalOutputCache(directory=tmp_path).get(SPEC, CASES[0]), output)
+
+
+def test_budgets_must_not_be_negative():
+    with pytest.raises(ValueError, match="max_memory_bytes"):
+        CanonicalOutputCache(max_memory_bytes=-1)
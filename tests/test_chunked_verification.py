@@ -0,0 +1,70 @@
+from distfxn.specs import (
+    EquivalenceCase,
+    InRangeCheck,
+    NormalSpec,
+    UniformSpec,
+    run_chunked_equivalence_cases,
+)
+
+CASE = EquivalenceCase(name="chunked", seed=3, count=1000)
+
+
+def test_matching_candidate_is_compared_to_completion():
+    report = run_chunked_equivalence_cases(
+        UniformSpec(start=0.0, end=1.0), cases=(CASE,), chunk_size=128
+    )
+
+    assert report.passed
+    assert report.case_reports[0].exact_output_match is True
+
+
+def test_early_stop_on_failed_checks_leaves_exact_match_unknown():
+    # Both sides fail the narrow range check, which stops the case after the first chunk.
+    spec = NormalSpec(
+        mean=0.0, stddev=1.0, output_checks=(InRangeCheck(min_value=-1.0, max_value=1.0),)
+    )
+
+    report = run_chunked_equivalence_cases(spec, cases=(CASE,), chunk_size=128)
+    case_report = report.case_reports[0]
+
+    assert not report.passed
+    assert case_report.exact_output_match is None
+    assert case_report.first_mismatch_index is None
+    assert [reason.split(":")[0] for reason in case_report.failure_reasons] == [
+        "canonical.in_range",
+        "candidate.in_range",
+    ]
+
+
+def test_sampler_error_on_a_later_chunk_leaves_exact_match_unknown():
+    calls = []
+
+    def fails_second_chunk(spec, rng, count):
+        calls.append(count)
+        if len(calls) == 2:
+            raise RuntimeError("connection lost")
+        return spec.sample_dist(rng, count)
+
+    report = run_chunked_equivalence_cases(
+        UniformSpec(start=0.0, end=1.0), fails_second_chunk, cases=(CASE,), chunk_size=128
+    )
+    case_report = report.case_reports[0]
+
+    assert case_report.exact_output_match is None
+    assert len(case_report.failure_reasons) == 1
+    assert "connection lost" in case_report.failure_reasons[0]
+
+
+def test_mismatch_is_reported_with_its_index():
+    def shifted_tail(spec, rng, count):
+        values = spec.sample_dist(rng, count)
+        values[-1] = 0.5
+        return values
+
+    report = run_chunked_equivalence_cases(
+        UniformSpec(start=0.0, end=1.0), shifted_tail, cases=(CASE,), chunk_size=128
+    )
+    case_report = report.case_reports[0]
+
+    assert case_report.exact_output_match is False
+    assert case_report.first_mismatch_index == 127
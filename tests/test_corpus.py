@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    FAMILY_REGISTRY,
+    BernoulliSpec,
+    EquivalenceCase,
+    HistogramCheck,
+    InRangeCheck,
+    MomentCheck,
+    NormalSpec,
+    UniformSpec,
+    default_output_checks,
+    iter_verify,
+    spec_payload,
+    verify_many,
+)
+
+CUSTOMIZED_SPECS = (
+    NormalSpec(
+        mean=0.0,
+        stddev=1.0,
+        output_checks=default_output_checks(dtype_field="output_dtype")
+        + (InRangeCheck(min_value=-100.0, max_value=100.0),),
+    ),
+    NormalSpec(mean=2.0, stddev=0.5, output_dtype="float32"),
+    BernoulliSpec(p=0.3, output_dtype="bool"),
+    BernoulliSpec(
+        p=0.7,
+        output_checks=BernoulliSpec(p=0.7).output_checks + (MomentCheck(), HistogramCheck()),
+    ),
+    UniformSpec(
+        start=-1.0,
+        end=1.0,
+        equivalence_cases=(EquivalenceCase(name="custom", seed=5, count=17),),
+    ),
+)
+
+
+@pytest.mark.parametrize("spec", CUSTOMIZED_SPECS + (UniformSpec(start=0.0, end=1.0),))
+def test_spec_payload_round_trips(spec):
+    payload = spec_payload(spec)
+
+    assert FAMILY_REGISTRY.parse(payload) == spec
+
+
+def test_spec_payload_omits_default_fields():
+    assert spec_payload(NormalSpec(mean=1.0, stddev=2.0)) == {
+        "family": "normal",
+        "mean": 1.0,
+        "stddev": 2.0,
+    }
+
+
+def test_verify_many_across_processes_accepts_customized_specs():
+    reports = verify_many(CUSTOMIZED_SPECS, workers=2, chunksize=1, deduplicate=False)
+
+    assert [report.family for report in reports] == [spec.family for spec in CUSTOMIZED_SPECS]
+    assert all(report.passed for report in reports)
+
+
+def test_verify_many_fans_out_duplicate_specs():
+    spec = NormalSpec(mean=0.0, stddev=1.0)
+    reports = verify_many([spec, UniformSpec(start=0.0, end=1.0), spec], workers=1)
+
+    assert reports[0] is reports[2]
+    assert np.all([report.passed for report in reports])
+
+
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_iter_verify_bounds_pending_chunks_over_a_generator(deduplicate):
+    consumed = 0
+
+    def generate_specs():
+        nonlocal consumed
+        for index in range(40):
+            consumed += 1
+            yield NormalSpec(mean=float(index % 30), stddev=1.0)
+
+    chunksize, max_in_flight = 3, 2
+    backlog = []
+    reports = []
+    for report in iter_verify(
+        generate_specs(),
+        workers=2,
+        chunksize=chunksize,
+        max_in_flight=max_in_flight,
+        deduplicate=deduplicate,
+    ):
+        reports.append(report)
+        backlog.append(consumed - len(reports))
+
+    assert len(reports) == 40 and all(report.passed for report in reports)
+    # Besides the chunks in flight, a chunk may be half-read and duplicates may wait on
+    # an earlier occurrence's report.
+    assert max(backlog) <= (max_in_flight + 1) * chunksize
@@ -0,0 +1,72 @@
+import json
+import os
+import subprocess
+import sys
+
+from distfxn.specs import (
+    BernoulliSpec,
+    EquivalenceCase,
+    NormalSpec,
+    UniformSpec,
+    spec_payload,
+    verify_many,
+)
+from distfxn.specs.fingerprint import intern_specs
+
+SPECS = (
+    NormalSpec(mean=1.5, stddev=0.25),
+    UniformSpec(start=-2.0, end=3.0, output_dtype="float32"),
+    BernoulliSpec(p=0.3, equivalence_cases=(EquivalenceCase(name="one", seed=4, count=9),)),
+)
+
+
+def test_fingerprint_is_stable_across_processes():
+    script = (
+        "from distfxn.specs import FAMILY_REGISTRY, spec_payload\n"
+        "import json, sys\n"
+        "for payload in json.load(sys.stdin):\n"
+        "    print(FAMILY_REGISTRY.parse(payload).fingerprint)\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        input=json.dumps([spec_payload(spec) for spec in SPECS]),
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), "PYTHONHASHSEED": "123"},
+    )
+
+    assert completed.stdout.split() == [spec.fingerprint for spec in SPECS]
+
+
+def test_model_copy_with_update_recomputes_the_fingerprint():
+    spec = NormalSpec(mean=0.0, stddev=1.0)
+    original = spec.fingerprint
+
+    updated = spec.model_copy(update={"stddev": 2.0})
+    unchanged = spec.model_copy()
+
+    assert updated.fingerprint == NormalSpec(mean=0.0, stddev=2.0).fingerprint
+    assert updated.fingerprint != original
+    assert unchanged.fingerprint == original
+    assert isinstance(updated, NormalSpec)
+
+
+def test_equality_stays_field_based():
+    positive = NormalSpec(mean=0.0, stddev=1.0)
+    negative = NormalSpec(mean=-0.0, stddev=1.0)
+
+    assert positive == negative and hash(positive) == hash(negative)
+    assert positive.fingerprint != negative.fingerprint
+    assert positive != UniformSpec(start=0.0, end=1.0)
+
+
+def test_intern_specs_collapses_by_fingerprint():
+    specs = [SPECS[0], SPECS[1], NormalSpec(mean=1.5, stddev=0.25), SPECS[1]]
+
+    unique, indices = intern_specs(specs)
+
+    assert unique == (SPECS[0], SPECS[1])
+    assert indices == (0, 1, 0, 1)
+    reports = verify_many(specs, workers=1)
+    assert reports[0] is reports[2] and reports[1] is reports[3]
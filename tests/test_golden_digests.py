@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    BernoulliSpec,
+    EquivalenceCase,
+    GoldenDigestStore,
+    InRangeCheck,
+    NormalSpec,
+    OutputDigest,
+    UniformSpec,
+    output_digest,
+    run_equivalence_cases,
+    run_render_equivalence_cases,
+)
+
+CASE = EquivalenceCase(name="digest", seed=2, count=1000)
+
+
+def test_streaming_digest_over_chunks_matches_whole_array_digest():
+    values = np.random.default_rng(0).standard_normal(1000)
+    streaming = OutputDigest()
+    for start in range(0, values.shape[0], 333):
+        streaming.update(values[start : start + 333])
+
+    assert streaming.hexdigest() == output_digest(values)
+
+
+def test_digest_covers_dtype_and_shape():
+    values = np.arange(6, dtype=np.int64)
+
+    assert output_digest(values) != output_digest(values.astype(np.int32))
+    assert output_digest(values) != output_digest(values.reshape(2, 3))
+    assert output_digest(values) == output_digest(values.copy())
+
+
+def test_streaming_digest_rejects_inconsistent_chunks():
+    streaming = OutputDigest()
+    streaming.update(np.zeros(3))
+
+    with pytest.raises(ValueError, match="dtype"):
+        streaming.update(np.zeros(3, dtype=np.float32))
+    with pytest.raises(ValueError, match="1D"):
+        streaming.update(np.zeros((2, 2)))
+
+
+def test_store_round_trips_through_save_and_load(tmp_path):
+    store = GoldenDigestStore.build([NormalSpec(mean=1.0, stddev=2.0)], cases=(CASE,))
+    path = tmp_path / "golden.json"
+
+    store.save(path)
+    loaded = GoldenDigestStore.load(path)
+
+    assert len(loaded) == len(store) > 1
+    assert loaded.to_dict() == store.to_dict()
+    assert loaded.get(NormalSpec(mean=1.0, stddev=2.0), CASE) == output_digest(
+        NormalSpec(mean=1.0, stddev=2.0).sample_dist(np.random.default_rng(CASE.seed), CASE.count)
+    )
+
+
+def test_store_rejects_unknown_versions():
+    with pytest.raises(ValueError, match="version"):
+        GoldenDigestStore.from_dict({"version": 99, "digests": []})
+
+
+def test_record_refuses_an_invalid_canonical_output():
+    spec = NormalSpec(
+        mean=0.0, stddev=1.0, output_checks=(InRangeCheck(min_value=-0.5, max_value=0.5),)
+    )
+    store = GoldenDigestStore()
+
+    with pytest.raises(ValueError, match="is invalid"):
+        store.record(spec, CASE)
+    assert len(store) == 0
+
+
+@pytest.mark.parametrize("digest_only", [False, True])
+def test_digest_mode_matches_exact_mode_for_identical_outputs(digest_only):
+    spec = UniformSpec(start=-1.0, end=1.0)
+    store = GoldenDigestStore.build([spec], edge_specs=False, cases=(CASE,))
+
+    report = run_render_equivalence_cases(
+        spec, cases=(CASE,), golden_store=store, digest_only=digest_only
+    )
+
+    assert report.passed
+    assert report.case_reports[0].exact_output_match is True
+
+
+def test_digest_mode_is_stricter_about_dtype_than_exact_mode():
+    def int32_bernoulli(spec, rng, count):
+        return spec.sample_dist(rng, count).astype(np.int32)
+
+    spec = BernoulliSpec(p=0.4)
+    store = GoldenDigestStore.build([spec], edge_specs=False, cases=(CASE,))
+
+    exact = run_equivalence_cases(spec, int32_bernoulli, cases=(CASE,))
+    digest = run_equivalence_cases(spec, int32_bernoulli, cases=(CASE,), golden_store=store)
+
+    assert exact.passed
+    assert not digest.passed
+    assert digest.case_reports[0].exact_output_match is False
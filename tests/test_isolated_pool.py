@@ -0,0 +1,152 @@
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    EquivalenceCase,
+    IsolatedWorkerPool,
+    NormalSpec,
+    UniformSpec,
+    run_chunked_equivalence_cases,
+)
+from distfxn.specs.isolated_pool import WorkerCrashedError, WorkerTimeoutError
+
+SPEC = NormalSpec(mean=0.0, stddev=1.0)
+
+
+def scaled_uniform(spec, rng, count):
+    return spec.sample_dist(rng, count)
+
+
+def worker_pid(spec, rng, count):
+    return np.array([os.getpid()])
+
+
+def hang(spec, rng, count):
+    time.sleep(60)
+
+
+def exit_abruptly(spec, rng, count):
+    os._exit(3)
+
+
+def allocate_too_much(spec, rng, count):
+    return np.ones(1 << 33)
+
+
+def pid_of(pool):
+    return int(pool.sample(worker_pid, SPEC, np.random.default_rng(0), 1)[0])
+
+
+def address_space_bytes():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmSize:"):
+                return int(line.split()[1]) * 1024
+    pytest.skip("address space size is unavailable")
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with IsolatedWorkerPool(workers=1) as pool:
+        yield pool
+
+
+def test_rendered_samples_advance_the_callers_generator(pool):
+    spec = NormalSpec(mean=1.0, stddev=2.0)
+    rng = np.random.default_rng(7)
+    expected_rng = np.random.default_rng(7)
+
+    first = pool.sample_rendered(spec, rng, 50)
+    second = pool.sample_rendered(spec, rng, 50)
+
+    assert np.array_equal(first, spec.sample_dist(expected_rng, 50))
+    assert np.array_equal(second, spec.sample_dist(expected_rng, 50))
+    assert rng.bit_generator.state == expected_rng.bit_generator.state
+
+
+def test_wrapped_sampler_advances_the_callers_generator(pool):
+    spec = UniformSpec(start=-1.0, end=1.0)
+    sampler = pool.sampler(scaled_uniform)
+    rng = np.random.default_rng(11)
+    expected_rng = np.random.default_rng(11)
+
+    sampler(spec, rng, 30)
+
+    spec.sample_dist(expected_rng, 30)
+    assert rng.bit_generator.state == expected_rng.bit_generator.state
+
+
+def test_chunked_verification_through_the_pool(pool):
+    report = run_chunked_equivalence_cases(
+        NormalSpec(mean=0.0, stddev=1.0),
+        pool.sample_rendered,
+        cases=(EquivalenceCase(name="chunked", seed=5, count=350),),
+        chunk_size=100,
+    )
+
+    assert report.passed, report.to_markdown()
+
+
+def test_timed_out_worker_is_replaced_and_the_pool_keeps_working():
+    with IsolatedWorkerPool(workers=1, timeout=0.5) as pool:
+        before = pid_of(pool)
+        started = time.perf_counter()
+        with pytest.raises(WorkerTimeoutError):
+            pool.sample(hang, SPEC, np.random.default_rng(0), 1)
+
+        assert time.perf_counter() - started < 5
+        assert pid_of(pool) != before
+        assert pool.sample_rendered(SPEC, np.random.default_rng(0), 10).shape == (10,)
+
+
+def test_crashed_worker_is_reported_and_replaced():
+    with IsolatedWorkerPool(workers=1) as pool:
+        before = pid_of(pool)
+        with pytest.raises(WorkerCrashedError, match="code 3"):
+            pool.sample(exit_abruptly, SPEC, np.random.default_rng(0), 1)
+
+        assert pid_of(pool) != before
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs RLIMIT_AS and /proc")
+def test_memory_limit_raises_memory_error_and_recycles_the_worker():
+    limit = address_space_bytes() + (512 << 20)
+    with IsolatedWorkerPool(workers=1, memory_limit_bytes=limit) as pool:
+        before = pid_of(pool)
+        with pytest.raises(MemoryError):
+            pool.sample(allocate_too_much, SPEC, np.random.default_rng(0), 1)
+
+        assert pid_of(pool) != before
+        assert pool.sample_rendered(SPEC, np.random.default_rng(0), 10).shape == (10,)
+
+
+def test_workers_are_recycled_after_max_tasks():
+    with IsolatedWorkerPool(workers=1, max_tasks_per_worker=2) as pool:
+        pids = [pid_of(pool) for _ in range(5)]
+
+    assert pids[0] == pids[1] != pids[2] == pids[3] != pids[4]
+
+
+def test_families_are_loaded_before_workers_are_forked():
+    # A fresh interpreter, since this one has already imported the families under test.
+    families = ("distfxn.specs.bernoulli", "distfxn.specs.normal", "distfxn.specs.uniform")
+    script = (
+        "import sys\n"
+        "from distfxn.specs import IsolatedWorkerPool\n"
+        "with IsolatedWorkerPool(workers=1):\n"
+        f"    print(all(name in sys.modules for name in {families!r}))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+    assert completed.stdout.strip() == "True"
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    BernoulliSpec,
+    EquivalenceCase,
+    NormalSpec,
+    UniformSpec,
+    outputs_equal,
+    run_equivalence_cases,
+    run_memmap_equivalence_cases,
+    run_render_equivalence_cases,
+    sample_dist_to_memmap,
+)
+
+CASES = (
+    EquivalenceCase(name="small", seed=0, count=5),
+    EquivalenceCase(name="uneven", seed=7, count=1003),
+)
+
+
+def shifted(spec, rng, count):
+    return spec.sample_dist(rng, count) + 10.0
+
+
+def nudged(spec, rng, count):
+    return np.nextafter(spec.sample_dist(rng, count), np.inf)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        NormalSpec(mean=1.0, stddev=2.0),
+        UniformSpec(start=0.0, end=3.0, output_dtype="float32"),
+        BernoulliSpec(p=0.25, output_dtype="uint8"),
+    ],
+)
+def test_sample_dist_to_memmap_matches_sample_dist(tmp_path, spec):
+    output = sample_dist_to_memmap(
+        spec, np.random.default_rng(3), 1003, tmp_path / "out.npy", chunk_size=100
+    )
+
+    expected = spec.sample_dist(np.random.default_rng(3), 1003)
+    assert output.dtype == expected.dtype
+    assert np.array_equal(output, expected)
+    assert np.array_equal(np.load(tmp_path / "out.npy"), expected)
+
+
+@pytest.mark.parametrize("candidate_sampler", [None, shifted, nudged])
+def test_memmap_and_in_memory_runs_give_identical_reports(tmp_path, candidate_sampler):
+    spec = UniformSpec(start=0.0, end=1.0)
+
+    memmap_report = run_memmap_equivalence_cases(
+        spec, candidate_sampler, cases=CASES, directory=tmp_path, chunk_size=64
+    )
+    if candidate_sampler is None:
+        in_memory_report = run_render_equivalence_cases(spec, cases=CASES)
+    else:
+        in_memory_report = run_equivalence_cases(spec, candidate_sampler, cases=CASES)
+
+    assert memmap_report == in_memory_report
+    assert memmap_report.passed is (candidate_sampler is None)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("index", [0, 3, 4, 7, 8, 9])
+def test_outputs_equal_finds_mismatches_at_block_boundaries(index):
+    left = np.arange(10, dtype=np.float64)
+    right = left.copy()
+    right[index] = -1.0
+
+    assert outputs_equal(left, left.copy(), block_size=4)
+    assert not outputs_equal(left, right, block_size=4)
+
+
+def test_outputs_equal_compares_shapes_first():
+    assert not outputs_equal(np.zeros(4), np.zeros(5), block_size=2)
+    assert outputs_equal(np.zeros((2, 2)), np.zeros((2, 2)), block_size=1)
+
+
+def test_blocked_validation_reports_failures_after_the_first_failing_block():
+    spec = UniformSpec(start=-1.0, end=1.0)
+    output = np.array([-2.0, 0.0, 0.5, np.nan, 0.25, 3.0])
+
+    report = spec.validate_output(output, count=6, block_size=2)
+
+    assert [result.name for result in report.failed_results()] == ["finite_values", "in_range"]
+    detailed = spec.validate_output_detailed(output, count=6)
+    assert [(result.name, result.message) for result in report.results] == [
+        (result.name, result.message) for result in detailed.results
+    ]
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    BernoulliSpec,
+    BernoulliSpecBatch,
+    NormalSpec,
+    NormalSpecBatch,
+    UniformSpec,
+    UniformSpecBatch,
+)
+
+
+@pytest.mark.parametrize(
+    ("spec", "output"),
+    [
+        (BernoulliSpec(p=0.3), np.array([0.0, 1.0, 1.0])),
+        (BernoulliSpec(p=0.3), np.array([0, 1, 1], dtype=np.int32)),
+        (BernoulliSpec(p=0.3), np.array([False, True, True])),
+        (UniformSpec(start=0.0, end=1.0), np.array([0.1, 0.5, 0.9], dtype=np.float32)),
+        (NormalSpec(mean=0.0, stddev=1.0), np.array([-1, 0, 2], dtype=np.int32)),
+    ],
+)
+def test_default_specs_accept_any_numeric_dtype(spec, output):
+    assert spec.validate_output(output, count=3).passed
+
+
+@pytest.mark.parametrize(
+    ("spec", "output"),
+    [
+        (BernoulliSpec(p=0.3, output_dtype="bool"), np.array([0, 1, 1])),
+        (BernoulliSpec(p=0.3, output_dtype="uint8"), np.array([False, True, True])),
+        (UniformSpec(start=0.0, end=1.0, output_dtype="float32"), np.array([0.1, 0.5, 0.9])),
+    ],
+)
+def test_declared_non_default_dtype_is_enforced(spec, output):
+    report = spec.validate_output_detailed(output, count=3)
+
+    assert not report.passed
+    assert [result.name for result in report.failed_results()] == ["numeric_dtype"]
+
+
+@pytest.mark.parametrize(
+    ("batch_cls", "spec"),
+    [
+        (BernoulliSpecBatch, BernoulliSpec(p=0.3, output_dtype="bool")),
+        (UniformSpecBatch, UniformSpec(start=0.0, end=1.0, output_dtype="float32")),
+        (NormalSpecBatch, NormalSpec(mean=0.0, stddev=1.0, equivalence_cases=())),
+    ],
+)
+def test_batches_reject_specs_with_non_default_fields(batch_cls, spec):
+    with pytest.raises(ValueError, match="non-default fields"):
+        batch_cls.from_specs([spec])
+
+
+def test_batch_rows_round_trip_default_specs():
+    specs = (BernoulliSpec(p=0.3), BernoulliSpec(p=0.9))
+
+    assert BernoulliSpecBatch.from_specs(specs).to_specs() == specs
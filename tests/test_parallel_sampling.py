@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import BernoulliSpec, NormalSpec, UniformSpec
+from distfxn.specs.render_cache import compile_sample_dist
+
+SPECS = [
+    NormalSpec(mean=1.5, stddev=2.0),
+    NormalSpec(mean=1.5, stddev=2.0, output_dtype="float32"),
+    UniformSpec(start=-1.0, end=3.0),
+    UniformSpec(start=-1.0, end=3.0, output_dtype="float32"),
+    BernoulliSpec(p=0.3),
+    BernoulliSpec(p=0.3, output_dtype="bool"),
+]
+
+
+@pytest.mark.parametrize("spec", SPECS, ids=repr)
+@pytest.mark.parametrize("workers", [1, 3])
+@pytest.mark.parametrize("count", [0, 2, 1001])
+def test_rendered_parallel_sampler_matches_sample_dist_parallel(spec, workers, count):
+    _, rendered = compile_sample_dist(spec.render_parallel(workers))
+
+    expected = spec.sample_dist_parallel(np.random.default_rng(7), count, workers=workers)
+    actual = rendered(np.random.default_rng(7), count)
+
+    assert actual.dtype == expected.dtype == np.dtype(spec.output_dtype)
+    assert actual.shape == (count,)
+    assert actual.tobytes() == expected.tobytes()
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    BernoulliSamplingSpec,
+    BernoulliSpec,
+    LogUniformPositiveFloatParamSampler,
+    NormalSamplingSpec,
+    NormalSpec,
+    UniformFloatParamSampler,
+    UniformSamplingSpec,
+    UniformSpec,
+)
+
+SAMPLERS = [
+    UniformFloatParamSampler(name="mean", min_value=-100.0, max_value=100.0),
+    LogUniformPositiveFloatParamSampler(name="stddev", min_value=1e-6, max_value=100.0),
+]
+
+
+def per_value_column(sampler, rng, n):
+    return np.array([sampler.sample(rng) for _ in range(n)])
+
+
+@pytest.mark.parametrize("sampler", SAMPLERS, ids=type)
+@pytest.mark.parametrize("n", [1, 2, 257])
+def test_sample_many_matches_repeated_sample(sampler, n):
+    rng = np.random.default_rng(5)
+    per_value_rng = np.random.default_rng(5)
+
+    values = sampler.sample_many(rng, n)
+
+    np.testing.assert_allclose(values, per_value_column(sampler, per_value_rng, n), rtol=1e-15)
+    # Both paths leave the generator in the same state.
+    assert rng.bit_generator.state == per_value_rng.bit_generator.state
+
+
+@pytest.mark.parametrize("sampler", SAMPLERS, ids=type)
+def test_sample_many_rejects_non_positive_n(sampler):
+    with pytest.raises(ValueError, match="n must be greater than 0"):
+        sampler.sample_many(np.random.default_rng(0), 0)
+
+
+@pytest.mark.parametrize(
+    ("spec_cls", "sampling_spec", "build"),
+    [
+        (
+            NormalSpec,
+            NormalSamplingSpec(),
+            lambda s, rng, n: [
+                NormalSpec(mean=mean, stddev=stddev)
+                for mean, stddev in zip(
+                    per_value_column(s.mean_sampler, rng, n),
+                    per_value_column(s.stddev_sampler, rng, n),
+                )
+            ],
+        ),
+        (
+            UniformSpec,
+            UniformSamplingSpec(),
+            lambda s, rng, n: [
+                UniformSpec(start=start, end=start + width)
+                for start, width in zip(
+                    per_value_column(s.start_sampler, rng, n),
+                    per_value_column(s.width_sampler, rng, n),
+                )
+            ],
+        ),
+        (
+            BernoulliSpec,
+            BernoulliSamplingSpec(),
+            lambda s, rng, n: [BernoulliSpec(p=p) for p in per_value_column(s.p_sampler, rng, n)],
+        ),
+    ],
+    ids=["normal", "uniform", "bernoulli"],
+)
+def test_sample_specs_draws_each_parameter_column_in_turn(spec_cls, sampling_spec, build):
+    specs = spec_cls.sample_specs(np.random.default_rng(3), count=50, sampling_spec=sampling_spec)
+    expected = build(sampling_spec, np.random.default_rng(3), 50)
+
+    assert len(specs) == 50
+    for spec, expected_spec in zip(specs, expected, strict=True):
+        for name in spec_cls.model_fields:
+            actual, wanted = getattr(spec, name), getattr(expected_spec, name)
+            if isinstance(actual, float):
+                assert actual == pytest.approx(wanted, rel=1e-15, abs=0.0)
+            else:
+                assert actual == wanted
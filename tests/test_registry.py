@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from distfxn.specs import FAMILY_REGISTRY, BernoulliSpec, NormalSpec, UniformSpec
+
+SPECS = (
+    NormalSpec(mean=1.0, stddev=2.0),
+    UniformSpec(start=0.0, end=3.0),
+    BernoulliSpec(p=0.25),
+)
+LINES = [spec.model_dump_json() for spec in SPECS]
+
+
+def test_parse_json_lines_skips_blank_lines():
+    data = "\n" + LINES[0] + "\n\n  \n" + "\r\n".join(LINES[1:]) + "\n"
+
+    assert FAMILY_REGISTRY.parse_json_lines(data) == SPECS
+    assert FAMILY_REGISTRY.parse_json_lines(data.encode()) == SPECS
+    assert FAMILY_REGISTRY.parse_json_lines("\n\n") == ()
+
+
+@pytest.mark.parametrize(
+    ("bad_line", "message"),
+    [
+        (json.dumps({"family": "normal", "mean": 0.0, "stddev": -1.0}), "greater than 0"),
+        (json.dumps({"family": "gamma", "shape": 1.0}), "does not match any of the expected"),
+        ('{"family": "normal", "mean": 0.0,', "Invalid JSON"),
+    ],
+)
+def test_parse_json_lines_errors_name_the_line(bad_line, message):
+    data = "\n".join([LINES[0], "", LINES[1], bad_line, LINES[2], bad_line])
+
+    with pytest.raises(ValueError, match=message) as exc_info:
+        FAMILY_REGISTRY.parse_json_lines(data)
+
+    assert str(exc_info.value).startswith("line 4: ")
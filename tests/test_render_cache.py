@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import NormalSpec, RenderCache, UniformSpec
+
+SOURCES = [NormalSpec(mean=float(i), stddev=1.0).render() for i in range(4)]
+
+
+def stats_tuple(cache):
+    stats = cache.stats()
+    return stats.hits, stats.misses, stats.evictions, stats.size
+
+
+def test_hits_return_the_cached_callable_and_are_counted():
+    cache = RenderCache(max_size=4)
+
+    first = cache.get_callable(SOURCES[0])
+    second = cache.get_callable(SOURCES[0])
+    cache.get_callable(SOURCES[1])
+
+    assert first is second
+    assert stats_tuple(cache) == (1, 2, 0, 2)
+    assert np.array_equal(
+        first(np.random.default_rng(0), 8),
+        NormalSpec(mean=0.0, stddev=1.0).sample_dist(np.random.default_rng(0), 8),
+    )
+
+
+def test_equal_renders_share_one_entry():
+    cache = RenderCache()
+    spec = UniformSpec(start=0.0, end=1.0)
+
+    assert cache.get_callable(spec.render()) is cache.get_callable(spec.model_copy().render())
+    assert stats_tuple(cache) == (1, 1, 0, 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = RenderCache(max_size=2)
+    callables = [cache.get_callable(source) for source in SOURCES[:2]]
+
+    # Touch source 0 so that source 1 is the least recently used.
+    assert cache.get_callable(SOURCES[0]) is callables[0]
+    cache.get_callable(SOURCES[2])
+
+    assert stats_tuple(cache) == (1, 3, 1, 2)
+    assert cache.get_callable(SOURCES[0]) is callables[0]
+    assert cache.get_callable(SOURCES[1]) is not callables[1]
+    assert stats_tuple(cache) == (2, 4, 2, 2)
+
+
+def test_shrinking_max_size_evicts_oldest_entries():
+    cache = RenderCache(max_size=4)
+    for source in SOURCES:
+        cache.get_callable(source)
+
+    cache.max_size = 1
+
+    assert len(cache) == 1
+    assert stats_tuple(cache) == (0, 4, 3, 1)
+    cache.get_callable(SOURCES[3])
+    assert stats_tuple(cache) == (1, 4, 3, 1)
+
+
+def test_zero_max_size_disables_caching():
+    cache = RenderCache(max_size=0)
+
+    assert cache.get_callable(SOURCES[0]) is not cache.get_callable(SOURCES[0])
+    assert stats_tuple(cache) == (0, 2, 0, 0)
+
+
+def test_clear_resets_entries_and_counters():
+    cache = RenderCache(max_size=1)
+    for source in SOURCES[:2]:
+        cache.get_callable(source)
+
+    cache.clear()
+
+    assert stats_tuple(cache) == (0, 0, 0, 0)
+    assert cache.stats().max_size == 1
+    with pytest.raises(ValueError, match="max_size"):
+        cache.max_size = -1
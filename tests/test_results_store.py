@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    EquivalenceCase,
+    NormalSpec,
+    UniformSpec,
+    VerificationResultStore,
+    iter_verify,
+    render_candidate_id,
+)
+
+CASES = (EquivalenceCase(name="small", seed=1, count=8),)
+
+
+class CountingSampler:
+    def __init__(self, offset: float = 0.0):
+        self.offset = offset
+        self.calls = 0
+
+    def __call__(self, spec, rng, count):
+        self.calls += 1
+        return spec.sample_dist(rng, count) + self.offset
+
+
+def test_stored_pass_is_not_reverified():
+    spec = NormalSpec(mean=0.0, stddev=1.0)
+    sampler = CountingSampler()
+    store = VerificationResultStore()
+
+    first = store.verify(spec, sampler, candidate_id="v1")
+    second = store.verify(spec, sampler, candidate_id="v1")
+
+    assert first.passed and second == first
+    assert sampler.calls == len(spec.all_equivalence_cases())
+    assert len(store) == 1
+
+
+def test_failing_reports_are_not_persisted():
+    spec = UniformSpec(start=0.0, end=1.0)
+    sampler = CountingSampler(offset=5.0)
+    store = VerificationResultStore()
+
+    assert not store.verify(spec, sampler, candidate_id="broken", cases=CASES).passed
+    assert not store.verify(spec, sampler, candidate_id="broken", cases=CASES).passed
+
+    assert sampler.calls == 2
+    assert len(store) == 0
+    assert store.get(spec, cases=CASES, candidate_id="broken") is None
+
+
+def test_changing_any_key_part_invalidates_the_stored_report(monkeypatch):
+    spec = NormalSpec(mean=0.0, stddev=1.0)
+    store = VerificationResultStore()
+    store.verify(spec, CountingSampler(), candidate_id="v1", cases=CASES)
+
+    assert store.get(spec, cases=CASES, candidate_id="v1") is not None
+    assert store.get(NormalSpec(mean=0.0, stddev=2.0), cases=CASES, candidate_id="v1") is None
+    assert store.get(spec, candidate_id="v1") is None
+    assert store.get(spec, cases=CASES, candidate_id="v2") is None
+    assert store.get(spec, cases=CASES) is None
+
+    monkeypatch.setattr(np, "__version__", "0.0.0")
+    assert store.get(spec, cases=CASES, candidate_id="v1") is None
+    assert store.prune() == 1
+    assert len(store) == 0
+
+
+def test_render_candidate_id_follows_the_rendered_source():
+    spec = NormalSpec(mean=0.0, stddev=1.0)
+
+    assert render_candidate_id(spec) == render_candidate_id(NormalSpec(mean=0.0, stddev=1.0))
+    assert render_candidate_id(spec) != render_candidate_id(NormalSpec(mean=1.0, stddev=1.0))
+
+
+def test_candidate_sampler_requires_a_candidate_id():
+    with pytest.raises(ValueError, match="candidate_id"):
+        VerificationResultStore().verify(NormalSpec(mean=0.0, stddev=1.0), CountingSampler())
+
+
+def test_reports_persist_across_connections(tmp_path):
+    spec = NormalSpec(mean=0.0, stddev=1.0)
+    path = tmp_path / "results.sqlite"
+    with VerificationResultStore(path) as store:
+        report = store.verify(spec, cases=CASES)
+
+    with VerificationResultStore(path) as store:
+        assert store.get(spec, cases=CASES) == report
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_verify_skips_stored_specs(workers):
+    specs = [NormalSpec(mean=float(i), stddev=1.0) for i in range(6)]
+    store = VerificationResultStore()
+    for spec in specs[::2]:
+        store.verify(spec, cases=CASES)
+    stored = [store.get(spec, cases=CASES) for spec in specs[::2]]
+
+    reports = list(
+        iter_verify(specs, cases=CASES, results_store=store, workers=workers, chunksize=1)
+    )
+
+    assert all(report.passed for report in reports)
+    # Stored reports come back as-is; the rest were verified and recorded.
+    assert reports[::2] == stored
+    assert len(store) == len(specs)
+
+
+def test_store_can_be_shared_across_threads():
+    specs = [UniformSpec(start=0.0, end=float(i + 1)) for i in range(16)]
+    store = VerificationResultStore()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        reports = list(executor.map(lambda spec: store.verify(spec, cases=CASES), specs))
+        again = list(executor.map(lambda spec: store.get(spec, cases=CASES), specs))
+
+    assert all(report.passed for report in reports)
+    assert again == reports
+    assert len(store) == len(specs)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    BernoulliSpec,
+    NormalSpec,
+    UniformSpec,
+    VerificationTable,
+    run_statistical_equivalence_cases,
+)
+
+
+def threshold_bernoulli(spec, rng, count):
+    return rng.random(count) < spec.p
+
+
+def float32_uniform(spec, rng, count):
+    values = rng.random(count, dtype=np.float32)
+    return spec.start + values * np.float32(spec.end - spec.start)
+
+
+def parallel_normal(spec, rng, count):
+    return spec.sample_dist_parallel(rng, count, workers=3)
+
+
+@pytest.mark.parametrize(
+    ("spec", "candidate_sampler"),
+    [
+        (BernoulliSpec(p=0.3), threshold_bernoulli),
+        (BernoulliSpec(p=0.3, output_dtype="uint8"), threshold_bernoulli),
+        (UniformSpec(start=0.0, end=1.0), float32_uniform),
+        (UniformSpec(start=0.0, end=1.0, output_dtype="float32"), None),
+        (NormalSpec(mean=1.0, stddev=2.0), parallel_normal),
+    ],
+)
+def test_distributionally_equivalent_candidates_pass(spec, candidate_sampler):
+    report = run_statistical_equivalence_cases(spec, candidate_sampler)
+
+    assert report.passed, report.to_markdown()
+    for case_report in report.case_reports:
+        assert case_report.exact_output_match is None
+        assert case_report.statistical_test.sample_size == 10_000
+
+
+def test_shifted_candidate_fails_with_statistical_reason():
+    def shifted(spec, rng, count):
+        return spec.sample_dist(rng, count) + 0.2
+
+    report = run_statistical_equivalence_cases(NormalSpec(mean=0.0, stddev=1.0), shifted)
+
+    assert not report.passed
+    reasons = report.case_reports[0].failure_reasons
+    assert len(reasons) == 1 and reasons[0].startswith("ks: p_value=")
+
+
+def test_failed_output_check_is_not_reported_as_exact_mismatch():
+    def out_of_range(spec, rng, count):
+        return spec.sample_dist(rng, count) + 1.0
+
+    report = run_statistical_equivalence_cases(
+        UniformSpec(start=0.0, end=1.0), out_of_range, sample_size=100
+    )
+    case_report = report.case_reports[0]
+    lines = case_report.to_lines()
+
+    assert not case_report.passed
+    assert case_report.statistical_test.p_value is None
+    assert [reason.split(":")[0] for reason in case_report.failure_reasons] == [
+        "candidate.in_range"
+    ]
+    assert lines[0].endswith("sample_size=100")
+    assert not any("exact_output_match" in line for line in lines)
+
+
+def test_statistical_reports_round_trip_through_verification_table():
+    def out_of_range(spec, rng, count):
+        return spec.sample_dist(rng, count) + 1.0
+
+    spec = UniformSpec(start=0.0, end=1.0)
+    reports = (
+        run_statistical_equivalence_cases(spec, sample_size=500),
+        run_statistical_equivalence_cases(spec, out_of_range, sample_size=500),
+    )
+    table = VerificationTable.from_reports(reports)
+
+    assert tuple(report for _, report in table.to_reports()) == reports
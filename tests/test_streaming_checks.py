@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import (
+    BernoulliSpec,
+    HistogramAccumulator,
+    HistogramCheck,
+    MomentAccumulator,
+    MomentCheck,
+    NormalSpec,
+    UniformSpec,
+)
+
+COUNT = 20_000
+SPECS = [
+    NormalSpec(mean=2.0, stddev=3.0),
+    UniformSpec(start=-1.0, end=5.0),
+    BernoulliSpec(p=0.3),
+]
+CHECKS = [MomentCheck(), HistogramCheck()]
+
+
+def shifted(spec, values):
+    if isinstance(spec, BernoulliSpec):
+        return 1 - values
+    return values + 0.25 * np.sqrt(spec.analytic_moments().variance)
+
+
+def rescaled(spec, values):
+    if isinstance(spec, BernoulliSpec):
+        return values * 2
+    mean = spec.analytic_moments().mean
+    return mean + (values - mean) * 1.2
+
+
+@pytest.mark.parametrize("split", [[0, 1, 17, 5000, COUNT], [0, COUNT // 2, COUNT], [0, COUNT]])
+def test_moment_merge_of_chunks_matches_a_single_update(split):
+    values = np.random.default_rng(0).normal(1e6, 2.0, COUNT)
+    whole = MomentAccumulator().update(values)
+
+    merged = MomentAccumulator()
+    for start, stop in zip(split[:-1], split[1:]):
+        merged.merge(MomentAccumulator().update(values[start:stop]))
+
+    assert merged.count == whole.count == COUNT
+    assert merged.mean == pytest.approx(whole.mean, rel=1e-15)
+    assert merged.variance == pytest.approx(whole.variance, rel=1e-10)
+    assert merged.variance == pytest.approx(np.var(values), rel=1e-10)
+    assert merged.dtype == values.dtype
+
+
+def test_moment_merge_with_empty_accumulators_is_a_no_op():
+    accumulator = MomentAccumulator().update([1.0, 2.0, 4.0])
+
+    accumulator.merge(MomentAccumulator())
+    empty = MomentAccumulator().merge(accumulator)
+
+    assert (empty.count, empty.mean, empty.variance) == (3, accumulator.mean, accumulator.variance)
+    with pytest.raises(ValueError, match="at least one value"):
+        MomentAccumulator().variance
+
+
+def test_histogram_merge_sums_counts():
+    values = np.random.default_rng(1).uniform(-2.0, 2.0, 1000)
+    merged = HistogramAccumulator([-1.0, 0.0, 1.0]).update(values[:300])
+    merged.merge(HistogramAccumulator([-1.0, 0.0, 1.0]).update(values[300:]))
+
+    whole = HistogramAccumulator([-1.0, 0.0, 1.0]).update(values)
+
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    assert merged.count == 1000
+
+
+def test_histogram_merge_rejects_mismatched_edges():
+    accumulator = HistogramAccumulator([0.0, 1.0]).update([0.5])
+
+    with pytest.raises(ValueError, match="different bin edges"):
+        accumulator.merge(HistogramAccumulator([0.0, 2.0]))
+    with pytest.raises(ValueError, match="different bin edges"):
+        accumulator.merge(HistogramAccumulator([0.0, 1.0, 2.0]))
+    np.testing.assert_array_equal(accumulator.counts, [0, 1, 0])
+
+
+@pytest.mark.parametrize("check", CHECKS, ids=lambda check: check.kind)
+@pytest.mark.parametrize("spec", SPECS, ids=lambda spec: spec.family)
+def test_checks_pass_on_the_specs_own_samples(check, spec):
+    values = spec.sample_dist(np.random.default_rng(2), COUNT)
+
+    result = check.run(values, spec=spec, count=COUNT)
+
+    assert result.passed, result.message
+
+
+@pytest.mark.parametrize("transform", [shifted, rescaled])
+@pytest.mark.parametrize("check", CHECKS, ids=lambda check: check.kind)
+@pytest.mark.parametrize("spec", SPECS, ids=lambda spec: spec.family)
+def test_checks_fail_on_shifted_or_rescaled_samples(check, spec, transform):
+    if isinstance(check, HistogramCheck) and isinstance(spec, BernoulliSpec):
+        if transform is rescaled:
+            pytest.skip("a Bernoulli histogram only splits values at 0.5; moments catch 0/2")
+    values = transform(spec, spec.sample_dist(np.random.default_rng(3), COUNT))
+
+    result = check.run(values, spec=spec, count=COUNT)
+
+    assert not result.passed
+    assert result.message
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from distfxn.specs import BernoulliSpec, NormalSpec, UniformSpec
+
+NORMAL = NormalSpec(mean=0.0, stddev=1.0)
+UNIFORM = UniformSpec(start=-1.0, end=1.0)
+BERNOULLI = BernoulliSpec(p=0.5)
+BERNOULLI_BOOL = BernoulliSpec(p=0.5, output_dtype="bool")
+
+OUTPUTS = [
+    (NORMAL, np.array([0.0, 1.0, -2.0, 0.5]), []),
+    (NORMAL, np.array([0.0, np.nan, 1.0, 2.0]), ["finite_values"]),
+    (NORMAL, np.array([0.0, np.inf, -np.inf, 2.0]), ["finite_values"]),
+    (NORMAL, np.array([0.0, 1.0, 2.0]), ["length"]),
+    (NORMAL, np.zeros((2, 2)), ["one_dimensional", "length"]),
+    (NORMAL, np.array(["a", "b", "c", "d"]), ["numeric_dtype", "finite_values"]),
+    (NORMAL, np.array([0.0, None, 1.0, 2.0], dtype=object), ["numeric_dtype", "finite_values"]),
+    (NORMAL, np.array(1.0), ["one_dimensional", "length"]),
+    (UNIFORM, np.array([-1.0, 0.0, 0.5, 0.999]), []),
+    (UNIFORM, np.array([-1.0, 0.0, 0.5, 1.0]), ["in_range"]),
+    (UNIFORM, np.array([-2.0, 0.0, np.nan, 3.0]), ["finite_values", "in_range"]),
+    (UNIFORM, np.array([-1.0, 0.0, 0.5, 0.9], dtype=np.float32), []),
+    (BERNOULLI, np.array([0, 1, 1, 0]), []),
+    (BERNOULLI, np.array([0, 1, 2, 0]), ["in_set"]),
+    (BERNOULLI, np.array([0.0, 0.5, 1.0, 1.0]), ["in_set"]),
+    (BERNOULLI, np.array([0, 1, 1, -1, 0]), ["length", "in_set"]),
+    (BERNOULLI_BOOL, np.array([0, 1, 1, 0]), ["numeric_dtype"]),
+    (BERNOULLI_BOOL, np.array([False, True, True, False]), []),
+]
+
+
+def result_tuples(report):
+    return [(result.name, result.passed, result.message) for result in report.results]
+
+
+@pytest.mark.parametrize(("spec", "output", "failed"), OUTPUTS)
+def test_fused_validation_matches_detailed_validation(spec, output, failed):
+    detailed = spec.validate_output_detailed(output, count=4)
+    assert [result.name for result in detailed.failed_results()] == failed
+
+    for report in (
+        spec.validate_output(output, count=4),
+        spec.validate_output(output, count=4, block_size=1),
+        spec.validate_output(output, count=4, block_size=3),
+    ):
+        assert report.passed == detailed.passed
+        assert result_tuples(report) == result_tuples(detailed)
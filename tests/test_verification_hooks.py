@@ -0,0 +1,48 @@
+import pytest
+
+from distfxn.specs import NormalSpec, VerificationHooks, run_render_equivalence_cases
+
+
+class HookError(Exception):
+    pass
+
+
+class FailingCheckHooks(VerificationHooks):
+    def on_check(self, check, result, **kwargs):
+        raise HookError(check.name)
+
+
+class FailingPhaseHooks(VerificationHooks):
+    def on_phase_end(self, phase, **kwargs):
+        if phase == "candidate_sampling":
+            raise HookError(phase)
+
+
+class RecordingHooks(VerificationHooks):
+    def __init__(self):
+        self.checks = []
+
+    def on_check(self, check, result, *, side, **kwargs):
+        self.checks.append((side, check.name, result.passed))
+
+
+@pytest.mark.parametrize("hooks", [FailingCheckHooks(), FailingPhaseHooks()])
+def test_hook_errors_are_not_reported_as_sampler_failures(hooks):
+    with pytest.raises(HookError):
+        run_render_equivalence_cases(NormalSpec(mean=0.0, stddev=1.0), hooks=hooks)
+
+
+def test_on_check_sees_both_sides_of_every_case():
+    spec = NormalSpec(mean=0.0, stddev=1.0)
+    hooks = RecordingHooks()
+
+    report = run_render_equivalence_cases(spec, hooks=hooks)
+
+    assert report.passed
+    expected = [
+        (side, check.name, True)
+        for _ in spec.all_equivalence_cases()
+        for side in ("canonical", "candidate")
+        for check in spec.output_checks
+    ]
+    assert hooks.checks == expected
@@ -0,0 +1,54 @@
+import numpy as np
+
+from distfxn.specs import (
+    NormalSpec,
+    UniformSpec,
+    VerificationTable,
+    run_equivalence_cases,
+    run_render_equivalence_cases,
+)
+
+
+def out_of_range(spec, rng, count):
+    return spec.sample_dist(rng, count) + 10.0
+
+
+def test_reports_round_trip_with_failure_messages():
+    specs = [UniformSpec(start=0.0, end=float(i + 1)) for i in range(4)]
+    reports = tuple(
+        run_equivalence_cases(spec, out_of_range) if i % 2 else run_render_equivalence_cases(spec)
+        for i, spec in enumerate(specs)
+    )
+    table = VerificationTable.from_reports(reports)
+
+    assert table.messages.shape[0] > 0
+    assert tuple(report for _, report in table.to_reports()) == reports
+    assert table.to_report(1) == reports[1]
+
+
+def test_interleaved_spec_ids_keep_their_own_messages():
+    failing = run_equivalence_cases(UniformSpec(start=0.0, end=1.0), out_of_range)
+    passing = run_render_equivalence_cases(NormalSpec(mean=0.0, stddev=1.0))
+    table = VerificationTable()
+    table.append(failing, spec_id=0)
+    table.append(passing, spec_id=1)
+    table.append(failing, spec_id=0)
+
+    spec_ids, passed = table.spec_passed()
+
+    assert table.to_report(1) == passing
+    assert np.array_equal(spec_ids, [0, 1]) and np.array_equal(passed, [False, True])
+    assert table.to_report(0).case_reports == failing.case_reports * 2
+
+
+def test_timing_and_peak_allocations_round_trip():
+    report = run_render_equivalence_cases(
+        NormalSpec(mean=0.0, stddev=1.0), timing=True, trace_allocations=True
+    )
+    table = VerificationTable.from_reports([report])
+
+    rebuilt = table.to_report(0)
+
+    assert rebuilt == report
+    assert all(case_report.timing is not None for case_report in rebuilt.case_reports)
+    assert all(case_report.peak_allocated_bytes for case_report in rebuilt.case_reports)